@@ -6,17 +6,37 @@ from flask import Flask
 from flask_cors import CORS
 
 from .config import Config
-from .db import db
+from .db import db, engine_options, init_pool, init_slow_query_log
+from .replicas import READ_PRIMARY_HEADER, init_replicas
 
 
 def create_app(config_class=Config):
     """Create and configure the Flask application."""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
 
     # Initialize extensions
     db.init_app(app)
-    CORS(app, resources={r"/api/*": {"origins": "*"}})
+    CORS(app, resources={r"/api/*": {"origins": "*"}}, expose_headers=[READ_PRIMARY_HEADER])
+
+    # Route reads of GET requests to DATABASE_REPLICA_URLS, pin writers to the primary
+    init_replicas(app, lambda url: engine_options(app.config, url))
+
+    # Liveness check for connections idle longer than DB_POOL_PING_IDLE_SECONDS
+    init_pool(app)
+
+    # Record statements above SLOW_QUERY_THRESHOLD_MS
+    init_slow_query_log(app)
+
+    # Configure per-worker caches
+    from .services.activity_service import activity_stats_cache
+    activity_stats_cache.ttl = app.config["ACTIVITY_STATS_CACHE_TTL"]
+    activity_stats_cache.clear()
+
+    # LISTEN connection of the live Gantt updates (REALTIME_LISTEN_URL)
+    from .services.realtime_service import realtime_service
+    realtime_service.init_app(app)
 
     # Register blueprints
     from .auth.routes import auth_bp
@@ -26,6 +46,11 @@ def create_app(config_class=Config):
     from .routes.gantt import gantt_bp
     from .routes.notifications import notifications_bp
     from .routes.users import users_bp
+    from .routes.realtime import realtime_bp, sock
+    from .routes.admin import admin_bp
+    from .routes.search import search_bp
+    from .routes.calendars import calendars_bp
+    from .routes.exports import exports_bp
 
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(activities_bp, url_prefix="/api/activities")
@@ -34,6 +59,24 @@ def create_app(config_class=Config):
     app.register_blueprint(gantt_bp, url_prefix="/api")
     app.register_blueprint(notifications_bp, url_prefix="/api")
     app.register_blueprint(users_bp, url_prefix="/api")
+    app.register_blueprint(realtime_bp, url_prefix="/api")
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")
+    app.register_blueprint(search_bp, url_prefix="/api")
+    app.register_blueprint(calendars_bp, url_prefix="/api")
+    app.register_blueprint(exports_bp, url_prefix="/api")
+    sock.init_app(app)
+
+    # Request, SQL and pool metrics at /api/metrics
+    from .metrics import init_metrics
+    init_metrics(app)
+
+    # Admin X-Profile requests and PROFILE_SAMPLE_RATE random profiles
+    from .profiling import init_profiling
+    init_profiling(app)
+
+    # Sampled per-request trace spans
+    from .tracing import init_tracing
+    init_tracing(app)
 
     # Health check endpoint
     @app.route("/api/health")
@@ -0,0 +1,303 @@
+# /backend/app/asgi.py
+"""
+Asyncio read path.
+
+The read-heavy endpoints
+    GET /api/activities/:id/gantt      (full chart; ?since= deltas excluded)
+    GET /api/notifications
+    GET /api/notifications/unread-count
+are served by async handlers on SQLAlchemy's asyncio extension (asyncpg,
+aiosqlite for SQLite). A worker waiting on the database keeps serving other
+requests instead of blocking a thread. Every other route, including all
+writes and delta syncs, falls through to the Flask app through asgiref's
+WsgiToAsgi, so one ASGI server runs both (see /backend/asgi.py).
+
+Queries and response bodies come from the same statement builders as the
+Flask routes, so both paths return identical JSON.
+
+The live-update WebSocket WS /api/ws/activities/:id is served here too, as
+one coroutine per socket instead of the flask-sock route's thread, so a
+worker holds thousands of idle subscribers (the "realtime" service in
+infra/docker-compose.yml runs only this part).
+"""
+import asyncio
+import json
+import random
+import re
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+from starlette.requests import HTTPConnection, Request
+from starlette.responses import Response
+from starlette.websockets import WebSocket
+
+from .auth.utils import decode_token
+from .db import enable_idle_ping, engine_options
+from .metrics import REQUEST_COUNT, REQUEST_LATENCY
+from .models import Activity, User
+from .replicas import READ_PRIMARY_HEADER, read_primary_until, sticky_writes
+from .services.gantt_service import (
+    build_timeline,
+    calculate_scale,
+    gantt_bin_rows_statement,
+    gantt_bins,
+    gantt_payload,
+    gantt_subtasks_statement,
+    gantt_topics_statement,
+    parse_gantt_params,
+    use_binned_lod,
+)
+from .services.calendar_service import calendar_cache
+from .routes.realtime import PING_INTERVAL
+from .services.notification_service import NotificationService
+from .services.realtime_service import realtime_service
+from .services.sync_service import cursor_from_rows, cursor_statements
+
+# Sync driver → asyncio driver of the same database
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# Metrics label of the requests handled here (Flask uses blueprint names)
+METRICS_BLUEPRINT = "asgi"
+
+ACTIVITY_UPDATES_ROUTE = re.compile(r"^/api/ws/activities/(\d+)$")
+PING_MESSAGE = '{"type":"ping"}'
+
+
+def async_database_url(url: str) -> str:
+    """Same database URL with the asyncio driver of its backend."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No asyncio driver for {parsed.drivername}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _json(data: dict, status: int = 200) -> Response:
+    # Same encoding as Flask's jsonify outside debug mode
+    return Response(
+        json.dumps(data, sort_keys=True, separators=(",", ":")),
+        status_code=status,
+        media_type="application/json",
+        headers={"Access-Control-Allow-Origin": "*", "Access-Control-Expose-Headers": READ_PRIMARY_HEADER},
+    )
+
+
+class AsyncReadApp:
+    """ASGI app: async handlers for the hot reads, Flask for everything else."""
+
+    def __init__(self, flask_app: Flask):
+        config = flask_app.config
+        self.flask_app = flask_app
+        self.fallback = WsgiToAsgi(flask_app)
+        self.secret_key = config["SECRET_KEY"]
+        self.sticky_seconds = config["REPLICA_STICKY_SECONDS"]
+
+        self.primary = self._create_engine(config, config.get("ASYNC_DATABASE_URL")
+                                           or async_database_url(config["SQLALCHEMY_DATABASE_URI"]))
+        replica_urls = [url.strip() for url in config["DATABASE_REPLICA_URLS"].split(",") if url.strip()]
+        self.replicas = [self._create_engine(config, async_database_url(url)) for url in replica_urls]
+        self.sessionmaker = async_sessionmaker(expire_on_commit=False)
+
+        self.routes: List[tuple] = [
+            (re.compile(r"^/api/activities/(\d+)/gantt$"), "/api/activities/<int:activity_id>/gantt", self.gantt),
+            (re.compile(r"^/api/notifications$"), "/api/notifications", self.notifications),
+            (re.compile(r"^/api/notifications/unread-count$"), "/api/notifications/unread-count",
+             self.unread_count),
+        ]
+
+    @staticmethod
+    def _create_engine(config, url: str) -> AsyncEngine:
+        engine = create_async_engine(url, **engine_options(config, url))
+        if not config["DB_POOL_PRE_PING"]:
+            enable_idle_ping(engine.sync_engine, config["DB_POOL_PING_IDLE_SECONDS"])
+        return engine
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] == "websocket":
+            websocket = WebSocket(scope, receive, send)
+            match = ACTIVITY_UPDATES_ROUTE.match(scope["path"])
+            if match:
+                await self.activity_updates(websocket, int(match.group(1)))
+            else:
+                await websocket.close()
+            return
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            for pattern, rule, handler in self.routes:
+                match = pattern.match(scope["path"])
+                if match:
+                    request = Request(scope, receive)
+                    start = time.perf_counter()
+                    response = await handler(request, *(int(arg) for arg in match.groups()))
+                    if response is not None:
+                        REQUEST_LATENCY.labels(METRICS_BLUEPRINT, rule, scope["method"]).observe(
+                            time.perf_counter() - start
+                        )
+                        REQUEST_COUNT.labels(METRICS_BLUEPRINT, rule, scope["method"],
+                                             str(response.status_code)).inc()
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.fallback(scope, receive, send)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for engine in [self.primary, *self.replicas]:
+                    await engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _session(self, request: HTTPConnection, user_id: Optional[int] = None) -> AsyncSession:
+        """Session on a replica unless the user is pinned to the primary."""
+        engine = self.primary
+        if self.replicas:
+            pinned = read_primary_until(request.headers.get(READ_PRIMARY_HEADER), self.sticky_seconds) > time.time()
+            if not pinned and not (user_id is not None and sticky_writes.is_sticky(user_id)):
+                engine = random.choice(self.replicas)
+        return self.sessionmaker(bind=engine)
+
+    async def _with_user(
+        self, request: Request, handler: Callable[[AsyncSession, User], Awaitable[Response]]
+    ) -> Response:
+        """Authenticate like login_required, then run handler(session, user)."""
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return _json({"error": "Yetkilendirme başlığı gerekli"}, 401)
+
+        payload = decode_token(auth_header.split(" ")[1], self.secret_key)
+        if not payload:
+            return _json({"error": "Geçersiz veya süresi dolmuş token"}, 401)
+
+        async with self._session(request, payload["user_id"]) as session:
+            user = await session.get(User, payload["user_id"])
+            if not user or not user.is_active:
+                return _json({"error": "Kullanıcı bulunamadı veya aktif değil"}, 401)
+            return await handler(session, user)
+
+    async def gantt(self, request: Request, activity_id: int) -> Optional[Response]:
+        """Async twin of routes.gantt.get_gantt_data (full chart only)."""
+        if "since" in request.query_params:
+            # Delta syncs read from the primary through the Flask route
+            return None
+
+        async def handler(session: AsyncSession, user: User) -> Response:
+            activity = await session.get(Activity, activity_id, options=[joinedload(Activity.owner)])
+            if not activity:
+                return _json({"error": "Faaliyet bulunamadı"}, 404)
+
+            try:
+                timeline_scale, locale, lod = parse_gantt_params(request.query_params)
+            except ValueError as e:
+                return _json({"error": str(e)}, 400)
+
+            scale = calculate_scale(activity.start_date, activity.end_date)
+            timeline = build_timeline(activity.start_date, activity.end_date, timeline_scale or scale, locale)
+            binned = use_binned_lod(lod, timeline["scale"])
+
+            # Taken before loading rows so concurrent writes are resent, never skipped
+            cursor = cursor_from_rows([
+                (await session.execute(stmt)).one() for stmt in cursor_statements(activity_id)
+            ])
+
+            topics = (await session.scalars(gantt_topics_statement(activity_id))).all()
+            topic_ids = [t.id for t in topics]
+            subtasks = []
+            bins = None
+            if binned:
+                rows = (await session.execute(gantt_bin_rows_statement(topic_ids))).all() if topic_ids else []
+                bins = gantt_bins(rows, timeline, activity)
+            elif topic_ids:
+                subtasks = (await session.scalars(gantt_subtasks_statement(topic_ids))).all()
+
+            calendar = await session.run_sync(calendar_cache.get, activity.calendar_id)
+            return _json(gantt_payload(activity, topics, subtasks, scale, timeline, bins, cursor, calendar))
+
+        return await self._with_user(request, handler)
+
+    async def notifications(self, request: Request) -> Response:
+        """Async twin of routes.notifications.get_notifications."""
+        async def handler(session: AsyncSession, user: User) -> Response:
+            unread_only = request.query_params.get("unread_only", "false").lower() == "true"
+            try:
+                limit = min(int(request.query_params.get("limit", 50)), 100)
+            except ValueError:
+                return _json({"error": "limit bir sayı olmalı"}, 400)
+
+            notifications = (await session.scalars(
+                NotificationService.notifications_statement(user.id, unread_only, limit)
+            )).all()
+            unread_count = await session.scalar(NotificationService.unread_count_statement(user.id))
+            return _json({
+                "notifications": [n.to_dict(include_relations=True) for n in notifications],
+                "unread_count": unread_count
+            })
+
+        return await self._with_user(request, handler)
+
+    async def unread_count(self, request: Request) -> Response:
+        """Async twin of routes.notifications.get_unread_count."""
+        async def handler(session: AsyncSession, user: User) -> Response:
+            count = await session.scalar(NotificationService.unread_count_statement(user.id))
+            return _json({"unread_count": count})
+
+        return await self._with_user(request, handler)
+
+    async def activity_updates(self, websocket: WebSocket, activity_id: int) -> None:
+        """Async twin of routes.realtime.activity_updates."""
+        await websocket.accept()
+        token = websocket.query_params.get("token", "")
+        payload = decode_token(token, self.secret_key) if token else None
+        if not payload:
+            await websocket.close(1008, "Geçersiz veya süresi dolmuş token")
+            return
+        async with self._session(websocket, payload["user_id"]) as session:
+            user = await session.get(User, payload["user_id"])
+            if not user or not user.is_active:
+                await websocket.close(1008, "Geçersiz veya süresi dolmuş token")
+                return
+            if not await session.get(Activity, activity_id):
+                await websocket.close(1008, "Faaliyet bulunamadı")
+                return
+
+        # subscribe() may start the LISTEN thread, which needs the Flask engine
+        with self.flask_app.app_context():
+            subscriber = realtime_service.subscribe(activity_id, asyncio.get_running_loop())
+        sender = asyncio.create_task(self._send_events(websocket, activity_id, subscriber))
+        try:
+            # Clients only send the close frame
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+            realtime_service.unsubscribe(activity_id, subscriber)
+
+    @staticmethod
+    async def _send_events(websocket: WebSocket, activity_id: int, subscriber) -> None:
+        await websocket.send_text(json.dumps({"type": "subscribed", "activity_id": activity_id}))
+        while True:
+            try:
+                async with asyncio.timeout(PING_INTERVAL):
+                    message = await subscriber.get()
+            except TimeoutError:
+                message = PING_MESSAGE
+            await websocket.send_text(message)
+
+
+def create_asgi_app(flask_app: Flask) -> AsyncReadApp:
+    """Wrap a Flask app created by create_app() with the async read path."""
+    return AsyncReadApp(flask_app)
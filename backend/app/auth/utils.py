@@ -7,21 +7,25 @@ from functools import wraps
 from typing import Callable, Optional
 
 import jwt
-import bcrypt
 from flask import request, jsonify, current_app, g
 
 from ..models import User, UserRole
 from ..db import db
+from ..profiling import requested_profile_mode, start_request_profile
+from ..tracing import span
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
+    # Only login and user management need bcrypt; keep it out of app import
+    import bcrypt
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify a password against its hash."""
+    import bcrypt
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
 
@@ -38,12 +42,12 @@ def generate_token(user: User) -> str:
     return jwt.encode(payload, current_app.config["SECRET_KEY"], algorithm="HS256")
 
 
-def decode_token(token: str) -> Optional[dict]:
-    """Decode and validate a JWT token."""
+def decode_token(token: str, secret_key: Optional[str] = None) -> Optional[dict]:
+    """Decode and validate a JWT token (secret_key defaults to the app's)."""
     try:
         payload = jwt.decode(
             token,
-            current_app.config["SECRET_KEY"],
+            secret_key or current_app.config["SECRET_KEY"],
             algorithms=["HS256"]
         )
         return payload
@@ -53,6 +57,22 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
+def authenticate_token(token: str) -> Optional[User]:
+    """
+    Resolve a raw JWT to an active user.
+
+    Used where an Authorization header is not available (e.g. WebSockets).
+    """
+    payload = decode_token(token) if token else None
+    if not payload:
+        return None
+
+    user = db.session.get(User, payload["user_id"])
+    if not user or not user.is_active:
+        return None
+    return user
+
+
 def get_current_user() -> Optional[User]:
     """Get the current user from the request context."""
     return getattr(g, "current_user", None)
@@ -68,16 +88,24 @@ def login_required(f: Callable) -> Callable:
             return jsonify({"error": "Yetkilendirme başlığı gerekli"}), 401
 
         token = auth_header.split(" ")[1]
-        payload = decode_token(token)
+        with span("auth.decode_token"):
+            payload = decode_token(token)
 
         if not payload:
             return jsonify({"error": "Geçersiz veya süresi dolmuş token"}), 401
 
-        user = db.session.get(User, payload["user_id"])
+        with span("auth.user_lookup"):
+            user = db.session.get(User, payload["user_id"])
         if not user or not user.is_active:
             return jsonify({"error": "Kullanıcı bulunamadı veya aktif değil"}), 401
 
         g.current_user = user
+
+        # Admins can profile any authenticated route with X-Profile
+        profile_mode = requested_profile_mode()
+        if profile_mode and user.role == UserRole.ADMIN:
+            start_request_profile(profile_mode, "admin")
+
         return f(*args, **kwargs)
 
     return decorated_function
@@ -1,14 +1,312 @@
 # /backend/app/db.py
 """
 Database Configuration - Flask-SQLAlchemy with SQLAlchemy 2.x
+
+Builds the engine/pool options from the DB_POOL_* settings and also hosts
+the slow-query log: statements slower than a configurable threshold are
+recorded with their normalized SQL, parameter shape, calling route and an
+EXPLAIN plan captured on a background thread.
 """
+import itertools
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from flask import has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import DeclarativeBase
 
+from .replicas import RoutingSession, replica_engines
+
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
     pass
 
 
-db = SQLAlchemy(model_class=Base)
+# RoutingSession sends reads of safe requests to replicas (app/replicas.py)
+db = SQLAlchemy(model_class=Base, session_options={"class_": RoutingSession})
+
+
+# Pending EXPLAIN jobs; when full new slow queries are logged without a plan
+EXPLAIN_QUEUE_SIZE = 100
+
+_PLACEHOLDER_RE = re.compile(r"%\([^)]+\)s|%s|(?<!:):\w+|\?")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def all_engines() -> list:
+    """Primary engine followed by the read replicas of the current app."""
+    return [db.engine, *replica_engines()]
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape so repeated queries group together.
+
+    Placeholders and literals become ?, IN lists collapse to (...).
+    """
+    sql = _LITERAL_RE.sub("?", _PLACEHOLDER_RE.sub("?", statement))
+    sql = _IN_LIST_RE.sub("(...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def parameter_shape(parameters, executemany: bool = False):
+    """Describe bound parameters by type only, never by value."""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+class SlowQueryLog:
+    """Bounded ring buffer of slow statements with asynchronous EXPLAIN."""
+
+    def __init__(self, size: int = 200):
+        self.threshold_ms = 200.0
+        self.explain = True
+        self.explain_analyze = False
+        self.log_file: Optional[str] = None
+        self._entries = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+
+    def configure(self, engine, config: dict) -> None:
+        """Apply app config and hook the engine's cursor events."""
+        self.threshold_ms = float(config.get("SLOW_QUERY_THRESHOLD_MS", 200))
+        self.explain = bool(config.get("SLOW_QUERY_EXPLAIN", True))
+        self.explain_analyze = bool(config.get("SLOW_QUERY_EXPLAIN_ANALYZE", False))
+        self.log_file = config.get("SLOW_QUERY_LOG_FILE") or None
+        with self._lock:
+            self._entries = deque(self._entries, maxlen=int(config.get("SLOW_QUERY_BUFFER_SIZE", 200)))
+
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    def record(self, statement: str, parameters, executemany: bool, duration_ms: float, engine) -> None:
+        """Add a slow statement and queue its EXPLAIN."""
+        route = None
+        if has_request_context():
+            route = {"endpoint": request.endpoint, "method": request.method, "path": request.path}
+
+        entry = {
+            "id": next(self._ids),
+            "recorded_at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "statement": normalize_sql(statement),
+            "parameters": parameter_shape(parameters, executemany),
+            "route": route,
+            "plan": None,
+            "explain_error": None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+        if self.explain and self._can_explain(statement, executemany, engine):
+            self._ensure_worker()
+            try:
+                self._jobs.put_nowait((entry, engine, statement, parameters))
+                return
+            except queue.Full:
+                entry["explain_error"] = "EXPLAIN kuyruğu dolu"
+        self._write(entry)
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        """Recorded entries, slowest first."""
+        with self._lock:
+            entries = sorted(self._entries, key=lambda e: e["duration_ms"], reverse=True)
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        """Drop all recorded entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def wait_for_plans(self, timeout: float = 5.0) -> None:
+        """Block until queued EXPLAIN jobs are done (tests and benchmarks)."""
+        deadline = time.monotonic() + timeout
+        while self._jobs.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    @staticmethod
+    def _can_explain(statement: str, executemany: bool, engine) -> bool:
+        if executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return False
+        # An in-memory SQLite database is private to its one connection
+        return not (engine.dialect.name == "sqlite" and engine.url.database in (None, "", ":memory:"))
+
+    def _explain_prefix(self, engine) -> str:
+        if engine.dialect.name == "postgresql":
+            return "EXPLAIN (ANALYZE, BUFFERS) " if self.explain_analyze else "EXPLAIN "
+        if engine.dialect.name == "sqlite":
+            return "EXPLAIN QUERY PLAN "
+        return "EXPLAIN "
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="slow-query-explain", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            entry, engine, statement, parameters = self._jobs.get()
+            try:
+                with engine.connect() as conn:
+                    rows = conn.exec_driver_sql(self._explain_prefix(engine) + statement, parameters).all()
+                    # EXPLAIN ANALYZE executes the statement; never keep its effects
+                    conn.rollback()
+                entry["plan"] = "\n".join(" | ".join(str(col) for col in row) for row in rows)
+            except Exception as exc:
+                entry["explain_error"] = str(exc).splitlines()[0]
+            finally:
+                self._write(entry)
+                self._jobs.task_done()
+
+    def _write(self, entry: dict) -> None:
+        if not self.log_file:
+            return
+        try:
+            with self._lock, open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+        except OSError:
+            logger.exception("Could not write slow query log")
+
+
+# The start time lives on the execution context, not on the pooled
+# connection: after_cursor_execute never runs for a statement that raises
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context.slow_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "slow_query_start", None)
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms >= slow_query_log.threshold_ms and not statement.lstrip().upper().startswith("EXPLAIN"):
+        slow_query_log.record(statement, parameters, executemany, duration_ms, conn.engine)
+
+
+# Singleton instance for convenience
+slow_query_log = SlowQueryLog()
+
+
+def init_slow_query_log(app) -> None:
+    """Hook the slow-query log into the app's engines (primary and replicas)."""
+    with app.app_context():
+        for engine in all_engines():
+            slow_query_log.configure(engine, app.config)
+
+
+def engine_options(config, url: Optional[str] = None) -> dict:
+    """
+    Engine options for the configured database (or url) and pool mode.
+
+    In-memory SQLite keeps Flask-SQLAlchemy's StaticPool. With DB_PGBOUNCER
+    PgBouncer does the pooling: every session opens a fresh server
+    connection through it (NullPool) and drivers that prepare statements
+    server-side have that disabled. Explicit SQLALCHEMY_ENGINE_OPTIONS win.
+    """
+    url = make_url(url or config["SQLALCHEMY_DATABASE_URI"])
+    overrides = config.get("SQLALCHEMY_ENGINE_OPTIONS") or {}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return dict(overrides)
+
+    if config["DB_PGBOUNCER"]:
+        options = {"poolclass": NullPool}
+        driver = url.get_driver_name()
+        if driver == "psycopg":
+            options["connect_args"] = {"prepare_threshold": None}
+        elif driver == "asyncpg":
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    else:
+        options = {
+            "pool_size": config["DB_POOL_SIZE"],
+            "max_overflow": config["DB_MAX_OVERFLOW"],
+            "pool_timeout": config["DB_POOL_TIMEOUT"],
+            "pool_recycle": config["DB_POOL_RECYCLE"],
+            "pool_pre_ping": config["DB_POOL_PRE_PING"],
+        }
+    options.update(overrides)
+    return options
+
+
+def enable_idle_ping(engine, idle_seconds: float) -> None:
+    """
+    Check liveness only of connections that sat idle in the pool.
+
+    A connection checked in less than idle_seconds ago is handed out
+    without the extra SELECT 1 round trip pool_pre_ping would cost. A
+    failed ping raises DisconnectionError so the pool discards the
+    connection and retries with a new one.
+    """
+    if idle_seconds <= 0 or isinstance(engine.pool, NullPool):
+        return
+
+    @event.listens_for(engine.pool, "connect")
+    def _mark_connected(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine.pool, "checkin")
+    def _mark_checked_in(dbapi_connection, connection_record):
+        if connection_record is not None:
+            connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as e:
+            raise exc.DisconnectionError(f"Idle connection failed liveness check: {e}") from e
+
+
+def pool_status(engine) -> dict:
+    """Point-in-time counters of an engine's pool."""
+    pool = engine.pool
+    stats = {"pool_class": type(pool).__name__, "status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if method is not None:
+            stats[name] = method()
+    timeout = getattr(pool, "timeout", None)
+    if callable(timeout):
+        stats["timeout"] = timeout()
+    return stats
+
+
+def init_pool(app) -> None:
+    """Register the idle liveness check on the app's engines."""
+    if app.config["DB_POOL_PRE_PING"]:
+        return
+    with app.app_context():
+        for engine in all_engines():
+            enable_idle_ping(engine, app.config["DB_POOL_PING_IDLE_SECONDS"])
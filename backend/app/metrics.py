@@ -0,0 +1,205 @@
+# /backend/app/metrics.py
+"""
+Prometheus metrics - request latency, SQL usage, pool and cache counters.
+
+Collectors are module level so every gunicorn worker writes to its own
+files when PROMETHEUS_MULTIPROC_DIR is set; /api/metrics then aggregates
+the files of all workers. The endpoint answers only scrapers sending
+"Authorization: Bearer <METRICS_TOKEN>" and is disabled without a token.
+"""
+import hmac
+import os
+import time
+
+from flask import Flask, Response, current_app, g, jsonify, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+
+from .db import all_engines, db
+
+# Blueprints with long-lived connections (WebSocket) would skew latency
+EXCLUDED_BLUEPRINTS = {"realtime"}
+
+REQUEST_LATENCY = Histogram(
+    "gantt_http_request_duration_seconds",
+    "HTTP request latency",
+    ["blueprint", "rule", "method"],
+)
+REQUEST_COUNT = Counter(
+    "gantt_http_requests_total",
+    "HTTP requests by status code",
+    ["blueprint", "rule", "method", "status"],
+)
+SQL_STATEMENTS = Histogram(
+    "gantt_sql_statements_per_request",
+    "SQL statements executed per request",
+    ["blueprint", "rule"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500),
+)
+SQL_TIME = Histogram(
+    "gantt_sql_seconds_per_request",
+    "Time spent in SQL per request",
+    ["blueprint", "rule"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "gantt_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "gantt_db_pool_overflow",
+    "Connections opened above the pool size",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "gantt_db_pool_connections",
+    "Pool connections of each worker by state",
+    ["state"],
+    multiprocess_mode="liveall",
+)
+DB_POOL_EVENTS = Counter(
+    "gantt_db_pool_events_total",
+    "Pool connection events (connect, invalidate, checkout)",
+    ["event"],
+)
+NOTIFICATIONS_CREATED = Counter(
+    "gantt_notifications_created_total",
+    "Notifications created",
+    ["type"],
+)
+CACHE_REQUESTS = Counter(
+    "gantt_cache_requests_total",
+    "Cache lookups by result",
+    ["cache", "result"],
+)
+
+
+def _request_labels() -> tuple:
+    rule = request.url_rule.rule if request.url_rule else "<unmatched>"
+    return request.blueprint or "", rule
+
+
+def _before_request() -> None:
+    g.metrics_start = time.perf_counter()
+    g.sql_statements = 0
+    g.sql_time = 0.0
+
+
+def _after_request(response: Response) -> Response:
+    start = g.pop("metrics_start", None)
+    if start is None or request.blueprint in EXCLUDED_BLUEPRINTS:
+        return response
+
+    blueprint, rule = _request_labels()
+    REQUEST_LATENCY.labels(blueprint, rule, request.method).observe(time.perf_counter() - start)
+    REQUEST_COUNT.labels(blueprint, rule, request.method, str(response.status_code)).inc()
+    SQL_STATEMENTS.labels(blueprint, rule).observe(g.get("sql_statements", 0))
+    SQL_TIME.labels(blueprint, rule).observe(g.get("sql_time", 0.0))
+    return response
+
+
+# Kept on the execution context rather than the pooled connection, so a
+# statement that raises (no after_cursor_execute) leaves nothing behind
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context.metrics_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "metrics_query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    # g is only bound inside a request; statements from CLI/threads are skipped
+    if g and "sql_statements" in g:
+        g.sql_statements += 1
+        g.sql_time += elapsed
+
+
+def _update_pool_gauges(pool) -> None:
+    checked_out = getattr(pool, "checkedout", None)
+    overflow = getattr(pool, "overflow", None)
+    if checked_out is not None:
+        DB_POOL_CHECKED_OUT.set(checked_out())
+        DB_POOL_CONNECTIONS.labels("checked_out").set(checked_out())
+    if overflow is not None:
+        DB_POOL_OVERFLOW.set(max(overflow(), 0))
+        DB_POOL_CONNECTIONS.labels("overflow").set(max(overflow(), 0))
+    checked_in = getattr(pool, "checkedin", None)
+    if checked_in is not None:
+        DB_POOL_CONNECTIONS.labels("idle").set(checked_in())
+
+
+def _on_pool_checkout(pool) -> None:
+    DB_POOL_EVENTS.labels("checkout").inc()
+    _update_pool_gauges(pool)
+
+
+def _register_engine_events(engine, pool_gauges: bool = True) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    if not pool_gauges:
+        return
+    event.listen(engine.pool, "checkout", lambda *args: _on_pool_checkout(engine.pool))
+    event.listen(engine.pool, "checkin", lambda *args: _update_pool_gauges(engine.pool))
+    event.listen(engine.pool, "connect", lambda *args: DB_POOL_EVENTS.labels("connect").inc())
+    # Includes connections dropped by a failed idle liveness check
+    event.listen(engine.pool, "invalidate", lambda *args: DB_POOL_EVENTS.labels("invalidate").inc())
+    size = getattr(engine.pool, "size", None)
+    if size is not None:
+        DB_POOL_CONNECTIONS.labels("size").set(size())
+
+
+def scrape_authorized() -> bool:
+    """Whether the request carries the configured METRICS_TOKEN."""
+    token = current_app.config.get("METRICS_TOKEN") or ""
+    header = request.headers.get("Authorization", "")
+    scheme, _, credentials = header.partition(" ")
+    return bool(token) and scheme.lower() == "bearer" and hmac.compare_digest(
+        credentials.strip().encode(), token.encode()
+    )
+
+
+def metrics_registry():
+    """Registry to expose: all workers' files in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def init_metrics(app: Flask) -> None:
+    """Register request hooks, engine events and the /api/metrics endpoint."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+
+    with app.app_context():
+        _register_engine_events(db.engine)
+        # Replicas count towards SQL per request; pool gauges track the primary
+        for engine in all_engines()[1:]:
+            _register_engine_events(engine, pool_gauges=False)
+
+    @app.route("/api/metrics")
+    def metrics():
+        """
+        GET /api/metrics
+        Metrics in Prometheus text exposition format (Bearer METRICS_TOKEN).
+        """
+        if not current_app.config.get("METRICS_TOKEN"):
+            return jsonify({"error": "Kaynak bulunamadı"}), 404
+        if not scrape_authorized():
+            return jsonify({"error": "Geçersiz metrik token"}), 401
+        return Response(generate_latest(metrics_registry()), mimetype=CONTENT_TYPE_LATEST)
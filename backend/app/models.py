@@ -6,10 +6,13 @@ from datetime import datetime, date
 from enum import Enum as PyEnum
 from typing import Optional, List
 
-from sqlalchemy import String, Text, Integer, Boolean, Date, DateTime, ForeignKey, Enum
+from sqlalchemy import (
+    String, Text, Integer, BigInteger, Boolean, Date, DateTime, ForeignKey, Enum, Index, Sequence, UniqueConstraint
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import db
+from . import search_index  # noqa: F401 - creates the full-text index with the tables
 
 
 class UserRole(PyEnum):
@@ -44,6 +47,26 @@ def enum_values_callable(enum_class):
     return [e.value for e in enum_class]
 
 
+# Global monotonic change sequence for Gantt delta sync (PostgreSQL only,
+# other dialects fall back to an in-process counter in sync_service)
+change_seq_sequence = Sequence("gantt_change_seq", metadata=db.Model.metadata)
+
+
+def effective_status(
+    status: SubTaskStatus, progress_percent: int, end_date: date, today: Optional[date] = None
+) -> SubTaskStatus:
+    """Status shown to users, derived from progress and the end date."""
+    # 1. Auto-complete: If progress is 100% OR status is COMPLETED → show as COMPLETED
+    if progress_percent == 100 or status == SubTaskStatus.COMPLETED:
+        return SubTaskStatus.COMPLETED
+
+    # 2. Auto-overdue: If end_date passed AND not fully completed → show as OVERDUE
+    # Task is fully completed only if BOTH progress=100% AND status=COMPLETED
+    if end_date < (today or date.today()):
+        return SubTaskStatus.OVERDUE
+    return status
+
+
 class User(db.Model):
     """User model for authentication and authorization."""
     __tablename__ = "users"
@@ -102,6 +125,10 @@ class Activity(db.Model):
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
     owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    # Working-day calendar for durations; None uses the default Monday-Friday week
+    calendar_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("calendars.id", ondelete="SET NULL"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -122,6 +149,7 @@ class Activity(db.Model):
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat(),
             "owner_id": self.owner_id,
+            "calendar_id": self.calendar_id,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -133,11 +161,15 @@ class Activity(db.Model):
 class Topic(db.Model):
     """Topic model - groups subtasks within an activity."""
     __tablename__ = "topics"
+    __table_args__ = (
+        Index("ix_topics_activity_id_change_seq", "activity_id", "change_seq"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     activity_id: Mapped[int] = mapped_column(Integer, ForeignKey("activities.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    change_seq: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -167,9 +199,13 @@ class Topic(db.Model):
 class SubTask(db.Model):
     """SubTask model - individual tasks with dates and status."""
     __tablename__ = "subtasks"
+    __table_args__ = (
+        # "My tasks" list: one assignee's subtasks in end date order
+        Index("ix_subtasks_assignee_id_end_date", "assignee_id", "end_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    topic_id: Mapped[int] = mapped_column(Integer, ForeignKey("topics.id"), nullable=False)
+    topic_id: Mapped[int] = mapped_column(Integer, ForeignKey("topics.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -183,9 +219,11 @@ class SubTask(db.Model):
         Integer, ForeignKey("users.id"), nullable=True
     )
     progress_percent: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    change_seq: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Indexed for incremental analytics exports (updated_at watermarks)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
     )
 
     # Relationships
@@ -194,18 +232,6 @@ class SubTask(db.Model):
 
     def to_dict(self, include_assignee: bool = False) -> dict:
         """Convert subtask to dictionary representation."""
-        # Calculate effective status based on progress and completion
-        effective_status = self.status
-        
-        # 1. Auto-complete: If progress is 100% OR status is COMPLETED → show as COMPLETED
-        if self.progress_percent == 100 or self.status == SubTaskStatus.COMPLETED:
-            effective_status = SubTaskStatus.COMPLETED
-        
-        # 2. Auto-overdue: If end_date passed AND not fully completed → show as OVERDUE
-        # Task is fully completed only if BOTH progress=100% AND status=COMPLETED
-        elif self.end_date < date.today():
-            effective_status = SubTaskStatus.OVERDUE
-
         data = {
             "id": self.id,
             "topic_id": self.topic_id,
@@ -213,7 +239,7 @@ class SubTask(db.Model):
             "description": self.description,
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat(),
-            "status": effective_status.value,
+            "status": effective_status(self.status, self.progress_percent, self.end_date).value,
             "assignee_id": self.assignee_id,
             "progress_percent": self.progress_percent,
             "created_at": self.created_at.isoformat(),
@@ -245,6 +271,10 @@ class Notification(db.Model):
     )
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Watermark of incremental analytics exports (read flags change)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
+    )
 
     # Relationships
     target_user: Mapped["User"] = relationship(
@@ -278,3 +308,89 @@ class Notification(db.Model):
                 data["subtask"] = {"id": self.subtask.id, "title": self.subtask.title}
         return data
 
+
+class WorkCalendar(db.Model):
+    """Working-day calendar - weekly pattern plus holidays."""
+    __tablename__ = "calendars"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    # Seven 0/1 flags, Monday first (numpy busday weekmask format)
+    weekmask: Mapped[str] = mapped_column(String(7), default="1111100", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    # Relationships
+    holidays: Mapped[List["CalendarHoliday"]] = relationship(
+        "CalendarHoliday", back_populates="calendar", cascade="all, delete-orphan",
+        order_by="CalendarHoliday.day"
+    )
+
+    def to_dict(self, include_holidays: bool = False) -> dict:
+        """Convert calendar to dictionary representation."""
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "weekmask": self.weekmask,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+        if include_holidays:
+            data["holidays"] = [h.to_dict() for h in self.holidays]
+        return data
+
+
+class CalendarHoliday(db.Model):
+    """Non-working date of a calendar."""
+    __tablename__ = "calendar_holidays"
+    __table_args__ = (
+        UniqueConstraint("calendar_id", "day", name="uq_calendar_holidays_calendar_id_day"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    calendar_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    # Relationships
+    calendar: Mapped["WorkCalendar"] = relationship("WorkCalendar", back_populates="holidays")
+
+    def to_dict(self) -> dict:
+        """Convert holiday to dictionary representation."""
+        return {"date": self.day.isoformat(), "name": self.name}
+
+
+class Tombstone(db.Model):
+    """Tombstone model - records deleted topics/subtasks for Gantt delta sync."""
+    __tablename__ = "gantt_tombstones"
+    __table_args__ = (
+        Index("ix_gantt_tombstones_activity_id_change_seq", "activity_id", "change_seq"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    activity_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("activities.id", ondelete="CASCADE"), nullable=False
+    )
+    change_seq: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class AnalyticsDeletion(db.Model):
+    """
+    Deleted users, activities, topics, subtasks and notifications, for
+    incremental analytics exports. No foreign keys: the rows must outlive
+    what they describe (gantt_tombstones cascade away with their activity).
+    """
+    __tablename__ = "analytics_deletions"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    activity_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
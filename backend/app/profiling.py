@@ -0,0 +1,230 @@
+# /backend/app/profiling.py
+"""
+On-demand request profiling.
+
+Admins profile a single request by sending an X-Profile header (or a
+_profile query parameter) with "sampling" or "deterministic". Independently
+PROFILE_SAMPLE_RATE profiles a random fraction of all requests. Profiles are
+saved as collapsed stacks ("a;b;c weight" per line) to PROFILE_DIR and can
+be downloaded as-is or converted to speedscope JSON. Only the newest
+PROFILE_MAX_FILES profiles are kept; older ones are removed on every save.
+"""
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import List, Optional
+
+from flask import Flask, Response, current_app, g, request
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_ARG = "_profile"
+PROFILE_MODES = ("sampling", "deterministic")
+
+# Long-lived WebSocket connections are never randomly sampled
+EXCLUDED_BLUEPRINTS = {"realtime"}
+
+_PROFILE_ID_RE = re.compile(r"^[0-9a-z_-]+$")
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Samples the call stack of one thread from a background thread."""
+
+    unit = "samples"
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._sampler.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class DeterministicProfiler:
+    """Records exact self time per call stack with sys.setprofile."""
+
+    unit = "microseconds"
+
+    def __init__(self):
+        self.stacks = Counter()
+        self._stack: List[str] = []
+        self._last = 0.0
+
+    def start(self) -> None:
+        frame = sys._getframe(1)
+        while frame is not None:
+            self._stack.insert(0, _frame_label(frame.f_code))
+            frame = frame.f_back
+        self._last = time.perf_counter()
+        sys.setprofile(self._profile)
+
+    def stop(self) -> None:
+        sys.setprofile(None)
+        self._charge(time.perf_counter())
+
+    def _charge(self, now: float) -> None:
+        if self._stack:
+            self.stacks[";".join(self._stack)] += int((now - self._last) * 1_000_000)
+        self._last = now
+
+    def _profile(self, frame, event, arg) -> None:
+        self._charge(time.perf_counter())
+        if event == "call":
+            self._stack.append(_frame_label(frame.f_code))
+        elif event == "c_call":
+            self._stack.append(f"{getattr(arg, '__qualname__', arg)} (builtin)")
+        elif event in ("return", "c_return", "c_exception") and self._stack:
+            self._stack.pop()
+
+
+def to_collapsed(stacks: Counter) -> str:
+    """Collapsed stack text as used by flamegraph.pl and speedscope."""
+    return "".join(f"{stack} {weight}\n" for stack, weight in stacks.most_common() if weight > 0)
+
+
+def collapsed_to_speedscope(collapsed: str, name: str, unit: str) -> dict:
+    """Convert collapsed stacks to a speedscope "sampled" profile."""
+    frames, frame_index, samples, weights = [], {}, [], []
+    for line in collapsed.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        stack, _, weight = line.rpartition(" ")
+        indices = []
+        for label in stack.split(";"):
+            if label not in frame_index:
+                frame_index[label] = len(frames)
+                frames.append({"name": label})
+            indices.append(frame_index[label])
+        samples.append(indices)
+        weights.append(int(weight))
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "none" if unit == "samples" else unit,
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": name,
+    }
+
+
+def profile_path(profile_id: str) -> Optional[str]:
+    """Path of a saved profile, or None for an invalid id."""
+    if not _PROFILE_ID_RE.match(profile_id):
+        return None
+    return os.path.join(current_app.config["PROFILE_DIR"], f"{profile_id}.collapsed.txt")
+
+
+def prune_profiles(profile_dir: str, keep: int) -> int:
+    """Delete all but the newest keep profiles; returns how many were removed."""
+    profiles = []
+    with os.scandir(profile_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".collapsed.txt"):
+                try:
+                    profiles.append((entry.stat().st_mtime_ns, entry.name))
+                except FileNotFoundError:
+                    continue
+    removed = 0
+    for _, name in sorted(profiles, reverse=True)[max(keep, 0):]:
+        try:
+            os.remove(os.path.join(profile_dir, name))
+            removed += 1
+        except FileNotFoundError:
+            # Pruned concurrently by another worker
+            continue
+    return removed
+
+
+def requested_profile_mode() -> Optional[str]:
+    """Profiling mode asked for by the current request, if any."""
+    mode = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_ARG)
+    if not mode:
+        return None
+    mode = mode.lower()
+    return mode if mode in PROFILE_MODES else "sampling"
+
+
+def start_request_profile(mode: str, trigger: str) -> None:
+    """Start profiling the rest of the current request on this thread."""
+    if "profiler" in g:
+        return
+    if mode == "deterministic":
+        profiler = DeterministicProfiler()
+    else:
+        profiler = SamplingProfiler(current_app.config["PROFILE_INTERVAL_MS"] / 1000)
+    g.profiler = profiler
+    g.profile_trigger = trigger
+    profiler.start()
+
+
+def _before_request() -> None:
+    rate = current_app.config["PROFILE_SAMPLE_RATE"]
+    if rate > 0 and random.random() < rate and request.blueprint not in EXCLUDED_BLUEPRINTS:
+        start_request_profile("sampling", "random")
+
+
+def _after_request(response: Response) -> Response:
+    profiler = g.pop("profiler", None)
+    if profiler is None:
+        return response
+    profiler.stop()
+
+    profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{g.pop('profile_trigger')}-{uuid.uuid4().hex[:8]}"
+    header = (
+        f"# {request.method} {request.full_path.rstrip('?')} -> {response.status_code} "
+        f"unit={profiler.unit}\n"
+    )
+    profile_dir = current_app.config["PROFILE_DIR"]
+    os.makedirs(profile_dir, exist_ok=True)
+    with open(profile_path(profile_id), "w", encoding="utf-8") as f:
+        f.write(header + to_collapsed(profiler.stacks))
+    prune_profiles(profile_dir, current_app.config["PROFILE_MAX_FILES"])
+
+    response.headers["X-Profile-Id"] = profile_id
+    return response
+
+
+def _teardown_request(exc) -> None:
+    # after_request is skipped on unhandled errors; never leave a profiler running
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        profiler.stop()
+
+
+def init_profiling(app: Flask) -> None:
+    """Register the random sampling and profile saving hooks."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
@@ -0,0 +1,139 @@
+# /backend/app/replicas.py
+"""
+Read-replica routing.
+
+Every URL in DATABASE_REPLICA_URLS gets its own engine, kept next to the
+primary in app.extensions. They are not Flask-SQLAlchemy binds: the models
+all live on the primary and no tables are mapped to a replica.
+RoutingSession sends SELECTs of safe (GET/HEAD/OPTIONS) requests to one
+replica per request; flushes, DML and every other request use the primary.
+
+Read-your-writes: after a successful write the user is pinned to the
+primary for REPLICA_STICKY_SECONDS. The pin is kept per worker by user id
+and also returned in the X-Read-Primary-Until header, which the frontend
+sends back so the pin holds on any worker or node.
+"""
+import math
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from flask import Flask, Response, current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Engine, Select, create_engine
+
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def replica_engines(app: Optional[Flask] = None) -> List[Engine]:
+    """Replica engines of the app (empty without replicas)."""
+    return (app or current_app).extensions.get("replica_engines", [])
+
+
+class StickyWrites:
+    """Per-worker record of users who must read from the primary."""
+
+    def __init__(self):
+        self._until: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int, seconds: float) -> float:
+        until = time.time() + seconds
+        with self._lock:
+            self._until[user_id] = until
+            # Keep the map small: drop expired pins while holding the lock
+            if len(self._until) > 10000:
+                now = time.time()
+                self._until = {uid: t for uid, t in self._until.items() if t > now}
+        return until
+
+    def is_sticky(self, user_id: int) -> bool:
+        return self._until.get(user_id, 0) > time.time()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+# Singleton instance for convenience
+sticky_writes = StickyWrites()
+
+
+def use_primary() -> None:
+    """Send the remaining queries of the current request to the primary."""
+    g.db_use_primary = True
+
+
+def read_primary_until(value: Optional[str], sticky_seconds: float) -> float:
+    """
+    Expiry of a client sent X-Read-Primary-Until pin, 0.0 when there is none.
+
+    The header comes from the client, so non-numeric and non-finite values
+    are ignored and the pin never lasts longer than a fresh write would.
+    """
+    try:
+        until = float(value or 0)
+    except ValueError:
+        return 0.0
+    if not math.isfinite(until):
+        return 0.0
+    return min(until, time.time() + sticky_seconds)
+
+
+def _header_pin_active() -> bool:
+    until = read_primary_until(request.headers.get(READ_PRIMARY_HEADER),
+                               current_app.config["REPLICA_STICKY_SECONDS"])
+    return until > time.time()
+
+
+def _replica_for_request() -> Optional[Engine]:
+    """Replica engine for the current request, or None for the primary."""
+    if not has_request_context() or request.method not in SAFE_METHODS:
+        return None
+    if "db_replica" in g:
+        replica = g.db_replica
+    else:
+        engines = replica_engines()
+        replica = g.db_replica = random.choice(engines) if engines else None
+    if replica is None or g.get("db_use_primary") or _header_pin_active():
+        return None
+
+    user = g.get("current_user")
+    if user is not None and sticky_writes.is_sticky(user.id):
+        return None
+    return replica
+
+
+class RoutingSession(Session):
+    """Session sending read-only statements of safe requests to a replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and isinstance(clause, Select):
+            replica = _replica_for_request()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _after_request(response: Response) -> Response:
+    if request.method in SAFE_METHODS or response.status_code >= 400:
+        return response
+    user = g.get("current_user")
+    if user is not None:
+        until = sticky_writes.mark(user.id, current_app.config["REPLICA_STICKY_SECONDS"])
+        response.headers[READ_PRIMARY_HEADER] = f"{until:.3f}"
+    return response
+
+
+def init_replicas(app: Flask, options_for: Callable[[str], dict]) -> None:
+    """
+    Create the replica engines and register the write pin hook.
+
+    options_for(url) returns the engine options (pool settings) for a URL.
+    """
+    urls = [url.strip() for url in app.config["DATABASE_REPLICA_URLS"].split(",") if url.strip()]
+    app.extensions["replica_engines"] = [create_engine(url, **options_for(url)) for url in urls]
+    if urls:
+        app.after_request(_after_request)
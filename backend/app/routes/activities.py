@@ -4,10 +4,13 @@ Activities CRUD routes.
 """
 from datetime import datetime
 from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import joinedload
 
 from ..db import db
-from ..models import Activity, UserRole
+from ..models import Activity, UserRole, WorkCalendar
 from ..auth.utils import login_required, role_required, get_current_user
+from ..tracing import span
+from ..services.activity_service import activity_stats_cache
 
 activities_bp = Blueprint("activities", __name__)
 
@@ -18,9 +21,10 @@ def get_activities():
     """
     GET /api/activities
     Query params: ?owner_id=X (optional filter)
-    Returns: List of all activities
+    Returns: List of all activities with owner and subtask rollup stats
     """
-    query = db.session.query(Activity)
+    # Owners are joined in the same query to avoid a lazy load per row
+    query = db.session.query(Activity).options(joinedload(Activity.owner))
 
     # Optional filter by owner
     owner_id = request.args.get("owner_id", type=int)
@@ -28,9 +32,16 @@ def get_activities():
         query = query.filter_by(owner_id=owner_id)
 
     activities = query.order_by(Activity.start_date.desc()).all()
-    return jsonify({
-        "activities": [a.to_dict(include_owner=True) for a in activities]
-    }), 200
+    stats = activity_stats_cache.get_many([a.id for a in activities])
+
+    result = []
+    with span("serialize", rows=len(activities)):
+        for activity in activities:
+            data = activity.to_dict(include_owner=True)
+            data["stats"] = stats[activity.id]
+            result.append(data)
+
+    return jsonify({"activities": result}), 200
 
 
 @activities_bp.route("", methods=["POST"])
@@ -39,7 +50,10 @@ def get_activities():
 def create_activity():
     """
     POST /api/activities
-    Body: { "name": "...", "description": "...", "start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD" }
+    Body: {
+        "name": "...", "description": "...", "start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD",
+        "calendar_id": null   (working-day calendar, default Monday-Friday)
+    }
     Returns: Created activity
     """
     data = request.get_json()
@@ -60,12 +74,17 @@ def create_activity():
     if start_date > end_date:
         return jsonify({"error": "Başlangıç tarihi bitiş tarihinden sonra olamaz"}), 400
 
+    calendar_id = data.get("calendar_id")
+    if calendar_id is not None and not db.session.get(WorkCalendar, calendar_id):
+        return jsonify({"error": "Takvim bulunamadı"}), 400
+
     activity = Activity(
         name=data["name"],
         description=data.get("description"),
         start_date=start_date,
         end_date=end_date,
-        owner_id=current_user.id
+        owner_id=current_user.id,
+        calendar_id=calendar_id
     )
 
     db.session.add(activity)
@@ -95,7 +114,7 @@ def get_activity(activity_id: int):
 def update_activity(activity_id: int):
     """
     PUT /api/activities/:id
-    Body: { "name": "...", "description": "...", "start_date": "...", "end_date": "..." }
+    Body: { "name": "...", "description": "...", "start_date": "...", "end_date": "...", "calendar_id": ... }
     Returns: Updated activity
     """
     activity = db.session.get(Activity, activity_id)
@@ -131,6 +150,11 @@ def update_activity(activity_id: int):
     if activity.start_date > activity.end_date:
         return jsonify({"error": "Başlangıç tarihi bitiş tarihinden sonra olamaz"}), 400
 
+    if "calendar_id" in data:
+        if data["calendar_id"] is not None and not db.session.get(WorkCalendar, data["calendar_id"]):
+            return jsonify({"error": "Takvim bulunamadı"}), 400
+        activity.calendar_id = data["calendar_id"]
+
     db.session.commit()
 
     return jsonify({"activity": activity.to_dict(include_owner=True)}), 200
@@ -151,6 +175,7 @@ def delete_activity(activity_id: int):
 
     db.session.delete(activity)
     db.session.commit()
+    activity_stats_cache.invalidate(activity_id)
 
     return jsonify({"message": "Faaliyet başarıyla silindi"}), 200
 
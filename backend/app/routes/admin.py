@@ -0,0 +1,155 @@
+# /backend/app/routes/admin.py
+"""
+Admin diagnostics routes.
+"""
+import os
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+
+from ..db import db, pool_status, slow_query_log
+from ..profiling import collapsed_to_speedscope, profile_path
+from ..models import UserRole
+from ..auth.utils import login_required, role_required
+from ..services.analytics_service import TABLES, export_until, parse_watermark, stream_table
+
+admin_bp = Blueprint("admin", __name__)
+
+
+@admin_bp.route("/slow-queries", methods=["GET"])
+@login_required
+@role_required(UserRole.ADMIN)
+def get_slow_queries():
+    """
+    GET /api/admin/slow-queries?limit=50
+    Returns: Recorded slow statements (slowest first) with normalized SQL,
+    parameter shape, calling route and EXPLAIN plan
+    """
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit < 1:
+        return jsonify({"error": "limit pozitif bir sayı olmalı"}), 400
+
+    return jsonify({
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.entries(limit),
+    }), 200
+
+
+@admin_bp.route("/slow-queries", methods=["DELETE"])
+@login_required
+@role_required(UserRole.ADMIN)
+def clear_slow_queries():
+    """
+    DELETE /api/admin/slow-queries
+    Clears the slow-query buffer of this worker.
+    """
+    slow_query_log.clear()
+    return jsonify({"message": "Yavaş sorgu kaydı temizlendi"}), 200
+
+
+@admin_bp.route("/db-pool", methods=["GET"])
+@login_required
+@role_required(UserRole.ADMIN)
+def get_db_pool():
+    """
+    GET /api/admin/db-pool
+    Returns: Pool counters and settings of the worker serving the request
+    """
+    config = current_app.config
+    return jsonify({
+        "pid": os.getpid(),
+        "pgbouncer": config["DB_PGBOUNCER"],
+        "settings": {
+            "pool_size": config["DB_POOL_SIZE"],
+            "max_overflow": config["DB_MAX_OVERFLOW"],
+            "pool_timeout": config["DB_POOL_TIMEOUT"],
+            "pool_recycle": config["DB_POOL_RECYCLE"],
+            "pre_ping": config["DB_POOL_PRE_PING"],
+            "ping_idle_seconds": config["DB_POOL_PING_IDLE_SECONDS"],
+        },
+        "pool": pool_status(db.engine),
+    }), 200
+
+
+@admin_bp.route("/profiles", methods=["GET"])
+@login_required
+@role_required(UserRole.ADMIN)
+def get_profiles():
+    """
+    GET /api/admin/profiles
+    Returns: Saved request profiles of this host, newest first
+    """
+    profile_dir = current_app.config["PROFILE_DIR"]
+    names = os.listdir(profile_dir) if os.path.isdir(profile_dir) else []
+
+    profiles = []
+    for name in sorted(names, reverse=True):
+        if not name.endswith(".collapsed.txt"):
+            continue
+        with open(os.path.join(profile_dir, name), encoding="utf-8") as f:
+            summary = f.readline().lstrip("# ").strip()
+        profiles.append({"id": name[:-len(".collapsed.txt")], "request": summary})
+
+    return jsonify({"profiles": profiles}), 200
+
+
+@admin_bp.route("/profiles/<profile_id>", methods=["GET"])
+@login_required
+@role_required(UserRole.ADMIN)
+def download_profile(profile_id: str):
+    """
+    GET /api/admin/profiles/:id?format=collapsed|speedscope
+    Returns: The profile as collapsed stacks (default) or speedscope JSON
+    """
+    path = profile_path(profile_id)
+    if not path or not os.path.isfile(path):
+        return jsonify({"error": "Profil bulunamadı"}), 404
+
+    output_format = request.args.get("format", "collapsed")
+    if output_format not in ("collapsed", "speedscope"):
+        return jsonify({"error": "Geçersiz format. Geçerli değerler: collapsed, speedscope"}), 400
+
+    with open(path, encoding="utf-8") as f:
+        header = f.readline()
+        collapsed = f.read()
+
+    if output_format == "speedscope":
+        unit = header.rsplit("unit=", 1)[-1].strip()
+        return jsonify(collapsed_to_speedscope(collapsed, profile_id, unit)), 200
+
+    return Response(
+        collapsed,
+        mimetype="text/plain",
+        headers={"Content-Disposition": f"attachment; filename={profile_id}.collapsed.txt"}
+    )
+
+
+@admin_bp.route("/analytics/<table>.<any(parquet, arrow):fmt>", methods=["GET"])
+@login_required
+@role_required(UserRole.ADMIN)
+def export_analytics_table(table: str, fmt: str):
+    """
+    GET /api/admin/analytics/:table.parquet | :table.arrow
+    Query params:
+        - since: ISO timestamp (optional, rows changed after it; the
+          X-Export-Watermark header of the previous export)
+    Returns: The table as one Parquet file or Arrow IPC stream, streamed
+    from the replica in record batches
+    """
+    if table not in TABLES:
+        return jsonify({"error": f"Tablo bulunamadı. Geçerli tablolar: {', '.join(TABLES)}"}), 404
+
+    try:
+        since = parse_watermark(request.args.get("since"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    until = export_until()
+    mimetype = "application/vnd.apache.parquet" if fmt == "parquet" else "application/vnd.apache.arrow.stream"
+    return Response(
+        stream_with_context(stream_table(db.session, TABLES[table], fmt, since, until)),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename={table}.{fmt}",
+            "X-Export-Watermark": until.isoformat(),
+        }
+    )
@@ -0,0 +1,143 @@
+# /backend/app/routes/calendars.py
+"""
+Working-day calendar routes.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import selectinload
+
+from ..db import db
+from ..models import Activity, CalendarHoliday, UserRole, WorkCalendar
+from ..auth.utils import login_required, role_required
+from ..services.calendar_service import calendar_cache, validate_weekmask
+
+calendars_bp = Blueprint("calendars", __name__)
+
+
+def _parse_holidays(items) -> List[CalendarHoliday]:
+    """[{"date": "YYYY-MM-DD", "name": "..."}] → holidays; raises ValueError."""
+    if not isinstance(items, list):
+        raise ValueError("holidays bir liste olmalı")
+    holidays = {}
+    for item in items:
+        try:
+            day = datetime.strptime(item["date"], "%Y-%m-%d").date()
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Tatil tarihi YYYY-MM-DD formatında olmalı")
+        holidays[day] = CalendarHoliday(day=day, name=item.get("name"))
+    return list(holidays.values())
+
+
+def _apply(calendar: WorkCalendar, data: dict) -> Optional[Tuple[dict, int]]:
+    """Validate and copy request fields onto a calendar; returns (error body, status) or None."""
+    if data.get("name"):
+        duplicate = db.session.query(WorkCalendar.id).filter(
+            WorkCalendar.name == data["name"], WorkCalendar.id != calendar.id
+        ).first()
+        if duplicate:
+            return {"error": "Bu isimde bir takvim zaten var"}, 409
+        calendar.name = data["name"]
+
+    try:
+        if "weekmask" in data:
+            calendar.weekmask = validate_weekmask(str(data["weekmask"]))
+        if "holidays" in data:
+            holidays = _parse_holidays(data["holidays"])
+            if calendar.id is not None:
+                # Old rows must be gone before re-adding a date (unique per calendar)
+                calendar.holidays = []
+                db.session.flush()
+            calendar.holidays = holidays
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    return None
+
+
+@calendars_bp.route("/calendars", methods=["GET"])
+@login_required
+def get_calendars():
+    """
+    GET /api/calendars
+    Returns: All calendars with their holidays
+    """
+    calendars = db.session.query(WorkCalendar).options(
+        selectinload(WorkCalendar.holidays)
+    ).order_by(WorkCalendar.name).all()
+    return jsonify({"calendars": [c.to_dict(include_holidays=True) for c in calendars]}), 200
+
+
+@calendars_bp.route("/calendars", methods=["POST"])
+@login_required
+@role_required(UserRole.ADMIN)
+def create_calendar():
+    """
+    POST /api/calendars
+    Body: {
+        "name": "...",
+        "weekmask": "1111100",       (Monday first, 1 = working day)
+        "holidays": [{"date": "YYYY-MM-DD", "name": "..."}]
+    }
+    Returns: Created calendar
+    """
+    data = request.get_json()
+
+    if not data.get("name"):
+        return jsonify({"error": "name alanı gerekli"}), 400
+
+    calendar = WorkCalendar()
+    error = _apply(calendar, data)
+    if error:
+        return jsonify(error[0]), error[1]
+
+    db.session.add(calendar)
+    db.session.commit()
+
+    return jsonify({"calendar": calendar.to_dict(include_holidays=True)}), 201
+
+
+@calendars_bp.route("/calendars/<int:calendar_id>", methods=["PUT"])
+@login_required
+@role_required(UserRole.ADMIN)
+def update_calendar(calendar_id: int):
+    """
+    PUT /api/calendars/:id
+    Body: { "name": "...", "weekmask": "...", "holidays": [...] }
+        holidays replaces the whole holiday list
+    Returns: Updated calendar
+    """
+    calendar = db.session.get(WorkCalendar, calendar_id)
+
+    if not calendar:
+        return jsonify({"error": "Takvim bulunamadı"}), 404
+
+    error = _apply(calendar, request.get_json())
+    if error:
+        return jsonify(error[0]), error[1]
+
+    db.session.commit()
+    calendar_cache.invalidate(calendar_id)
+
+    return jsonify({"calendar": calendar.to_dict(include_holidays=True)}), 200
+
+
+@calendars_bp.route("/calendars/<int:calendar_id>", methods=["DELETE"])
+@login_required
+@role_required(UserRole.ADMIN)
+def delete_calendar(calendar_id: int):
+    """
+    DELETE /api/calendars/:id
+    Activities using the calendar fall back to the default Monday-Friday week.
+    """
+    calendar = db.session.get(WorkCalendar, calendar_id)
+
+    if not calendar:
+        return jsonify({"error": "Takvim bulunamadı"}), 404
+
+    db.session.query(Activity).filter_by(calendar_id=calendar_id).update({"calendar_id": None})
+    db.session.delete(calendar)
+    db.session.commit()
+    calendar_cache.invalidate(calendar_id)
+
+    return jsonify({"message": "Takvim başarıyla silindi"}), 200
@@ -0,0 +1,66 @@
+# /backend/app/routes/exports.py
+"""
+Streaming subtask export routes (CSV, XLSX, MS Project XML).
+"""
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+
+from ..db import db
+from ..models import Activity
+from ..auth.utils import login_required
+from ..services.export_service import (
+    EXPORT_FORMATS, ExportFilters, export_subtasks, gzip_chunks, parse_export_filters
+)
+
+exports_bp = Blueprint("exports", __name__)
+
+
+def _export_response(filters: ExportFilters, fmt: str, title: str, filename: str) -> Response:
+    mimetype, compressible = EXPORT_FORMATS[fmt]
+    chunks = export_subtasks(db.session, filters, fmt, title)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"', "Vary": "Accept-Encoding"}
+    if compressible and "gzip" in request.accept_encodings:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+
+@exports_bp.route("/activities/<int:activity_id>/export.<any(csv, xlsx, xml):fmt>", methods=["GET"])
+@login_required
+def export_activity(activity_id: int, fmt: str):
+    """
+    GET /api/activities/:id/export.csv | .xlsx | .xml
+    Query params:
+        - from / to: YYYY-MM-DD (optional, only subtasks overlapping the window)
+    Returns: All subtasks of the activity, streamed (gzip for csv/xml when accepted)
+    """
+    activity = db.session.get(Activity, activity_id)
+
+    if not activity:
+        return jsonify({"error": "Faaliyet bulunamadı"}), 404
+
+    try:
+        filters = parse_export_filters({k: v for k, v in request.args.items() if k in ("from", "to")})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    filters.activity_ids = [activity_id]
+    return _export_response(filters, fmt, activity.name, f"activity-{activity_id}")
+
+
+@exports_bp.route("/export/subtasks.<any(csv, xlsx, xml):fmt>", methods=["GET"])
+@login_required
+def export_portfolio(fmt: str):
+    """
+    GET /api/export/subtasks.csv | .xlsx | .xml
+    Query params:
+        - activity_ids: comma separated ids (optional, max 1000)
+        - owner_id: int (optional filter when activity_ids is not given)
+        - from / to: YYYY-MM-DD (optional, only subtasks overlapping the window)
+    Returns: Subtasks of all matching activities, streamed
+    """
+    try:
+        filters = parse_export_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return _export_response(filters, fmt, "Portföy", "subtasks")
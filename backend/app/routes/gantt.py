@@ -2,48 +2,286 @@
 """
 Gantt chart data endpoint.
 """
-from datetime import date
-from flask import Blueprint, jsonify
+from datetime import date, datetime
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from sqlalchemy.orm import joinedload, selectinload
 
 from ..db import db
 from ..models import Activity, Topic, SubTask
 from ..auth.utils import login_required
-from ..services.gantt_service import calculate_scale
+from ..tracing import span
+from ..replicas import use_primary
+from ..services.activity_service import activity_stats_cache
+from ..services.sync_service import get_changes, current_cursor
+from ..services.gantt_service import (
+    calculate_scale,
+    build_timeline,
+    use_binned_lod,
+    parse_gantt_params,
+    gantt_topics_statement,
+    gantt_subtasks_statement,
+    gantt_bin_rows_statement,
+    gantt_bins,
+    gantt_payload,
+    activity_dict,
+    subtask_dicts
+)
+from ..services.calendar_service import calendar_cache
+from ..services.render_service import parse_render_window, render_gantt
 
 gantt_bp = Blueprint("gantt", __name__)
 
+# Maximum number of activities returned by the portfolio endpoint
+MAX_PORTFOLIO_ACTIVITIES = 200
+
 
 @gantt_bp.route("/activities/<int:activity_id>/gantt", methods=["GET"])
 @login_required
 def get_gantt_data(activity_id: int):
     """
     GET /api/activities/:id/gantt
-    Returns: Full gantt chart data including activity, topics, subtasks, scale
+    Query params:
+        - scale: "day" | "week" | "month" (optional, overrides the automatic scale)
+        - locale: "tr" | "en" (optional, timeline labels)
+        - lod: "full" (default) | "auto" | "binned"
+            auto returns binned aggregates for coarse (month) scales,
+            binned always does. Subtasks are then omitted and "bins" holds
+            per-topic active counts, mean progress and overdue counts per
+            timeline column.
+        - since: int cursor from a previous response (optional)
+            Returns only topics/subtasks changed after the cursor plus
+            deleted ids, instead of the full chart.
+    Returns: Full gantt chart data including activity, topics, subtasks, scale, timeline
+    and a cursor for subsequent delta requests
     """
     activity = db.session.get(Activity, activity_id)
 
     if not activity:
         return jsonify({"error": "Faaliyet bulunamadı"}), 404
 
+    since = request.args.get("since")
+    if since is not None:
+        if not since.isdigit():
+            return jsonify({"error": "since geçerli bir imleç olmalı"}), 400
+        # A lagging replica could hide rows below an already advanced cursor
+        use_primary()
+        changes = get_changes(activity_id, int(since))
+        calendar = calendar_cache.get(db.session, activity.calendar_id)
+        with span("serialize", rows=len(changes["topics"]) + len(changes["subtasks"])):
+            response = {
+                "delta": True,
+                "activity": activity_dict(activity, calendar),
+                "topics": [t.to_dict() for t in changes["topics"]],
+                "subtasks": subtask_dicts(changes["subtasks"], calendar),
+                "deleted": changes["deleted"],
+                "cursor": changes["cursor"],
+                "today": date.today().isoformat()
+            }
+        return jsonify(response), 200
+
+    try:
+        timeline_scale, locale, lod = parse_gantt_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Calculate appropriate scale
+    scale = calculate_scale(activity.start_date, activity.end_date)
+    timeline = build_timeline(
+        activity.start_date, activity.end_date, timeline_scale or scale, locale
+    )
+    binned = use_binned_lod(lod, timeline["scale"])
+
+    # Taken before loading rows so concurrent writes are resent, never skipped
+    cursor = current_cursor(activity_id)
+
     # Get all topics for this activity
-    topics = db.session.query(Topic).filter_by(activity_id=activity_id).all()
+    topics = db.session.scalars(gantt_topics_statement(activity_id)).all()
 
     # Get all subtasks for all topics
     topic_ids = [t.id for t in topics]
     subtasks = []
-    if topic_ids:
-        subtasks = db.session.query(SubTask).filter(
-            SubTask.topic_id.in_(topic_ids)
-        ).order_by(SubTask.start_date).all()
+    bins = None
+    if binned:
+        rows = db.session.execute(gantt_bin_rows_statement(topic_ids)).all() if topic_ids else []
+        bins = gantt_bins(rows, timeline, activity)
+    elif topic_ids:
+        subtasks = db.session.scalars(gantt_subtasks_statement(topic_ids)).all()
 
-    # Calculate appropriate scale
-    scale = calculate_scale(activity.start_date, activity.end_date)
+    calendar = calendar_cache.get(db.session, activity.calendar_id)
+    with span("serialize", rows=len(topics) + len(subtasks)):
+        response = gantt_payload(activity, topics, subtasks, scale, timeline, bins, cursor, calendar)
+
+    return jsonify(response), 200
+
+
+@gantt_bp.route("/activities/<int:activity_id>/gantt.<any(svg, pdf):fmt>", methods=["GET"])
+@login_required
+def get_gantt_render(activity_id: int, fmt: str):
+    """
+    GET /api/activities/:id/gantt.svg | /api/activities/:id/gantt.pdf
+    Query params:
+        - from / to: YYYY-MM-DD (optional, default the activity dates)
+        - scale: "day" | "week" | "month" (optional, default chosen by window length)
+        - locale: "tr" | "en" (optional, timeline labels)
+    Returns: Printable chart, streamed while subtasks are read
+    """
+    activity = db.session.get(Activity, activity_id)
+
+    if not activity:
+        return jsonify({"error": "Faaliyet bulunamadı"}), 404
+
+    try:
+        timeline_scale, locale, _ = parse_gantt_params(request.args)
+        window_start, window_end = parse_render_window(request.args, activity, timeline_scale)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    chunks = render_gantt(db.session, activity, fmt, window_start, window_end, timeline_scale, locale)
+    return Response(
+        stream_with_context(chunks),
+        mimetype="application/pdf" if fmt == "pdf" else "image/svg+xml",
+        headers={"Content-Disposition": f'inline; filename="gantt-{activity_id}.{fmt}"'}
+    )
+
+
+@gantt_bp.route("/activities/<int:activity_id>/gantt/drill", methods=["GET"])
+@login_required
+def get_gantt_bucket(activity_id: int):
+    """
+    GET /api/activities/:id/gantt/drill
+    Query params:
+        - from: YYYY-MM-DD (bucket start, required)
+        - to: YYYY-MM-DD (bucket end, required)
+        - topic_id: int (optional, restrict to one topic)
+    Returns: Subtasks of the activity active in the given bucket
+    """
+    activity = db.session.get(Activity, activity_id)
+
+    if not activity:
+        return jsonify({"error": "Faaliyet bulunamadı"}), 404
+
+    if not request.args.get("from") or not request.args.get("to"):
+        return jsonify({"error": "from ve to parametreleri gerekli"}), 400
+
+    try:
+        range_start = datetime.strptime(request.args["from"], "%Y-%m-%d").date()
+        range_end = datetime.strptime(request.args["to"], "%Y-%m-%d").date()
+    except ValueError:
+        return jsonify({"error": "Tarih formatı YYYY-MM-DD olmalı"}), 400
+
+    if range_start > range_end:
+        return jsonify({"error": "Başlangıç tarihi bitiş tarihinden sonra olamaz"}), 400
+
+    query = db.session.query(SubTask).join(Topic, SubTask.topic_id == Topic.id).options(
+        joinedload(SubTask.assignee)
+    ).filter(
+        Topic.activity_id == activity_id,
+        SubTask.start_date <= range_end,
+        SubTask.end_date >= range_start
+    )
+
+    topic_id = request.args.get("topic_id", type=int)
+    if topic_id:
+        query = query.filter(SubTask.topic_id == topic_id)
+
+    subtasks = query.order_by(SubTask.start_date).all()
 
     return jsonify({
-        "activity": activity.to_dict(include_owner=True),
-        "topics": [t.to_dict() for t in topics],
-        "subtasks": [st.to_dict(include_assignee=True) for st in subtasks],
-        "scale": scale,
-        "today": date.today().isoformat()
+        "from": range_start.isoformat(),
+        "to": range_end.isoformat(),
+        "subtasks": subtask_dicts(subtasks, calendar_cache.get(db.session, activity.calendar_id))
     }), 200
 
+
+@gantt_bp.route("/gantt/portfolio", methods=["GET"])
+@login_required
+def get_portfolio_gantt():
+    """
+    GET /api/gantt/portfolio
+    Query params:
+        - activity_ids: comma separated ids (optional, max 200)
+        - owner_id: int (optional filter when activity_ids is not given)
+        - from / to: YYYY-MM-DD (optional, only subtasks overlapping the window)
+        - summary_only: bool (default False, only activity + rollup stats)
+    Returns: Gantt data for many activities, loaded with a fixed number of
+    batched IN queries regardless of the number of activities. At most 200
+    activities are returned; has_more tells the client that more matched.
+    """
+    query = db.session.query(Activity).options(joinedload(Activity.owner))
+
+    if request.args.get("activity_ids"):
+        try:
+            activity_ids = [int(i) for i in request.args["activity_ids"].split(",") if i.strip()]
+        except ValueError:
+            return jsonify({"error": "activity_ids virgülle ayrılmış sayılar olmalı"}), 400
+        if len(activity_ids) > MAX_PORTFOLIO_ACTIVITIES:
+            return jsonify({"error": f"En fazla {MAX_PORTFOLIO_ACTIVITIES} faaliyet istenebilir"}), 400
+        query = query.filter(Activity.id.in_(activity_ids))
+    else:
+        owner_id = request.args.get("owner_id", type=int)
+        if owner_id:
+            query = query.filter_by(owner_id=owner_id)
+
+    try:
+        window_start = (
+            datetime.strptime(request.args["from"], "%Y-%m-%d").date()
+            if request.args.get("from") else None
+        )
+        window_end = (
+            datetime.strptime(request.args["to"], "%Y-%m-%d").date()
+            if request.args.get("to") else None
+        )
+    except ValueError:
+        return jsonify({"error": "Tarih formatı YYYY-MM-DD olmalı"}), 400
+
+    if window_start and window_end and window_start > window_end:
+        return jsonify({"error": "Başlangıç tarihi bitiş tarihinden sonra olamaz"}), 400
+
+    summary_only = request.args.get("summary_only", "false").lower() == "true"
+
+    activities = query.order_by(Activity.start_date.desc()).limit(MAX_PORTFOLIO_ACTIVITIES + 1).all()
+    has_more = len(activities) > MAX_PORTFOLIO_ACTIVITIES
+    activities = activities[:MAX_PORTFOLIO_ACTIVITIES]
+    ids = [a.id for a in activities]
+    stats = activity_stats_cache.get_many(ids) if ids else {}
+
+    topics_by_activity = {activity_id: [] for activity_id in ids}
+    subtasks_by_activity = {activity_id: [] for activity_id in ids}
+
+    if ids and not summary_only:
+        topics = db.session.query(Topic).filter(Topic.activity_id.in_(ids)).all()
+        for topic in topics:
+            topics_by_activity[topic.activity_id].append(topic)
+
+        # Assignees are fetched by selectinload in one extra IN query
+        subtask_query = db.session.query(SubTask, Topic.activity_id).join(
+            Topic, SubTask.topic_id == Topic.id
+        ).options(
+            selectinload(SubTask.assignee)
+        ).filter(Topic.activity_id.in_(ids))
+        if window_start:
+            subtask_query = subtask_query.filter(SubTask.end_date >= window_start)
+        if window_end:
+            subtask_query = subtask_query.filter(SubTask.start_date <= window_end)
+
+        for subtask, activity_id in subtask_query.order_by(SubTask.start_date).all():
+            subtasks_by_activity[activity_id].append(subtask)
+
+    result = []
+    for activity in activities:
+        calendar = calendar_cache.get(db.session, activity.calendar_id)
+        item = {
+            "activity": activity_dict(activity, calendar),
+            "scale": calculate_scale(activity.start_date, activity.end_date),
+            "stats": stats[activity.id],
+        }
+        if not summary_only:
+            item["topics"] = [t.to_dict() for t in topics_by_activity[activity.id]]
+            item["subtasks"] = subtask_dicts(subtasks_by_activity[activity.id], calendar)
+        result.append(item)
+
+    return jsonify({
+        "activities": result,
+        "has_more": has_more,
+        "today": date.today().isoformat()
+    }), 200
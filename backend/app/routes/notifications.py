@@ -7,6 +7,7 @@ from flask import Blueprint, request, jsonify
 from ..db import db
 from ..models import Notification
 from ..auth.utils import login_required, get_current_user
+from ..tracing import span
 from ..services.notification_service import notification_service
 
 notifications_bp = Blueprint("notifications", __name__)
@@ -35,8 +36,11 @@ def get_notifications():
     
     unread_count = notification_service.get_unread_count(current_user.id)
     
+    with span("serialize", rows=len(notifications)):
+        result = [n.to_dict(include_relations=True) for n in notifications]
+
     return jsonify({
-        "notifications": [n.to_dict(include_relations=True) for n in notifications],
+        "notifications": result,
         "unread_count": unread_count
     }), 200
 
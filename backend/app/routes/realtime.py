@@ -0,0 +1,60 @@
+# /backend/app/routes/realtime.py
+"""
+Live Gantt updates over WebSocket.
+
+This flask-sock route holds one server thread per open socket and is meant
+for the development server and the threaded gunicorn mode. Deployments
+serve the same endpoint from the event loop of app/asgi.py (the realtime
+service), where idle sockets cost no threads.
+"""
+import json
+import queue
+
+from flask import Blueprint, request
+from flask_sock import Sock
+
+from ..db import db
+from ..models import Activity
+from ..auth.utils import authenticate_token
+from ..services.realtime_service import realtime_service
+
+realtime_bp = Blueprint("realtime", __name__)
+sock = Sock()
+
+# Seconds between keep-alive pings when no change events arrive
+PING_INTERVAL = 25
+
+
+@sock.route("/ws/activities/<int:activity_id>", bp=realtime_bp)
+def activity_updates(ws, activity_id: int):
+    """
+    WS /api/ws/activities/:id?token=<jwt>
+    Streams change events for an activity room:
+        { "type": "change", "activity_id": 1, "entity": "subtask" | "topic",
+          "op": "create" | "update" | "delete", "id": 5, "seq": 42, "data": {...} }
+    Sends { "type": "ping" } when idle. Browsers cannot set headers on
+    WebSocket requests, so the token is passed as a query parameter.
+    """
+    user = authenticate_token(request.args.get("token", ""))
+    if not user:
+        ws.close(reason=1008, message="Geçersiz veya süresi dolmuş token")
+        return
+
+    if not db.session.get(Activity, activity_id):
+        ws.close(reason=1008, message="Faaliyet bulunamadı")
+        return
+
+    # Do not hold a pooled DB connection for the lifetime of the socket
+    db.session.remove()
+
+    subscriber = realtime_service.subscribe(activity_id)
+    try:
+        ws.send(json.dumps({"type": "subscribed", "activity_id": activity_id}))
+        while True:
+            try:
+                message = subscriber.get(timeout=PING_INTERVAL)
+            except queue.Empty:
+                message = '{"type":"ping"}'
+            ws.send(message)
+    finally:
+        realtime_service.unsubscribe(activity_id, subscriber)
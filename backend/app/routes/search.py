@@ -0,0 +1,30 @@
+# /backend/app/routes/search.py
+"""
+Full-text search API routes.
+"""
+from flask import Blueprint, request, jsonify
+
+from ..auth.utils import login_required
+from ..services.search_service import parse_search_params, search
+
+search_bp = Blueprint("search", __name__)
+
+
+@search_bp.route("/search", methods=["GET"])
+@login_required
+def search_entities():
+    """
+    GET /api/search
+    Query params:
+        - q: search words (required, each matches as a word prefix)
+        - type: comma separated activity,topic,subtask (default all)
+        - limit: int (default 20, max 100)
+        - offset: int (default 0, max 1000)
+    Returns: Ranked activities, topics and subtasks matching all words
+    """
+    try:
+        words, kinds, limit, offset = parse_search_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(search(words, kinds, limit, offset)), 200
@@ -4,15 +4,36 @@ SubTasks CRUD routes.
 """
 from datetime import datetime
 from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import joinedload
 
 from ..db import db
 from ..models import Activity, Topic, SubTask, SubTaskStatus, UserRole
 from ..auth.utils import login_required, role_required, get_current_user
 from ..services.notification_service import notification_service
+from ..services.activity_service import activity_stats_cache
+from ..services.sync_service import record_deletion
+from ..services.realtime_service import realtime_service
+from ..services.subtask_service import assigned_subtasks_statement, encode_cursor, parse_assigned_params
+from ..services.calendar_service import calendar_cache
+from ..services.gantt_service import subtask_dicts
+from ..tracing import span
 
 subtasks_bp = Blueprint("subtasks", __name__)
 
 
+def _updated_response(activity: Activity, subtask: SubTask):
+    """Publish an updated subtask and return it with working-day duration and date warnings."""
+    calendar = calendar_cache.get(db.session, activity.calendar_id)
+    data = subtask_dicts([subtask], calendar)[0]
+    realtime_service.publish(activity.id, "subtask", "update", subtask.id, data, subtask.change_seq)
+
+    response = {"subtask": data}
+    warnings = calendar.date_warnings(subtask.start_date, subtask.end_date)
+    if warnings:
+        response["warnings"] = warnings
+    return jsonify(response), 200
+
+
 @subtasks_bp.route("/topics/<int:topic_id>/subtasks", methods=["GET"])
 @login_required
 def get_subtasks(topic_id: int):
@@ -20,14 +41,67 @@ def get_subtasks(topic_id: int):
     GET /api/topics/:topic_id/subtasks
     Returns: List of subtasks for a topic
     """
-    topic = db.session.get(Topic, topic_id)
+    # Activity joined for its calendar
+    topic = db.session.query(Topic).options(joinedload(Topic.activity)).filter_by(id=topic_id).first()
 
     if not topic:
         return jsonify({"error": "Konu bulunamadı"}), 404
 
-    subtasks = db.session.query(SubTask).filter_by(topic_id=topic_id).order_by(SubTask.start_date).all()
+    subtasks = db.session.query(SubTask).options(
+        joinedload(SubTask.assignee)
+    ).filter_by(topic_id=topic_id).order_by(SubTask.start_date).all()
+    calendar = calendar_cache.get(db.session, topic.activity.calendar_id)
+    return jsonify({
+        "subtasks": subtask_dicts(subtasks, calendar)
+    }), 200
+
+
+@subtasks_bp.route("/subtasks", methods=["GET"])
+@login_required
+def get_assigned_subtasks():
+    """
+    GET /api/subtasks
+    Query params:
+        - assignee_id: int (default: current user)
+        - status: comma separated effective statuses, e.g. OVERDUE,IN_PROGRESS (optional)
+        - from / to: YYYY-MM-DD (optional, only subtasks overlapping the window)
+        - limit: int (default 50, max 200)
+        - cursor: next_cursor of the previous page (optional)
+    Returns: Subtasks of one assignee across all activities, ordered by end
+    date, with topic and activity names and a cursor for the next page
+    """
+    assignee_id = request.args.get("assignee_id", type=int) or get_current_user().id
+    try:
+        params = parse_assigned_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    rows = db.session.execute(assigned_subtasks_statement(assignee_id, **params)).all()
+    has_more = len(rows) > params["limit"]
+    rows = rows[:params["limit"]]
+
+    with span("serialize", rows=len(rows)):
+        result = []
+        for subtask, topic_title, activity_id, activity_name, calendar_id in rows:
+            data = subtask.to_dict()
+            data["topic_title"] = topic_title
+            data["activity_id"] = activity_id
+            data["activity_name"] = activity_name
+            result.append(data)
+
+        # Durations in one vectorized call per distinct calendar
+        by_calendar = {}
+        for index, row in enumerate(rows):
+            by_calendar.setdefault(row[4], []).append(index)
+        for calendar_id, indices in by_calendar.items():
+            calendar = calendar_cache.get(db.session, calendar_id)
+            days = calendar.subtask_working_days([rows[i][0] for i in indices])
+            for index, working_days in zip(indices, days):
+                result[index]["working_days"] = working_days
+
     return jsonify({
-        "subtasks": [st.to_dict(include_assignee=True) for st in subtasks]
+        "subtasks": result,
+        "next_cursor": encode_cursor(rows[-1][0]) if has_more else None
     }), 200
 
 
@@ -107,8 +181,14 @@ def create_subtask(topic_id: int):
 
     db.session.add(subtask)
     db.session.commit()
+    activity_stats_cache.invalidate(activity.id)
+
+    calendar = calendar_cache.get(db.session, activity.calendar_id)
+    warnings += calendar.date_warnings(start_date, end_date)
+    data = subtask_dicts([subtask], calendar)[0]
+    realtime_service.publish(activity.id, "subtask", "create", subtask.id, data, subtask.change_seq)
 
-    response = {"subtask": subtask.to_dict(include_assignee=True)}
+    response = {"subtask": data}
     if warnings:
         response["warnings"] = warnings
 
@@ -174,8 +254,9 @@ def update_subtask(subtask_id: int):
         subtask.progress_percent = progress
 
     db.session.commit()
+    activity_stats_cache.invalidate(activity.id)
 
-    return jsonify({"subtask": subtask.to_dict(include_assignee=True)}), 200
+    return _updated_response(activity, subtask)
 
 
 @subtasks_bp.route("/subtasks/<int:subtask_id>", methods=["PATCH"])
@@ -246,6 +327,7 @@ def patch_subtask(subtask_id: int):
         subtask.progress_percent = progress
 
     db.session.commit()
+    activity_stats_cache.invalidate(activity.id)
 
     # Create notifications (FAZ-2)
     # Notify assignee if dates changed (e.g., from drag & drop)
@@ -267,7 +349,7 @@ def patch_subtask(subtask_id: int):
             new_status=subtask.status.value
         )
 
-    return jsonify({"subtask": subtask.to_dict(include_assignee=True)}), 200
+    return _updated_response(activity, subtask)
 
 
 @subtasks_bp.route("/subtasks/<int:subtask_id>", methods=["DELETE"])
@@ -290,8 +372,11 @@ def delete_subtask(subtask_id: int):
     if current_user.role != UserRole.ADMIN and activity.owner_id != current_user.id:
         return jsonify({"error": "Bu alt görevi silme yetkiniz yok"}), 403
 
+    record_deletion(activity.id, subtasks=[subtask])
     db.session.delete(subtask)
     db.session.commit()
+    activity_stats_cache.invalidate(activity.id)
+    realtime_service.publish(activity.id, "subtask", "delete", subtask_id)
 
     return jsonify({"message": "Alt görev başarıyla silindi"}), 200
 
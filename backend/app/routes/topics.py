@@ -3,10 +3,14 @@
 Topics CRUD routes.
 """
 from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import selectinload
 
 from ..db import db
 from ..models import Activity, Topic, UserRole
 from ..auth.utils import login_required, role_required, get_current_user
+from ..services.activity_service import activity_stats_cache
+from ..services.sync_service import record_deletion
+from ..services.realtime_service import realtime_service
 
 topics_bp = Blueprint("topics", __name__)
 
@@ -23,7 +27,9 @@ def get_topics(activity_id: int):
     if not activity:
         return jsonify({"error": "Faaliyet bulunamadı"}), 404
 
-    topics = db.session.query(Topic).filter_by(activity_id=activity_id).all()
+    topics = db.session.query(Topic).options(
+        selectinload(Topic.subtasks)
+    ).filter_by(activity_id=activity_id).all()
     return jsonify({
         "topics": [t.to_dict(include_subtasks=True) for t in topics]
     }), 200
@@ -62,7 +68,10 @@ def create_topic(activity_id: int):
     db.session.add(topic)
     db.session.commit()
 
-    return jsonify({"topic": topic.to_dict()}), 201
+    data = topic.to_dict()
+    realtime_service.publish(activity_id, "topic", "create", topic.id, data, topic.change_seq)
+
+    return jsonify({"topic": data}), 201
 
 
 @topics_bp.route("/topics/<int:topic_id>", methods=["PUT"])
@@ -95,7 +104,10 @@ def update_topic(topic_id: int):
 
     db.session.commit()
 
-    return jsonify({"topic": topic.to_dict()}), 200
+    topic_data = topic.to_dict()
+    realtime_service.publish(activity.id, "topic", "update", topic.id, topic_data, topic.change_seq)
+
+    return jsonify({"topic": topic_data}), 200
 
 
 @topics_bp.route("/topics/<int:topic_id>", methods=["DELETE"])
@@ -117,8 +129,11 @@ def delete_topic(topic_id: int):
     if current_user.role != UserRole.ADMIN and activity.owner_id != current_user.id:
         return jsonify({"error": "Bu konuyu silme yetkiniz yok"}), 403
 
+    record_deletion(activity.id, topics=[topic], subtasks=topic.subtasks)
     db.session.delete(topic)
     db.session.commit()
+    activity_stats_cache.invalidate(activity.id)
+    realtime_service.publish(activity.id, "topic", "delete", topic_id)
 
     return jsonify({"message": "Konu başarıyla silindi"}), 200
 
@@ -11,10 +11,12 @@ Other users (Editor, Viewer):
 - Can only delete their own account
 - Must provide old password to change their password
 """
+from datetime import date, datetime, timedelta
+
 from flask import Blueprint, request, jsonify
 
 from ..db import db
-from ..models import User, UserRole
+from ..models import User, UserRole, SubTask
 from ..auth.utils import (
     login_required,
     role_required,
@@ -22,9 +24,13 @@ from ..auth.utils import (
     hash_password,
     verify_password
 )
+from ..services.workload_service import BUCKET_SIZES, compute_workload, workload_to_rows
 
 users_bp = Blueprint("users", __name__)
 
+# Upper bound for workload ranges (~10 years) to keep the load matrix bounded
+MAX_WORKLOAD_DAYS = 3660
+
 
 @users_bp.route("/users", methods=["GET"])
 @login_required
@@ -49,6 +55,64 @@ def get_users():
     }), 200
 
 
+@users_bp.route("/users/workload", methods=["GET"])
+@login_required
+def get_workload():
+    """
+    GET /api/users/workload
+    Query params:
+        - from: YYYY-MM-DD (default today)
+        - to: YYYY-MM-DD (default from + 90 days)
+        - bucket: "day" | "week" (default "day")
+    Returns: Number of concurrent subtasks per assignee per bucket
+    """
+    bucket = request.args.get("bucket", "day")
+    if bucket not in BUCKET_SIZES:
+        return jsonify({"error": "bucket değeri day veya week olmalı"}), 400
+
+    try:
+        range_start = (
+            datetime.strptime(request.args["from"], "%Y-%m-%d").date()
+            if request.args.get("from") else date.today()
+        )
+        range_end = (
+            datetime.strptime(request.args["to"], "%Y-%m-%d").date()
+            if request.args.get("to") else range_start + timedelta(days=90)
+        )
+    except ValueError:
+        return jsonify({"error": "Tarih formatı YYYY-MM-DD olmalı"}), 400
+
+    if range_start > range_end:
+        return jsonify({"error": "Başlangıç tarihi bitiş tarihinden sonra olamaz"}), 400
+
+    if (range_end - range_start).days > MAX_WORKLOAD_DAYS:
+        return jsonify({"error": f"Tarih aralığı en fazla {MAX_WORKLOAD_DAYS} gün olabilir"}), 400
+
+    # Single query for the interval tuples, no ORM objects
+    rows = db.session.query(
+        SubTask.assignee_id, SubTask.start_date, SubTask.end_date
+    ).filter(
+        SubTask.assignee_id.isnot(None),
+        SubTask.start_date <= range_end,
+        SubTask.end_date >= range_start
+    ).all()
+
+    workload = compute_workload(rows, range_start, range_end, bucket)
+
+    users_by_id = {}
+    if workload["assignee_ids"]:
+        users = db.session.query(User).filter(User.id.in_(workload["assignee_ids"])).all()
+        users_by_id = {u.id: u for u in users}
+
+    return jsonify({
+        "from": range_start.isoformat(),
+        "to": range_end.isoformat(),
+        "bucket": bucket,
+        "buckets": [d.isoformat() for d in workload["buckets"]],
+        "users": workload_to_rows(workload, users_by_id)
+    }), 200
+
+
 @users_bp.route("/users/<int:user_id>", methods=["GET"])
 @login_required
 def get_user(user_id: int):
@@ -0,0 +1,99 @@
+# /backend/app/search_index.py
+"""
+Full-text search index over activities, topics and subtasks.
+
+PostgreSQL: every table gets a stored generated `search_vector` tsvector
+column (name/title weighted A, description B) with a GIN index, so the
+index is maintained by the database on every write. Created by migration
+004 and, for schemas built with metadata.create_all, by the listener below.
+
+SQLite (development and tests): a single FTS5 table `search_index` kept
+current by triggers. Rows are keyed by rowid = id * 4 + kind code, so the
+triggers update and delete by primary key and a hit's kind and id are read
+back from its rowid.
+
+The columns are not mapped on the models; app/services/search_service.py
+queries them directly.
+"""
+from sqlalchemy import event
+
+from .db import db
+
+# Text search configuration: no stemming or stop words, so Turkish and
+# English content both match on word prefixes
+TS_CONFIG = "simple"
+
+# kind → (table, title column, rowid code)
+SEARCH_KINDS = {
+    "activity": ("activities", "name", 1),
+    "topic": ("topics", "title", 2),
+    "subtask": ("subtasks", "title", 3),
+}
+
+SQLITE_TABLE = "search_index"
+
+
+def search_vector_sql(title_column: str) -> str:
+    """Expression of the generated tsvector column (must stay immutable)."""
+    return (
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({title_column}, '')), 'A') || "
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce(description, '')), 'B')"
+    )
+
+
+def postgresql_ddl() -> list:
+    statements = []
+    for table, title_column, _ in SEARCH_KINDS.values():
+        statements.append(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({search_vector_sql(title_column)}) STORED"
+        )
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)"
+        )
+    return statements
+
+
+def sqlite_ddl() -> list:
+    statements = [
+        f"CREATE VIRTUAL TABLE {SQLITE_TABLE} USING fts5("
+        f"title, body, tokenize = 'unicode61 remove_diacritics 2')"
+    ]
+    for table, title_column, code in SEARCH_KINDS.values():
+        insert = (
+            f"INSERT INTO {SQLITE_TABLE}(rowid, title, body) "
+            f"VALUES (new.id * 4 + {code}, new.{title_column}, coalesce(new.description, ''));"
+        )
+        delete = f"DELETE FROM {SQLITE_TABLE} WHERE rowid = old.id * 4 + {code};"
+        statements += [
+            f"CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END",
+            # Only text changes; change_seq and date updates leave the index alone
+            f"CREATE TRIGGER {table}_search_update AFTER UPDATE OF {title_column}, description ON {table} "
+            f"BEGIN {delete} {insert} END",
+            f"CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END",
+            # Rows that existed before the index
+            f"INSERT INTO {SQLITE_TABLE}(rowid, title, body) "
+            f"SELECT id * 4 + {code}, {title_column}, coalesce(description, '') FROM {table}",
+        ]
+    return statements
+
+
+@event.listens_for(db.metadata, "after_create")
+def _create_search_index(target, connection, **kw) -> None:
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        for statement in postgresql_ddl():
+            connection.exec_driver_sql(statement)
+    elif dialect == "sqlite":
+        exists = connection.exec_driver_sql(
+            f"SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = '{SQLITE_TABLE}'"
+        ).first()
+        if not exists:
+            for statement in sqlite_ddl():
+                connection.exec_driver_sql(statement)
+
+
+@event.listens_for(db.metadata, "before_drop")
+def _drop_search_index(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {SQLITE_TABLE}")
@@ -0,0 +1,172 @@
+# /backend/app/services/activity_service.py
+"""
+Activity business logic - rollup aggregates for the activity list.
+"""
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, case, func, not_, or_
+
+from ..db import db
+from ..metrics import CACHE_REQUESTS
+from ..models import SubTask, SubTaskStatus, Topic
+
+# Per-worker aggregate cache TTL in seconds. Writes in this worker invalidate
+# immediately; other workers pick up changes once their entry expires.
+DEFAULT_STATS_CACHE_TTL = 30
+
+# Above this many cache misses the aggregate query scans all activities
+# instead of binding a huge IN list
+MAX_IN_LIST_SIZE = 1000
+
+
+def day_span(start_column, end_column):
+    """Inclusive number of days between two date columns, per dialect."""
+    if db.session.get_bind().dialect.name == "sqlite":
+        return func.julianday(end_column) - func.julianday(start_column) + 1
+    return end_column - start_column + 1
+
+
+def effective_status_conditions(today: date) -> Dict[str, object]:
+    """
+    SQL conditions mirroring SubTask.to_dict() effective status rules.
+
+    Returns:
+        Mapping of status value → boolean SQL expression
+    """
+    completed = or_(
+        SubTask.progress_percent == 100,
+        SubTask.status == SubTaskStatus.COMPLETED
+    )
+    overdue = and_(
+        not_(completed),
+        or_(SubTask.end_date < today, SubTask.status == SubTaskStatus.OVERDUE)
+    )
+    open_task = and_(not_(completed), not_(overdue))
+    return {
+        SubTaskStatus.PLANNED.value: and_(open_task, SubTask.status == SubTaskStatus.PLANNED),
+        SubTaskStatus.IN_PROGRESS.value: and_(open_task, SubTask.status == SubTaskStatus.IN_PROGRESS),
+        SubTaskStatus.COMPLETED.value: completed,
+        SubTaskStatus.OVERDUE.value: overdue,
+    }
+
+
+def empty_activity_stats() -> dict:
+    """Aggregates for an activity without subtasks."""
+    return {
+        "subtask_count": 0,
+        "status_counts": {s.value: 0 for s in SubTaskStatus},
+        "progress_percent": 0.0,
+        "actual_start_date": None,
+        "actual_end_date": None,
+        "overdue_count": 0,
+    }
+
+
+def query_activity_stats(activity_ids: Optional[Iterable[int]] = None) -> Dict[int, dict]:
+    """
+    Compute rollup aggregates per activity with a single GROUP BY query.
+
+    Args:
+        activity_ids: Restrict to these activities (None = all activities)
+
+    Returns:
+        Mapping of activity_id → aggregates (only activities with subtasks)
+    """
+    today = date.today()
+    conditions = effective_status_conditions(today)
+    span = day_span(SubTask.start_date, SubTask.end_date)
+
+    columns = [
+        Topic.activity_id,
+        func.count(SubTask.id),
+        func.sum(SubTask.progress_percent * span),
+        func.sum(span),
+        func.min(SubTask.start_date),
+        func.max(SubTask.end_date),
+    ]
+    status_keys = list(conditions.keys())
+    columns += [func.sum(case((conditions[k], 1), else_=0)) for k in status_keys]
+
+    query = db.session.query(*columns).join(Topic, SubTask.topic_id == Topic.id)
+    if activity_ids is not None:
+        query = query.filter(Topic.activity_id.in_(list(activity_ids)))
+    query = query.group_by(Topic.activity_id)
+
+    result = {}
+    for row in query.all():
+        activity_id, count, weighted, total_span, min_start, max_end = row[:6]
+        status_counts = {k: int(v or 0) for k, v in zip(status_keys, row[6:])}
+        total_span = float(total_span or 0)
+        result[activity_id] = {
+            "subtask_count": count,
+            "status_counts": status_counts,
+            "progress_percent": round(float(weighted or 0) / total_span, 1) if total_span else 0.0,
+            "actual_start_date": min_start.isoformat() if min_start else None,
+            "actual_end_date": max_end.isoformat() if max_end else None,
+            "overdue_count": status_counts[SubTaskStatus.OVERDUE.value],
+        }
+    return result
+
+
+class ActivityStatsCache:
+    """Thread-safe per-worker cache for activity rollup aggregates."""
+
+    def __init__(self, ttl: float = DEFAULT_STATS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, activity_ids: List[int]) -> Dict[int, dict]:
+        """
+        Return aggregates for the given activities, querying only cache misses.
+
+        Entries are also keyed by the current date because effective OVERDUE
+        status depends on it.
+        """
+        now = time.monotonic()
+        today = date.today()
+        result = {}
+        missing = []
+
+        with self._lock:
+            for activity_id in activity_ids:
+                entry = self._entries.get(activity_id)
+                if entry and entry[0] > now and entry[1] == today:
+                    result[activity_id] = entry[2]
+                else:
+                    missing.append(activity_id)
+            self.hits += len(result)
+            self.misses += len(missing)
+        CACHE_REQUESTS.labels("activity_stats", "hit").inc(len(result))
+        CACHE_REQUESTS.labels("activity_stats", "miss").inc(len(missing))
+
+        if missing:
+            fresh = query_activity_stats(missing if len(missing) <= MAX_IN_LIST_SIZE else None)
+            expires = now + self.ttl
+            with self._lock:
+                for activity_id in missing:
+                    stats = fresh.get(activity_id) or empty_activity_stats()
+                    self._entries[activity_id] = (expires, today, stats)
+                    result[activity_id] = stats
+
+        return result
+
+    def invalidate(self, *activity_ids: int) -> None:
+        """Drop cached aggregates for the given activities."""
+        with self._lock:
+            for activity_id in activity_ids:
+                self._entries.pop(activity_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached aggregates."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton instance for convenience
+activity_stats_cache = ActivityStatsCache()
@@ -0,0 +1,374 @@
+# /backend/app/services/analytics_service.py
+"""
+Columnar analytics export (Parquet / Arrow IPC) of the planning tables.
+
+Each table is read with yield_per in batches of BATCH_ROWS and every batch
+becomes one Arrow record batch (one Parquet row group), so memory is
+bounded by a batch whatever the table size. Columns are typed: dates as
+date32, timestamps as timestamp[us], enums dictionary-encoded over their
+fixed value set so every batch shares one dictionary. Password hashes are
+never exported.
+
+Incremental exports select rows whose watermark column (updated_at,
+deleted_at for the deletions table) is in (since, until]. until is fixed
+before reading, WATERMARK_LAG behind the clock, so rows of transactions
+still in flight are picked up by the next run instead of being skipped.
+Every ORM delete of a user, activity, topic, subtask or notification
+(including the topics and subtasks cascading with an activity) is recorded
+in analytics_deletions on flush and exported as the deletions table;
+consumers keep the latest row per id and drop the deleted ones. The
+database nulls notifications.activity_id of a deleted activity without
+touching updated_at, so consumers treat it as NULL once the activity is
+in deletions.
+
+Used by export_analytics.py (files, optional partitioning, watermark state)
+and the admin endpoint (one table streamed over HTTP).
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Result, Select, event, select
+from sqlalchemy.orm import Session
+
+from ..models import (
+    Activity, AnalyticsDeletion, Notification, NotificationType, SubTask, SubTaskStatus, Tombstone, Topic, User,
+    UserRole,
+)
+
+# pyarrow is imported lazily: only exports need it
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+BATCH_ROWS = 10_000
+# Rows updated within this window before an export wait for the next run
+WATERMARK_LAG = timedelta(seconds=60)
+WATERMARK_FILE = "_watermarks.json"
+
+FORMATS = ("parquet", "arrow")
+PARTITIONS = ("activity", "month")
+
+
+@dataclass(frozen=True)
+class AnalyticsTable:
+    """
+    An exported table.
+
+    columns: (name, SQL column, type) with type one of "int", "string",
+    "bool", "date", "timestamp" or an Enum class
+    """
+    name: str
+    columns: Tuple[Tuple[str, object, object], ...]
+    watermark: object
+    # Column holding the activity id (partition=activity), None if not applicable
+    activity_column: Optional[str]
+    # Date/timestamp column bucketed by partition=month
+    month_column: str
+    joins: Tuple[Tuple[object, object], ...] = ()
+
+    def statement(self, since: Optional[datetime], until: datetime) -> Select:
+        stmt = select(*(column.label(name) for name, column, _ in self.columns))
+        for target, onclause in self.joins:
+            stmt = stmt.join(target, onclause)
+        if since is not None:
+            stmt = stmt.where(self.watermark > since)
+        return stmt.where(self.watermark <= until)
+
+
+TABLES: Dict[str, AnalyticsTable] = {
+    table.name: table for table in (
+        AnalyticsTable("users", (
+            ("id", User.id, "int"), ("email", User.email, "string"), ("full_name", User.full_name, "string"),
+            ("role", User.role, UserRole), ("is_active", User.is_active, "bool"),
+            ("created_at", User.created_at, "timestamp"), ("updated_at", User.updated_at, "timestamp"),
+        ), User.updated_at, None, "created_at"),
+        AnalyticsTable("activities", (
+            ("id", Activity.id, "int"), ("name", Activity.name, "string"),
+            ("description", Activity.description, "string"),
+            ("start_date", Activity.start_date, "date"), ("end_date", Activity.end_date, "date"),
+            ("owner_id", Activity.owner_id, "int"), ("calendar_id", Activity.calendar_id, "int"),
+            ("created_at", Activity.created_at, "timestamp"), ("updated_at", Activity.updated_at, "timestamp"),
+        ), Activity.updated_at, "id", "start_date"),
+        AnalyticsTable("topics", (
+            ("id", Topic.id, "int"), ("activity_id", Topic.activity_id, "int"), ("title", Topic.title, "string"),
+            ("description", Topic.description, "string"),
+            ("created_at", Topic.created_at, "timestamp"), ("updated_at", Topic.updated_at, "timestamp"),
+        ), Topic.updated_at, "activity_id", "created_at"),
+        AnalyticsTable("subtasks", (
+            ("id", SubTask.id, "int"), ("topic_id", SubTask.topic_id, "int"),
+            ("activity_id", Topic.activity_id, "int"), ("title", SubTask.title, "string"),
+            ("description", SubTask.description, "string"),
+            ("start_date", SubTask.start_date, "date"), ("end_date", SubTask.end_date, "date"),
+            ("status", SubTask.status, SubTaskStatus), ("assignee_id", SubTask.assignee_id, "int"),
+            ("progress_percent", SubTask.progress_percent, "int"),
+            ("created_at", SubTask.created_at, "timestamp"), ("updated_at", SubTask.updated_at, "timestamp"),
+        ), SubTask.updated_at, "activity_id", "start_date", ((Topic, SubTask.topic_id == Topic.id),)),
+        AnalyticsTable("notifications", (
+            ("id", Notification.id, "int"), ("type", Notification.type, NotificationType),
+            ("message", Notification.message, "string"), ("activity_id", Notification.activity_id, "int"),
+            ("subtask_id", Notification.subtask_id, "int"),
+            ("target_user_id", Notification.target_user_id, "int"),
+            ("created_by_id", Notification.created_by_id, "int"), ("is_read", Notification.is_read, "bool"),
+            ("created_at", Notification.created_at, "timestamp"),
+            ("updated_at", Notification.updated_at, "timestamp"),
+        ), Notification.updated_at, "activity_id", "created_at"),
+        AnalyticsTable("tombstones", (
+            ("id", Tombstone.id, "int"), ("entity_type", Tombstone.entity_type, "string"),
+            ("entity_id", Tombstone.entity_id, "int"), ("activity_id", Tombstone.activity_id, "int"),
+            ("deleted_at", Tombstone.deleted_at, "timestamp"),
+        ), Tombstone.deleted_at, "activity_id", "deleted_at"),
+        AnalyticsTable("deletions", (
+            ("id", AnalyticsDeletion.id, "int"), ("entity_type", AnalyticsDeletion.entity_type, "string"),
+            ("entity_id", AnalyticsDeletion.entity_id, "int"),
+            ("activity_id", AnalyticsDeletion.activity_id, "int"),
+            ("deleted_at", AnalyticsDeletion.deleted_at, "timestamp"),
+        ), AnalyticsDeletion.deleted_at, "activity_id", "deleted_at"),
+    )
+}
+
+# Deleted objects recorded in analytics_deletions, by entity_type
+DELETION_TYPES = {User: "user", Activity: "activity", Topic: "topic", SubTask: "subtask", Notification: "notification"}
+
+
+def _deleted_activity_id(obj) -> Optional[int]:
+    if isinstance(obj, Activity):
+        return obj.id
+    if isinstance(obj, SubTask):
+        return obj.topic.activity_id if obj.topic else None
+    return getattr(obj, "activity_id", None)
+
+
+@event.listens_for(Session, "before_flush")
+def _record_deletions(session: Session, flush_context, instances) -> None:
+    """Add an analytics_deletions row for every exported object being deleted."""
+    for obj in list(session.deleted):
+        entity_type = DELETION_TYPES.get(type(obj))
+        if entity_type:
+            session.add(AnalyticsDeletion(
+                entity_type=entity_type, entity_id=obj.id, activity_id=_deleted_activity_id(obj)
+            ))
+
+
+def _arrow_type(kind) -> pa.DataType:
+    import pyarrow as pa
+    if isinstance(kind, type) and issubclass(kind, Enum):
+        return pa.dictionary(pa.int8(), pa.string())
+    return {
+        "int": pa.int32(), "string": pa.string(), "bool": pa.bool_(),
+        "date": pa.date32(), "timestamp": pa.timestamp("us"),
+    }[kind]
+
+
+def table_schema(table: AnalyticsTable, partition: Optional[str] = None) -> pa.Schema:
+    import pyarrow as pa
+    fields = [pa.field(name, _arrow_type(kind)) for name, _, kind in table.columns]
+    if partition == "month":
+        fields.append(pa.field("month", pa.string()))
+    return pa.schema(fields)
+
+
+def _enum_array(values: Sequence, enum_class) -> pa.DictionaryArray:
+    """Dictionary array over all values of the enum, the same dictionary in every batch."""
+    import pyarrow as pa
+    members = [member.value for member in enum_class]
+    index = {value: i for i, value in enumerate(members)}
+    indices = [
+        None if value is None else index[value.value if isinstance(value, Enum) else value]
+        for value in values
+    ]
+    return pa.DictionaryArray.from_arrays(pa.array(indices, pa.int8()), pa.array(members, pa.string()))
+
+
+def _month(value) -> Optional[str]:
+    return None if value is None else f"{value.year:04d}-{value.month:02d}"
+
+
+def record_batches(
+    session: Session,
+    table: AnalyticsTable,
+    since: Optional[datetime],
+    until: datetime,
+    partition: Optional[str] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Record batches of the rows in the watermark range, read with a server-side cursor.
+
+    The statement runs here, in the caller's thread and app context; the
+    batches can then be pulled from any thread (write_dataset uses its own).
+    """
+    result = session.execute(table.statement(since, until).execution_options(yield_per=BATCH_ROWS))
+    return _batches(result, table, partition)
+
+
+def _batches(result: Result, table: AnalyticsTable, partition: Optional[str]) -> Iterator[pa.RecordBatch]:
+    import pyarrow as pa
+    schema = table_schema(table, partition)
+    month_index = next(i for i, (name, _, _) in enumerate(table.columns) if name == table.month_column)
+    try:
+        for partition_rows in result.partitions():
+            columns = list(zip(*partition_rows))
+            arrays = [
+                _enum_array(values, kind) if isinstance(kind, type) else pa.array(values, _arrow_type(kind))
+                for values, (_, _, kind) in zip(columns, table.columns)
+            ]
+            if partition == "month":
+                arrays.append(pa.array([_month(v) for v in columns[month_index]], pa.string()))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+    finally:
+        result.close()
+
+
+def export_until() -> datetime:
+    """Upper watermark of an export starting now (timestamps are naive UTC)."""
+    return datetime.utcnow() - WATERMARK_LAG
+
+
+def parse_watermark(value: Optional[str]) -> Optional[datetime]:
+    """?since= value; raises ValueError."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError("since ISO 8601 formatında olmalı (YYYY-MM-DDTHH:MM:SS)")
+
+
+class _Sink:
+    """Write-only file object collecting writer output until drained."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def stream_table(
+    session: Session, table: AnalyticsTable, fmt: str, since: Optional[datetime], until: datetime
+) -> Iterator[bytes]:
+    """
+    One table as a single Parquet file or Arrow IPC stream, written batch by
+    batch; Parquet needs no seeking, the footer follows the last row group.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _Sink()
+    schema = table_schema(table)
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+    for batch in record_batches(session, table, since, until):
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def load_watermarks(output_dir: str) -> Dict[str, datetime]:
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return {name: datetime.fromisoformat(value) for name, value in json.load(f).items()}
+
+
+def save_watermarks(output_dir: str, watermarks: Dict[str, datetime]) -> None:
+    """Replace the watermark file atomically."""
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({name: value.isoformat() for name, value in sorted(watermarks.items())}, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def export_dataset(
+    session: Session,
+    output_dir: str,
+    tables: Sequence[str],
+    fmt: str = "parquet",
+    partition: Optional[str] = None,
+    incremental: bool = False,
+) -> Dict[str, dict]:
+    """
+    Write tables as datasets under output_dir/<table>/.
+
+    A full export replaces a table's directory; an incremental export adds
+    files for rows past the saved watermark and always includes the
+    deletions table, without which removed rows would never leave the
+    dataset. Partitioned tables are written
+    hive style (activity_id=12/, month=2025-01/); partition=activity
+    leaves tables without an activity (users) unpartitioned.
+
+    Returns:
+        {table: {"rows", "since", "until"}}
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if incremental and "deletions" not in tables:
+        tables = [*tables, "deletions"]
+    os.makedirs(output_dir, exist_ok=True)
+    watermarks = load_watermarks(output_dir)
+    summary = {}
+    for name in tables:
+        table = TABLES[name]
+        since = watermarks.get(name) if incremental else None
+        until = export_until()
+        base_dir = os.path.join(output_dir, name)
+        if not incremental and os.path.isdir(base_dir):
+            shutil.rmtree(base_dir)
+
+        partition_column = None
+        if partition == "activity":
+            partition_column = table.activity_column
+        elif partition == "month":
+            partition_column = "month"
+
+        rows = 0
+
+        def counted(batches):
+            nonlocal rows
+            for batch in batches:
+                rows += batch.num_rows
+                yield batch
+
+        schema = table_schema(table, partition if partition_column else None)
+        reader = pa.RecordBatchReader.from_batches(
+            schema, counted(record_batches(session, table, since, until, partition if partition_column else None))
+        )
+        ds.write_dataset(
+            reader,
+            base_dir,
+            format="parquet" if fmt == "parquet" else "ipc",
+            partitioning=[partition_column] if partition_column else None,
+            partitioning_flavor="hive" if partition_column else None,
+            # Unique per run so incremental files are added next to earlier ones
+            basename_template=f"part-{until:%Y%m%dT%H%M%S%f}-{{i}}.{'parquet' if fmt == 'parquet' else 'arrow'}",
+            existing_data_behavior="overwrite_or_ignore",
+            max_rows_per_group=BATCH_ROWS,
+        )
+
+        watermarks[name] = until
+        save_watermarks(output_dir, watermarks)
+        summary[name] = {"rows": rows, "since": since.isoformat() if since else None, "until": until.isoformat()}
+    return summary
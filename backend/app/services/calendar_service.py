@@ -0,0 +1,175 @@
+# /backend/app/services/calendar_service.py
+"""
+Working-day calendars - durations and date arithmetic on business days.
+
+A calendar is a weekly pattern (weekmask) plus a holiday list, stored in
+the calendars / calendar_holidays tables and compiled once per worker into
+a numpy busdaycalendar. All arithmetic is vectorized with numpy's busday
+functions, so durations of a whole Gantt chart are one call.
+
+Durations are inclusive like the charts: a task from Monday to Friday of a
+plain week has 5 working days.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..metrics import CACHE_REQUESTS
+from ..models import CalendarHoliday, SubTask, WorkCalendar
+from .workload_service import date_ordinals
+
+# numpy is imported lazily, as in workload_service
+if TYPE_CHECKING:
+    import numpy as np
+
+# Used by activities without a calendar
+DEFAULT_WEEKMASK = "1111100"
+
+# Per-worker compiled calendar TTL in seconds. Writes in this worker
+# invalidate immediately; other workers pick up changes once their entry expires.
+DEFAULT_CALENDAR_CACHE_TTL = 60
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def validate_weekmask(weekmask: str) -> str:
+    """Raises ValueError unless weekmask is seven 0/1 flags with a working day."""
+    if len(weekmask) != 7 or set(weekmask) - {"0", "1"} or "1" not in weekmask:
+        raise ValueError("weekmask 7 adet 0/1 karakterinden oluşmalı ve en az bir çalışma günü içermeli")
+    return weekmask
+
+
+def to_datetime64(values: Sequence[date]) -> np.ndarray:
+    """Dates as a datetime64[D] array."""
+    return (date_ordinals(values, len(values)) - _EPOCH_ORDINAL).view("datetime64[D]")
+
+
+class CompiledCalendar:
+    """Immutable weekmask + holidays compiled for numpy busday functions."""
+
+    def __init__(self, weekmask: str = DEFAULT_WEEKMASK, holidays: Sequence[date] = ()):
+        import numpy as np
+        self.weekmask = weekmask
+        self.holidays = tuple(sorted(holidays))
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=to_datetime64(self.holidays))
+
+    def working_days(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Inclusive working-day counts of [start, end] intervals.
+
+        Args:
+            starts / ends: datetime64[D] arrays (see to_datetime64)
+        """
+        import numpy as np
+        counts = np.busday_count(starts, ends + np.timedelta64(1, "D"), busdaycal=self._busdaycal)
+        return np.maximum(counts, 0)
+
+    def working_days_between(self, start: date, end: date) -> int:
+        """Inclusive working days from start to end."""
+        import numpy as np
+        if end < start:
+            return 0
+        return int(np.busday_count(start, end + timedelta(days=1), busdaycal=self._busdaycal))
+
+    def is_working_day(self, day: date) -> bool:
+        import numpy as np
+        return bool(np.is_busday(day, busdaycal=self._busdaycal))
+
+    def add_working_days(self, starts: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """
+        Date of the days-th working day after each start (negative: before).
+
+        A start on a non-working day first rolls forward to the next working day.
+        """
+        import numpy as np
+        return np.busday_offset(starts, days, roll="forward", busdaycal=self._busdaycal)
+
+    def subtask_working_days(self, subtasks: Sequence[SubTask]) -> List[int]:
+        """Working days of each subtask, one vectorized call."""
+        if not subtasks:
+            return []
+        starts = to_datetime64([st.start_date for st in subtasks])
+        ends = to_datetime64([st.end_date for st in subtasks])
+        return self.working_days(starts, ends).tolist()
+
+    def date_warnings(self, start: date, end: date) -> List[str]:
+        """Validation warnings for a task starting or ending on a non-working day."""
+        warnings = []
+        if not self.is_working_day(start):
+            warnings.append("Başlangıç tarihi çalışma günü değil")
+        if not self.is_working_day(end):
+            warnings.append("Bitiş tarihi çalışma günü değil")
+        return warnings
+
+
+def load_calendar(session: Session, calendar_id: int) -> Optional[CompiledCalendar]:
+    """Compile a stored calendar (None if it does not exist)."""
+    weekmask = session.execute(
+        select(WorkCalendar.weekmask).where(WorkCalendar.id == calendar_id)
+    ).scalar()
+    if weekmask is None:
+        return None
+    holidays = session.execute(
+        select(CalendarHoliday.day).where(CalendarHoliday.calendar_id == calendar_id)
+    ).scalars().all()
+    return CompiledCalendar(weekmask, holidays)
+
+
+class CalendarCache:
+    """Thread-safe per-worker cache of compiled calendars."""
+
+    def __init__(self, ttl: float = DEFAULT_CALENDAR_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[float, CompiledCalendar]] = {}
+        self._lock = threading.Lock()
+        self._default: Optional[CompiledCalendar] = None
+
+    @property
+    def default(self) -> CompiledCalendar:
+        if self._default is None:
+            self._default = CompiledCalendar()
+        return self._default
+
+    def get(self, session: Session, calendar_id: Optional[int]) -> CompiledCalendar:
+        """
+        Compiled calendar by id; the default calendar for None or a
+        deleted calendar.
+
+        Takes the session explicitly so the asyncio read path can call it
+        through AsyncSession.run_sync.
+        """
+        if calendar_id is None:
+            return self.default
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(calendar_id)
+        if entry and entry[0] > now:
+            CACHE_REQUESTS.labels("calendar", "hit").inc()
+            return entry[1]
+
+        CACHE_REQUESTS.labels("calendar", "miss").inc()
+        calendar = load_calendar(session, calendar_id) or self.default
+        with self._lock:
+            self._entries[calendar_id] = (now + self.ttl, calendar)
+        return calendar
+
+    def invalidate(self, *calendar_ids: int) -> None:
+        """Drop compiled calendars after their rows changed."""
+        with self._lock:
+            for calendar_id in calendar_ids:
+                self._entries.pop(calendar_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton instance for convenience
+calendar_cache = CalendarCache()
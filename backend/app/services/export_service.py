@@ -0,0 +1,521 @@
+# /backend/app/services/export_service.py
+"""
+Streaming subtask exports: CSV, XLSX and MS Project XML (MSPDI).
+
+Rows are read with yield_per (a server-side cursor on PostgreSQL) in
+batches of FETCH_SIZE and every batch is written out before the next one
+is fetched, so memory stays flat however many subtasks are exported.
+Working days and effective status are computed per batch, vectorized on
+the activity's calendar.
+
+    - CSV: UTF-8 with a BOM so Excel detects the encoding
+    - XLSX: written with zipfile to a non-seekable stream (entries use data
+      descriptors), one inline-string worksheet per XLSX_MAX_ROWS rows
+    - XML: MSPDI with activities and topics as summary tasks, working
+      calendars, assignees as resources; assignments are read in a second
+      streamed pass because the schema puts them after the resources
+"""
+import csv
+import io
+import re
+import zipfile
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from sqlalchemy import Select, distinct, select
+from sqlalchemy.orm import Session
+
+from ..models import Activity, SubTask, SubTaskStatus, Topic, User, effective_status
+from .calendar_service import CompiledCalendar, calendar_cache, to_datetime64
+
+# Rows fetched per database round trip and written per output chunk
+FETCH_SIZE = 2000
+MAX_EXPORT_ACTIVITY_IDS = 1000
+# Data rows per worksheet (Excel's limit is 1,048,576 including the header)
+XLSX_MAX_ROWS = 1_048_575
+XLSX_SHEET_NAME = "Alt görevler"
+
+EXPORT_COLUMNS = (
+    "activity_id", "activity", "topic_id", "topic", "subtask_id", "title",
+    "start_date", "end_date", "working_days", "status", "progress_percent",
+    "assignee", "assignee_email",
+)
+
+# Characters XML 1.0 does not allow, even escaped
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_EXCEL_EPOCH = date(1899, 12, 30)
+# Leading characters that make spreadsheet apps evaluate a CSV cell as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+@dataclass
+class ExportFilters:
+    """Which subtasks an export contains."""
+    activity_ids: Optional[List[int]] = None
+    owner_id: Optional[int] = None
+    window_start: Optional[date] = None
+    window_end: Optional[date] = None
+
+
+class ExportRow(NamedTuple):
+    activity_id: int
+    activity: str
+    topic_id: int
+    topic: str
+    subtask_id: int
+    title: str
+    start_date: date
+    end_date: date
+    working_days: int
+    status: SubTaskStatus
+    progress_percent: int
+    assignee_id: Optional[int]
+    assignee: Optional[str]
+    assignee_email: Optional[str]
+    activity_start: date
+    activity_end: date
+    calendar_id: Optional[int]
+
+
+def parse_export_filters(args: Mapping) -> ExportFilters:
+    """
+    Validate ?activity_ids=&owner_id=&from=&to= of a portfolio export.
+
+    Raises:
+        ValueError: with the error message for the client
+    """
+    filters = ExportFilters()
+    if args.get("activity_ids"):
+        try:
+            filters.activity_ids = [int(i) for i in args["activity_ids"].split(",") if i.strip()]
+        except ValueError:
+            raise ValueError("activity_ids virgülle ayrılmış sayılar olmalı")
+        if len(filters.activity_ids) > MAX_EXPORT_ACTIVITY_IDS:
+            raise ValueError(f"En fazla {MAX_EXPORT_ACTIVITY_IDS} faaliyet istenebilir")
+    elif args.get("owner_id"):
+        try:
+            filters.owner_id = int(args["owner_id"])
+        except ValueError:
+            raise ValueError("owner_id sayı olmalı")
+
+    try:
+        filters.window_start = date.fromisoformat(args["from"]) if args.get("from") else None
+        filters.window_end = date.fromisoformat(args["to"]) if args.get("to") else None
+    except ValueError:
+        raise ValueError("Tarih formatı YYYY-MM-DD olmalı")
+    if filters.window_start and filters.window_end and filters.window_start > filters.window_end:
+        raise ValueError("Başlangıç tarihi bitiş tarihinden sonra olamaz")
+    return filters
+
+
+def _filtered(stmt: Select, filters: ExportFilters) -> Select:
+    if filters.activity_ids is not None:
+        stmt = stmt.where(Activity.id.in_(filters.activity_ids))
+    elif filters.owner_id is not None:
+        stmt = stmt.where(Activity.owner_id == filters.owner_id)
+    if filters.window_start:
+        stmt = stmt.where(SubTask.end_date >= filters.window_start)
+    if filters.window_end:
+        stmt = stmt.where(SubTask.start_date <= filters.window_end)
+    return stmt
+
+
+def export_rows_statement(filters: ExportFilters) -> Select:
+    """Plain tuples in export order: activity, topic, then start date."""
+    stmt = (
+        select(Activity.id, Activity.name, Activity.start_date, Activity.end_date, Activity.calendar_id,
+               Topic.id, Topic.title, SubTask.id, SubTask.title, SubTask.start_date, SubTask.end_date,
+               SubTask.status, SubTask.progress_percent, User.id, User.full_name, User.email)
+        .select_from(SubTask)
+        .join(Topic, SubTask.topic_id == Topic.id)
+        .join(Activity, Topic.activity_id == Activity.id)
+        .outerjoin(User, SubTask.assignee_id == User.id)
+    )
+    return _filtered(stmt, filters).order_by(Activity.id, Topic.id, SubTask.start_date, SubTask.id)
+
+
+def export_assignments_statement(filters: ExportFilters) -> Select:
+    """(subtask id, assignee id) of the exported subtasks that have an assignee."""
+    stmt = (
+        select(SubTask.id, SubTask.assignee_id)
+        .join(Topic, SubTask.topic_id == Topic.id)
+        .join(Activity, Topic.activity_id == Activity.id)
+        .where(SubTask.assignee_id.is_not(None))
+    )
+    return _filtered(stmt, filters).order_by(SubTask.id)
+
+
+def export_calendar_ids_statement(filters: ExportFilters) -> Select:
+    stmt = select(distinct(Activity.calendar_id))
+    if filters.activity_ids is not None:
+        stmt = stmt.where(Activity.id.in_(filters.activity_ids))
+    elif filters.owner_id is not None:
+        stmt = stmt.where(Activity.owner_id == filters.owner_id)
+    return stmt
+
+
+def export_batches(session: Session, filters: ExportFilters) -> Iterator[List[ExportRow]]:
+    """Exported rows, FETCH_SIZE at a time, from one streamed query."""
+    today = date.today()
+    result = session.execute(export_rows_statement(filters).execution_options(yield_per=FETCH_SIZE))
+    try:
+        for partition in result.partitions():
+            # Working days per calendar in one vectorized call each
+            by_calendar: Dict[Optional[int], List[int]] = {}
+            for index, row in enumerate(partition):
+                by_calendar.setdefault(row[4], []).append(index)
+            working_days = [0] * len(partition)
+            for calendar_id, indexes in by_calendar.items():
+                calendar = calendar_cache.get(session, calendar_id)
+                counts = calendar.working_days(
+                    to_datetime64([partition[i][9] for i in indexes]),
+                    to_datetime64([partition[i][10] for i in indexes]),
+                ).tolist()
+                for i, count in zip(indexes, counts):
+                    working_days[i] = count
+
+            yield [
+                ExportRow(activity_id, activity_name, topic_id, topic_title, subtask_id, title,
+                          start_date, end_date, working_days[i],
+                          effective_status(status, progress, end_date, today), progress,
+                          assignee_id, assignee, assignee_email, activity_start, activity_end, calendar_id)
+                for i, (activity_id, activity_name, activity_start, activity_end, calendar_id,
+                        topic_id, topic_title, subtask_id, title, start_date, end_date,
+                        status, progress, assignee_id, assignee, assignee_email) in enumerate(partition)
+            ]
+    finally:
+        result.close()
+
+
+def _columns(row: ExportRow) -> tuple:
+    """Values of EXPORT_COLUMNS."""
+    return (row.activity_id, row.activity, row.topic_id, row.topic, row.subtask_id, row.title,
+            row.start_date, row.end_date, row.working_days, row.status.value, row.progress_percent,
+            row.assignee, row.assignee_email)
+
+
+def _xml_text(value: str) -> str:
+    return escape(_XML_INVALID.sub("", value))
+
+
+def gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """gzip Content-Encoding of a byte stream, compressed as it goes."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# CSV
+
+def _csv_cell(value):
+    """Quote user-entered text that a spreadsheet would run as a formula."""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def write_csv(batches: Iterator[List[ExportRow]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_cell(value) for value in _columns(row)] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+# XLSX
+
+class _ZipStream:
+    """Write-only file object collecting zipfile output until drained."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+_XLSX_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_PACKAGE_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+# Cell styles: 0 default, 1 date, 2 bold header
+_XLSX_STYLES = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<styleSheet xmlns="{_XLSX_MAIN}">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '</styleSheet>'
+)
+_XLSX_SHEET_START = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{_XLSX_MAIN}">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews><sheetData>'
+    '<row>' + "".join(
+        f'<c t="inlineStr" s="2"><is><t>{name}</t></is></c>' for name in EXPORT_COLUMNS
+    ) + '</row>'
+)
+_XLSX_SHEET_END = '</sheetData></worksheet>'
+
+
+def _xlsx_cell(value) -> str:
+    # Cells without an r attribute follow each other in column order
+    if value is None:
+        return "<c/>"
+    if isinstance(value, date):
+        return f'<c s="1"><v>{(value - _EXCEL_EPOCH).days}</v></c>'
+    if isinstance(value, int):
+        return f"<c><v>{value}</v></c>"
+    return f'<c t="inlineStr"><is><t>{_xml_text(value)}</t></is></c>'
+
+
+def _xlsx_package(sheet_count: int) -> Dict[str, str]:
+    """Workbook parts listing the sheets; written after the sheets."""
+    sheets = "".join(
+        f'<sheet name="{XLSX_SHEET_NAME}{f" {n}" if n > 1 else ""}" sheetId="{n}" r:id="rId{n}"/>'
+        for n in range(1, sheet_count + 1)
+    )
+    relationships = "".join(
+        f'<Relationship Id="rId{n}" Type="{_XLSX_REL}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+        for n in range(1, sheet_count + 1)
+    )
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for n in range(1, sheet_count + 1)
+    )
+    header = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    return {
+        "xl/styles.xml": _XLSX_STYLES,
+        "xl/workbook.xml": (
+            f'{header}<workbook xmlns="{_XLSX_MAIN}" xmlns:r="{_XLSX_REL}"><sheets>{sheets}</sheets></workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            f'{header}<Relationships xmlns="{_XLSX_PACKAGE_REL}">{relationships}'
+            f'<Relationship Id="rId{sheet_count + 1}" Type="{_XLSX_REL}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        ),
+        "_rels/.rels": (
+            f'{header}<Relationships xmlns="{_XLSX_PACKAGE_REL}">'
+            f'<Relationship Id="rId1" Type="{_XLSX_REL}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ),
+        "[Content_Types].xml": (
+            f'{header}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{overrides}</Types>'
+        ),
+    }
+
+
+def write_xlsx(batches: Iterator[List[ExportRow]]) -> Iterator[bytes]:
+    stream = _ZipStream()
+    archive = zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED)
+    sheet_count, sheet, sheet_rows = 0, None, 0
+
+    def next_sheet():
+        nonlocal sheet_count, sheet_rows
+        if sheet is not None:
+            sheet.write(_XLSX_SHEET_END.encode())
+            sheet.close()
+        sheet_count += 1
+        sheet_rows = 0
+        opened = archive.open(f"xl/worksheets/sheet{sheet_count}.xml", "w", force_zip64=True)
+        opened.write(_XLSX_SHEET_START.encode())
+        return opened
+
+    sheet = next_sheet()
+    for batch in batches:
+        parts = []
+        for row in batch:
+            if sheet_rows == XLSX_MAX_ROWS:
+                sheet.write("".join(parts).encode("utf-8"))
+                parts = []
+                sheet = next_sheet()
+            parts.append("<row>" + "".join(_xlsx_cell(value) for value in _columns(row)) + "</row>")
+            sheet_rows += 1
+        sheet.write("".join(parts).encode("utf-8"))
+        yield stream.drain()
+
+    sheet.write(_XLSX_SHEET_END.encode())
+    sheet.close()
+    for name, content in _xlsx_package(sheet_count).items():
+        archive.writestr(name, content)
+    archive.close()
+    yield stream.drain()
+
+
+# MS Project XML
+
+_MSP_NAMESPACE = "http://schemas.microsoft.com/project"
+_MSP_KIND_CODES = {"activity": 1, "topic": 2, "subtask": 3}
+_MSP_DEFAULT_CALENDAR_UID = 1
+# Working hours of a working day: 08:00-12:00, 13:00-17:00
+_MSP_HOURS_PER_DAY = 8
+_MSP_WORKING_TIMES = (
+    "<WorkingTimes>"
+    "<WorkingTime><FromTime>08:00:00</FromTime><ToTime>12:00:00</ToTime></WorkingTime>"
+    "<WorkingTime><FromTime>13:00:00</FromTime><ToTime>17:00:00</ToTime></WorkingTime>"
+    "</WorkingTimes>"
+)
+
+
+def msp_task_uid(kind: str, id_: int) -> int:
+    """Task UID unique across activities, topics and subtasks."""
+    return id_ * 4 + _MSP_KIND_CODES[kind]
+
+
+def msp_calendar_uid(calendar_id: Optional[int]) -> int:
+    return _MSP_DEFAULT_CALENDAR_UID if calendar_id is None else calendar_id + 1
+
+
+def _msp_calendar(uid: int, name: str, calendar: CompiledCalendar) -> str:
+    # DayType 1 is Sunday; weekmask starts on Monday
+    week_days = "".join(
+        f"<WeekDay><DayType>{day_type}</DayType><DayWorking>1</DayWorking>{_MSP_WORKING_TIMES}</WeekDay>"
+        if calendar.weekmask[(day_type - 2) % 7] == "1"
+        else f"<WeekDay><DayType>{day_type}</DayType><DayWorking>0</DayWorking></WeekDay>"
+        for day_type in range(1, 8)
+    )
+    exceptions = "".join(
+        f"<Exception><EnteredByOccurrences>0</EnteredByOccurrences><TimePeriod>"
+        f"<FromDate>{day.isoformat()}T00:00:00</FromDate><ToDate>{day.isoformat()}T23:59:00</ToDate>"
+        f"</TimePeriod><Occurrences>1</Occurrences><Name>{day.isoformat()}</Name>"
+        f"<Type>1</Type><DayWorking>0</DayWorking></Exception>"
+        for day in calendar.holidays
+    )
+    return (
+        f"<Calendar><UID>{uid}</UID><Name>{_xml_text(name)}</Name><IsBaseCalendar>1</IsBaseCalendar>"
+        f"<WeekDays>{week_days}</WeekDays><Exceptions>{exceptions}</Exceptions></Calendar>"
+    )
+
+
+def _msp_task(
+    uid: int, row_id: int, name: str, level: int, calendar_uid: int,
+    start: Optional[date] = None, end: Optional[date] = None,
+    working_days: int = 0, percent: int = 0, summary: bool = False,
+) -> str:
+    parts = [
+        f"<Task><UID>{uid}</UID><ID>{row_id}</ID><Name>{_xml_text(name)}</Name>",
+        f"<OutlineLevel>{level}</OutlineLevel><Summary>{int(summary)}</Summary>",
+    ]
+    if start is not None:
+        parts.append(
+            f"<Start>{start.isoformat()}T08:00:00</Start><Finish>{end.isoformat()}T17:00:00</Finish>"
+        )
+    if not summary:
+        parts.append(
+            f"<Duration>PT{working_days * _MSP_HOURS_PER_DAY}H0M0S</Duration><DurationFormat>7</DurationFormat>"
+            f"<Manual>1</Manual><PercentComplete>{percent}</PercentComplete>"
+        )
+    parts.append(f"<CalendarUID>{calendar_uid}</CalendarUID></Task>")
+    return "".join(parts)
+
+
+def write_msp_xml(session: Session, filters: ExportFilters, title: str) -> Iterator[bytes]:
+    """MSPDI document; activities and topics become summary tasks."""
+    calendar_ids = session.execute(export_calendar_ids_statement(filters)).scalars().all()
+    calendars = [_msp_calendar(_MSP_DEFAULT_CALENDAR_UID, "Standart", calendar_cache.default)]
+    for calendar_id in sorted(c for c in calendar_ids if c is not None):
+        calendars.append(_msp_calendar(
+            msp_calendar_uid(calendar_id), f"Takvim {calendar_id}", calendar_cache.get(session, calendar_id)
+        ))
+    project_calendar = msp_calendar_uid(calendar_ids[0]) if len(calendar_ids) == 1 else _MSP_DEFAULT_CALENDAR_UID
+
+    yield (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Project xmlns="{_MSP_NAMESPACE}">'
+        f"<SaveVersion>14</SaveVersion><Name>{_xml_text(title)}</Name><Title>{_xml_text(title)}</Title>"
+        f"<ScheduleFromStart>1</ScheduleFromStart><CalendarUID>{project_calendar}</CalendarUID>"
+        f"<MinutesPerDay>{_MSP_HOURS_PER_DAY * 60}</MinutesPerDay><DefaultStartTime>08:00:00</DefaultStartTime>"
+        f"<DefaultFinishTime>17:00:00</DefaultFinishTime>"
+        f"<Calendars>{''.join(calendars)}</Calendars>\n<Tasks>\n"
+    ).encode("utf-8")
+
+    resources: Dict[int, Tuple[str, str]] = {}
+    current_activity = current_topic = None
+    row_id = 0
+    for batch in export_batches(session, filters):
+        parts = []
+        for row in batch:
+            calendar_uid = msp_calendar_uid(row.calendar_id)
+            if row.activity_id != current_activity:
+                current_activity, current_topic = row.activity_id, None
+                row_id += 1
+                parts.append(_msp_task(msp_task_uid("activity", row.activity_id), row_id, row.activity, 1,
+                                       calendar_uid, row.activity_start, row.activity_end, summary=True))
+            if row.topic_id != current_topic:
+                current_topic = row.topic_id
+                row_id += 1
+                parts.append(_msp_task(msp_task_uid("topic", row.topic_id), row_id, row.topic, 2,
+                                       calendar_uid, summary=True))
+            row_id += 1
+            parts.append(_msp_task(msp_task_uid("subtask", row.subtask_id), row_id, row.title, 3, calendar_uid,
+                                   row.start_date, row.end_date, row.working_days, row.progress_percent))
+            if row.assignee_id is not None:
+                resources[row.assignee_id] = (row.assignee, row.assignee_email)
+        yield ("\n".join(parts) + "\n").encode("utf-8")
+
+    # Bounded by the number of users, not subtasks
+    yield ("</Tasks>\n<Resources>" + "".join(
+        f"<Resource><UID>{user_id}</UID><ID>{index}</ID><Name>{_xml_text(name)}</Name><Type>1</Type>"
+        f"<EmailAddress>{_xml_text(email)}</EmailAddress></Resource>"
+        for index, (user_id, (name, email)) in enumerate(sorted(resources.items()), 1)
+    ) + "</Resources>\n<Assignments>\n").encode("utf-8")
+
+    result = session.execute(export_assignments_statement(filters).execution_options(yield_per=FETCH_SIZE))
+    try:
+        for partition in result.partitions():
+            yield "".join(
+                f"<Assignment><UID>{subtask_id}</UID><TaskUID>{msp_task_uid('subtask', subtask_id)}</TaskUID>"
+                f"<ResourceUID>{assignee_id}</ResourceUID><Units>1</Units></Assignment>\n"
+                for subtask_id, assignee_id in partition
+            ).encode("utf-8")
+    finally:
+        result.close()
+    yield b"</Assignments>\n</Project>\n"
+
+
+# Format → (mimetype, gzip transfer encoding worthwhile)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", True),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", False),
+    "xml": ("application/xml", True),
+}
+
+
+def export_subtasks(session: Session, filters: ExportFilters, fmt: str, title: str) -> Iterator[bytes]:
+    """Byte chunks of an export in the given format (see EXPORT_FORMATS)."""
+    if fmt == "xml":
+        return write_msp_xml(session, filters, title)
+    if fmt == "xlsx":
+        return write_xlsx(export_batches(session, filters))
+    return write_csv(export_batches(session, filters))
@@ -2,7 +2,58 @@
 """
 Gantt chart business logic.
 """
-from datetime import date
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import selectinload
+
+from ..models import Activity, SubTask, SubTaskStatus, Topic
+from .calendar_service import CompiledCalendar, calendar_cache
+from .workload_service import date_ordinals, interval_histogram
+
+# numpy is imported lazily, as in workload_service
+if TYPE_CHECKING:
+    import numpy as np
+
+# Header column widths in pixels, mirrors GanttTimeline.vue
+COLUMN_WIDTHS = {
+    "day": 40,
+    "week": 80,
+    "month": 120,
+}
+
+SCALES = tuple(COLUMN_WIDTHS.keys())
+
+# Month names per locale: (short, long)
+MONTH_NAMES = {
+    "tr": (
+        ("Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara"),
+        ("Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran",
+         "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"),
+    ),
+    "en": (
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        ("January", "February", "March", "April", "May", "June",
+         "July", "August", "September", "October", "November", "December"),
+    ),
+}
+
+DEFAULT_LOCALE = "tr"
+
+# Bound for memoized timeline headers (per worker)
+TIMELINE_CACHE_SIZE = 256
+
+# Level-of-detail modes for the Gantt endpoint
+LOD_MODES = ("full", "auto", "binned")
+
+# Scales at which "auto" level-of-detail switches to binned aggregates
+COARSE_SCALES = ("month",)
+
+_STATUS_CODES = {status: code for code, status in enumerate(SubTaskStatus)}
 
 
 def calculate_scale(start_date: date, end_date: date) -> str:
@@ -31,16 +82,17 @@ def calculate_scale(start_date: date, end_date: date) -> str:
         return "month"
 
 
-def get_date_range_info(start_date: date, end_date: date) -> dict:
+def get_date_range_info(start_date: date, end_date: date, calendar: Optional[CompiledCalendar] = None) -> dict:
     """
     Get detailed information about a date range.
 
     Args:
         start_date: Start date
         end_date: End date
+        calendar: Working-day calendar (default Monday-Friday)
 
     Returns:
-        Dictionary with days, weeks, months count
+        Dictionary with days, weeks, months and working days count
     """
     total_days = (end_date - start_date).days + 1
     total_weeks = total_days / 7
@@ -50,5 +102,297 @@ def get_date_range_info(start_date: date, end_date: date) -> dict:
         "total_days": total_days,
         "total_weeks": round(total_weeks, 1),
         "total_months": round(total_months, 1),
+        "working_days": (calendar or calendar_cache.default).working_days_between(start_date, end_date),
     }
 
+
+def subtask_dicts(
+    subtasks: Sequence[SubTask], calendar: CompiledCalendar, include_assignee: bool = True
+) -> List[dict]:
+    """Serialized subtasks with their working-day durations."""
+    result = [st.to_dict(include_assignee=include_assignee) for st in subtasks]
+    for data, working_days in zip(result, calendar.subtask_working_days(subtasks)):
+        data["working_days"] = working_days
+    return result
+
+
+def activity_dict(activity: Activity, calendar: CompiledCalendar) -> dict:
+    """Serialized activity (with owner) and its working-day duration."""
+    data = activity.to_dict(include_owner=True)
+    data["working_days"] = calendar.working_days_between(activity.start_date, activity.end_date)
+    return data
+
+
+def _first_of_next_month(day: date) -> date:
+    """Return the first day of the month after the given date."""
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def timeline_columns(start_date: date, end_date: date, scale: str) -> int:
+    """Number of timeline columns for a range, without building them."""
+    if scale == "day":
+        return (end_date - start_date).days + 1
+    if scale == "week":
+        return -(-((end_date - start_date).days + 1) // 7)
+    return (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+
+
+def compute_timeline(start_date: date, end_date: date, scale: str, locale: str = DEFAULT_LOCALE) -> dict:
+    """
+    Build the complete timeline header model for a date range.
+
+    Columns follow the same rules as GanttTimeline.vue:
+    - day: one column per day, month name on the first of the month
+    - week: 7-day blocks starting at start_date
+    - month: one column per calendar month
+
+    Not cached; build_timeline is the memoized version for activity ranges.
+
+    Args:
+        start_date: Range start date
+        end_date: Range end date
+        scale: "day", "week" or "month"
+        locale: Month name locale ("tr" or "en")
+
+    Returns:
+        Dictionary with ticks, month boundaries and total width in pixels
+    """
+    if locale not in MONTH_NAMES:
+        locale = DEFAULT_LOCALE
+    short_names, long_names = MONTH_NAMES[locale]
+    width = COLUMN_WIDTHS[scale]
+    total_days = (end_date - start_date).days + 1
+    ticks = []
+
+    if scale == "day":
+        for i in range(total_days):
+            day = start_date + timedelta(days=i)
+            ticks.append({
+                "date": day.isoformat(),
+                "label": str(day.day),
+                "sub_label": short_names[day.month - 1] if day.day == 1 else None,
+                "week_number": day.isocalendar()[1],
+                "offset": i * width,
+                "width": width,
+            })
+        px_per_day = float(width)
+    elif scale == "week":
+        for i, offset_days in enumerate(range(0, total_days, 7)):
+            week_start = start_date + timedelta(days=offset_days)
+            display_end = min(week_start + timedelta(days=6), end_date)
+            ticks.append({
+                "date": week_start.isoformat(),
+                "label": f"{week_start.day}-{display_end.day}",
+                "sub_label": short_names[week_start.month - 1],
+                "week_number": week_start.isocalendar()[1],
+                "offset": i * width,
+                "width": width,
+            })
+        px_per_day = width / 7
+    else:
+        current = start_date
+        i = 0
+        while current <= end_date:
+            ticks.append({
+                "date": current.isoformat(),
+                "label": long_names[current.month - 1],
+                "sub_label": str(current.year),
+                "week_number": current.isocalendar()[1],
+                "offset": i * width,
+                "width": width,
+            })
+            current = _first_of_next_month(current)
+            i += 1
+        px_per_day = None
+
+    # Month boundaries (first day of each month inside the range)
+    month_boundaries = []
+    boundary = _first_of_next_month(start_date)
+    i = 1
+    while boundary <= end_date:
+        if px_per_day is None:
+            offset = i * width
+        else:
+            offset = round((boundary - start_date).days * px_per_day, 2)
+        month_boundaries.append({"date": boundary.isoformat(), "offset": offset})
+        boundary = _first_of_next_month(boundary)
+        i += 1
+
+    return {
+        "scale": scale,
+        "locale": locale,
+        "column_width": width,
+        "total_width": len(ticks) * width,
+        "ticks": ticks,
+        "month_boundaries": month_boundaries,
+    }
+
+
+# Memoized per (start_date, end_date, scale, locale) with a bounded LRU and
+# shared between requests, so callers must not mutate the result. Only for
+# stored activity ranges: arbitrary client windows would churn the cache.
+build_timeline = lru_cache(maxsize=TIMELINE_CACHE_SIZE)(compute_timeline)
+
+
+def use_binned_lod(lod: str, scale: str) -> bool:
+    """Decide whether a Gantt request should return binned aggregates."""
+    return lod == "binned" or (lod == "auto" and scale in COARSE_SCALES)
+
+
+def bin_subtasks(
+    rows: Sequence[Tuple[int, date, date, int, SubTaskStatus]],
+    bucket_starts: List[date],
+    range_end: date,
+    today: date
+) -> dict:
+    """
+    Aggregate subtasks per topic and timeline bucket.
+
+    Bucket i covers [bucket_starts[i], bucket_starts[i + 1]) and the last one
+    ends at range_end. A subtask is active in every bucket its interval
+    touches. Counts, progress sums and overdue counts are accumulated with
+    difference arrays, so the cost is linear in the number of subtasks.
+
+    Args:
+        rows: (topic_id, start_date, end_date, progress_percent, status) tuples
+        bucket_starts: First day of each bucket, ascending
+        range_end: Last day of the last bucket
+        today: Reference date for effective OVERDUE status
+
+    Returns:
+        Dictionary with topic ids and per topic/bucket matrices for active
+        task count, mean progress (None when empty) and overdue count
+    """
+    import numpy as np
+    n_buckets = len(bucket_starts)
+    empty = {"topic_ids": [], "active": [], "mean_progress": [], "overdue": []}
+    if not rows or not n_buckets:
+        return empty
+
+    count = len(rows)
+    edges = date_ordinals(bucket_starts, n_buckets)
+    topics = np.fromiter((r[0] for r in rows), dtype=np.int64, count=count)
+    starts = date_ordinals((r[1] for r in rows), count)
+    ends = date_ordinals((r[2] for r in rows), count)
+    progress = np.fromiter((r[3] for r in rows), dtype=np.float64, count=count)
+    statuses = np.fromiter((_STATUS_CODES[r[4]] for r in rows), dtype=np.int64, count=count)
+
+    # Same rules as SubTask.to_dict() effective status
+    completed = (progress == 100) | (statuses == _STATUS_CODES[SubTaskStatus.COMPLETED])
+    overdue = ~completed & (
+        (ends < today.toordinal()) | (statuses == _STATUS_CODES[SubTaskStatus.OVERDUE])
+    )
+
+    valid = (ends >= edges[0]) & (starts <= range_end.toordinal())
+    if not valid.any():
+        return empty
+
+    topic_ids, group_index = np.unique(topics[valid], return_inverse=True)
+    start_buckets = np.clip(np.searchsorted(edges, starts[valid], side="right") - 1, 0, n_buckets - 1)
+    end_buckets = np.clip(np.searchsorted(edges, ends[valid], side="right") - 1, 0, n_buckets - 1)
+    n_groups = len(topic_ids)
+
+    active = interval_histogram(group_index, start_buckets, end_buckets, n_groups, n_buckets)
+    progress_sum = interval_histogram(
+        group_index, start_buckets, end_buckets, n_groups, n_buckets, weights=progress[valid]
+    )
+    overdue_count = interval_histogram(
+        group_index, start_buckets, end_buckets, n_groups, n_buckets,
+        weights=overdue[valid].astype(np.float64)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_progress = np.round(progress_sum / active, 1)
+
+    return {
+        "topic_ids": topic_ids.tolist(),
+        "active": active.tolist(),
+        "mean_progress": [
+            [None if n == 0 else float(p) for n, p in zip(active_row, progress_row)]
+            for active_row, progress_row in zip(active, mean_progress)
+        ],
+        "overdue": np.rint(overdue_count).astype(np.int64).tolist(),
+    }
+
+
+# Query building and response assembly shared by the Flask route and the
+# asyncio read path (app/asgi.py)
+
+def parse_gantt_params(args: Mapping[str, str]) -> Tuple[Optional[str], str, str]:
+    """
+    Validate the Gantt query parameters.
+
+    Returns:
+        (scale override or None, locale, lod)
+
+    Raises:
+        ValueError: With the API error message for an invalid value
+    """
+    timeline_scale = args.get("scale")
+    if timeline_scale and timeline_scale not in SCALES:
+        raise ValueError("Geçersiz ölçek değeri")
+    locale = args.get("locale", DEFAULT_LOCALE)
+    if locale not in MONTH_NAMES:
+        locale = DEFAULT_LOCALE
+    lod = args.get("lod", "full")
+    if lod not in LOD_MODES:
+        raise ValueError("Geçersiz lod değeri")
+    return timeline_scale or None, locale, lod
+
+
+def gantt_topics_statement(activity_id: int) -> Select:
+    return select(Topic).where(Topic.activity_id == activity_id)
+
+
+def gantt_subtasks_statement(topic_ids: List[int]) -> Select:
+    """Subtasks with their assignees for the full level of detail."""
+    return select(SubTask).options(selectinload(SubTask.assignee)).where(
+        SubTask.topic_id.in_(topic_ids)
+    ).order_by(SubTask.start_date)
+
+
+def gantt_bin_rows_statement(topic_ids: List[int]) -> Select:
+    """Plain tuples only, no ORM objects, for binned views."""
+    return select(
+        SubTask.topic_id,
+        SubTask.start_date,
+        SubTask.end_date,
+        SubTask.progress_percent,
+        SubTask.status
+    ).where(SubTask.topic_id.in_(topic_ids))
+
+
+def gantt_bins(rows: Sequence[tuple], timeline: dict, activity: Activity) -> dict:
+    """Binned aggregates over the timeline ticks."""
+    bucket_starts = [date.fromisoformat(t["date"]) for t in timeline["ticks"]]
+    bins = bin_subtasks(rows, bucket_starts, activity.end_date, date.today())
+    bins["buckets"] = [t["date"] for t in timeline["ticks"]]
+    return bins
+
+
+def gantt_payload(
+    activity: Activity,
+    topics: List[Topic],
+    subtasks: List[SubTask],
+    scale: str,
+    timeline: dict,
+    bins: Optional[dict],
+    cursor: int,
+    calendar: CompiledCalendar
+) -> dict:
+    """Full Gantt response body; activity.owner and assignees must be loaded."""
+    response = {
+        "activity": activity_dict(activity, calendar),
+        "topics": [t.to_dict() for t in topics],
+        "subtasks": subtask_dicts(subtasks, calendar),
+        "scale": scale,
+        "timeline": timeline,
+        "lod": "binned" if bins is not None else "full",
+        "cursor": cursor,
+        "today": date.today().isoformat()
+    }
+    if bins is not None:
+        response["bins"] = bins
+    return response
@@ -6,7 +6,12 @@ Handles creation and management of user notifications.
 from typing import Optional, List
 from datetime import datetime
 
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import joinedload
+
 from ..db import db
+from ..metrics import NOTIFICATIONS_CREATED
+from ..tracing import traced
 from ..models import Notification, User, Activity, SubTask, NotificationType
 
 
@@ -14,6 +19,7 @@ class NotificationService:
     """Service class for notification operations."""
 
     @staticmethod
+    @traced("notification.create")
     def create_notification(
         notification_type: str,
         message: str,
@@ -46,6 +52,7 @@ class NotificationService:
         )
         db.session.add(notification)
         db.session.commit()
+        NOTIFICATIONS_CREATED.labels(notification_type).inc()
         return notification
 
     @staticmethod
@@ -65,20 +72,36 @@ class NotificationService:
         Returns:
             List of Notification objects
         """
-        query = db.session.query(Notification).filter_by(target_user_id=user_id)
-        
+        return db.session.scalars(
+            NotificationService.notifications_statement(user_id, unread_only, limit)
+        ).all()
+
+    @staticmethod
+    def notifications_statement(user_id: int, unread_only: bool = False, limit: int = 50) -> Select:
+        """Newest notifications of a user (shared with the asyncio read path)."""
+        # Relations used by to_dict(include_relations=True) are loaded up front
+        stmt = select(Notification).options(
+            joinedload(Notification.created_by),
+            joinedload(Notification.activity),
+            joinedload(Notification.subtask)
+        ).where(Notification.target_user_id == user_id)
+
         if unread_only:
-            query = query.filter_by(is_read=False)
-        
-        return query.order_by(Notification.created_at.desc()).limit(limit).all()
+            stmt = stmt.where(Notification.is_read == False)  # noqa: E712
+
+        return stmt.order_by(Notification.created_at.desc()).limit(limit)
 
     @staticmethod
     def get_unread_count(user_id: int) -> int:
         """Get count of unread notifications for a user."""
-        return db.session.query(Notification).filter_by(
-            target_user_id=user_id,
-            is_read=False
-        ).count()
+        return db.session.scalar(NotificationService.unread_count_statement(user_id))
+
+    @staticmethod
+    def unread_count_statement(user_id: int) -> Select:
+        return select(func.count(Notification.id)).where(
+            Notification.target_user_id == user_id,
+            Notification.is_read == False  # noqa: E712
+        )
 
     @staticmethod
     def mark_as_read(notification_id: int, user_id: int) -> Optional[Notification]:
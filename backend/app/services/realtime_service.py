@@ -0,0 +1,281 @@
+# /backend/app/services/realtime_service.py
+"""
+Realtime Service - live Gantt change events per activity room.
+
+Routes publish compact change events after commit. With PostgreSQL the
+event goes through NOTIFY on a shared channel and a LISTEN thread in every
+worker process fans it out to that worker's WebSocket subscribers. The
+LISTEN connection bypasses PgBouncer via REALTIME_LISTEN_URL. Other
+dialects (SQLite for development and tests) dispatch in-process only.
+
+Subscribers of the flask-sock route block a thread on a queue.Queue; the
+ASGI route (app/asgi.py) gets a LoopQueue that is filled on its event
+loop, with one wake-up per message and loop rather than per subscriber.
+"""
+import asyncio
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import List, Optional
+
+from sqlalchemy import func, select as sa_select
+from sqlalchemy.engine import make_url
+
+from ..db import db
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "gantt_changes"
+
+# PostgreSQL NOTIFY payloads must stay below 8000 bytes
+MAX_NOTIFY_PAYLOAD = 7900
+
+# Events buffered per subscriber before it is considered too slow
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class LoopQueue:
+    """
+    Subscriber queue read on an asyncio event loop.
+
+    RealtimeHub.dispatch may run on any thread; it fills all LoopQueues of
+    one loop with a single call_soon_threadsafe wake-up per message.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.loop = loop
+        self.maxsize = maxsize
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def full(self) -> bool:
+        return self.queue.qsize() >= self.maxsize
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+def _fill_loop_queues(subscribers: List[LoopQueue], message: str) -> None:
+    # Runs on the subscribers' event loop
+    for subscriber in subscribers:
+        subscriber.queue.put_nowait(message)
+
+
+class RealtimeHub:
+    """In-process registry of subscriber queues per activity room."""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._rooms = defaultdict(set)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def subscribe(self, activity_id: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Register a new subscriber queue for an activity (a LoopQueue with loop)."""
+        if loop is not None:
+            subscriber = LoopQueue(loop, self.queue_size)
+        else:
+            subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._rooms[activity_id].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, activity_id: int, subscriber) -> None:
+        """Remove a subscriber queue."""
+        with self._lock:
+            room = self._rooms.get(activity_id)
+            if room is not None:
+                room.discard(subscriber)
+                if not room:
+                    del self._rooms[activity_id]
+
+    def dispatch(self, activity_id: int, message: str) -> int:
+        """
+        Deliver a message to every subscriber of an activity.
+
+        Returns:
+            Number of subscribers the message was queued for
+        """
+        with self._lock:
+            subscribers = list(self._rooms.get(activity_id, ()))
+
+        delivered = 0
+        by_loop = defaultdict(list)
+        for subscriber in subscribers:
+            try:
+                if isinstance(subscriber, LoopQueue):
+                    if subscriber.full():
+                        raise queue.Full
+                    by_loop[subscriber.loop].append(subscriber)
+                else:
+                    subscriber.put_nowait(message)
+                    delivered += 1
+            except queue.Full:
+                # Slow consumer; it can resync with the delta endpoint
+                self.dropped += 1
+
+        for loop, loop_subscribers in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_fill_loop_queues, loop_subscribers, message)
+                delivered += len(loop_subscribers)
+            except RuntimeError:
+                # Loop already closed (worker shutting down)
+                pass
+        return delivered
+
+    def subscriber_count(self, activity_id: Optional[int] = None) -> int:
+        """Number of subscribers for one activity or in total."""
+        with self._lock:
+            if activity_id is not None:
+                return len(self._rooms.get(activity_id, ()))
+            return sum(len(room) for room in self._rooms.values())
+
+
+class PgNotifyListener:
+    """Background thread that LISTENs on the change channel for one worker."""
+
+    def __init__(self, hub: RealtimeHub, dsn: str):
+        self.hub = hub
+        self.dsn = dsn
+        self._thread = threading.Thread(target=self._run, name="gantt-notify-listener", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        import psycopg2
+
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.set_session(autocommit=True)
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                while True:
+                    if select.select([conn], [], [], 5) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._handle(conn.notifies.pop(0).payload)
+            except Exception:
+                logger.exception("Gantt notify listener failed, reconnecting")
+                if conn is not None:
+                    conn.close()
+                time.sleep(1)
+
+    def _handle(self, payload: str) -> None:
+        try:
+            activity_id = json.loads(payload)["activity_id"]
+        except (ValueError, KeyError):
+            return
+        self.hub.dispatch(activity_id, payload)
+
+
+class RealtimeService:
+    """Service class for publishing and subscribing to Gantt change events."""
+
+    def __init__(self):
+        self.hub = RealtimeHub()
+        self.listen_url: Optional[str] = None
+        self._listener: Optional[PgNotifyListener] = None
+        self._listener_lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Read REALTIME_LISTEN_URL and warn when LISTEN would go through PgBouncer."""
+        self.listen_url = app.config.get("REALTIME_LISTEN_URL") or None
+        if (app.config["DB_PGBOUNCER"] and not self.listen_url
+                and make_url(app.config["SQLALCHEMY_DATABASE_URI"]).get_backend_name() == "postgresql"):
+            logger.warning(
+                "DB_PGBOUNCER is set without REALTIME_LISTEN_URL: LISTEN does not work through "
+                "transaction pooling and live Gantt updates will be lost; point "
+                "REALTIME_LISTEN_URL at PostgreSQL directly"
+            )
+
+    @staticmethod
+    def _use_pg_bridge() -> bool:
+        return db.engine.dialect.name == "postgresql"
+
+    def publish(
+        self,
+        activity_id: int,
+        entity: str,
+        op: str,
+        entity_id: int,
+        data: Optional[dict] = None,
+        change_seq: Optional[int] = None
+    ) -> None:
+        """
+        Publish a change event to an activity room.
+
+        Must be called after the change is committed.
+
+        Args:
+            activity_id: Activity room
+            entity: "topic" or "subtask"
+            op: "create", "update" or "delete"
+            entity_id: Changed row ID
+            data: Serialized row (omitted for deletes)
+            change_seq: Change sequence of the row, lets clients skip stale events
+        """
+        event = {
+            "type": "change",
+            "activity_id": activity_id,
+            "entity": entity,
+            "op": op,
+            "id": entity_id,
+            "seq": change_seq,
+        }
+        if data is not None:
+            event["data"] = data
+        message = json.dumps(event, separators=(",", ":"), default=str)
+
+        if not self._use_pg_bridge():
+            self.hub.dispatch(activity_id, message)
+            return
+
+        if len(message.encode("utf-8")) > MAX_NOTIFY_PAYLOAD:
+            # Too large for NOTIFY, clients fetch the row via delta sync
+            event.pop("data", None)
+            message = json.dumps(event, separators=(",", ":"))
+
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(sa_select(func.pg_notify(NOTIFY_CHANNEL, message)))
+                conn.commit()
+        except Exception:
+            # Live updates are best effort; the write itself already succeeded
+            logger.exception("Failed to publish Gantt change event")
+
+    def subscribe(self, activity_id: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Subscribe to an activity room, starting the LISTEN thread if needed.
+
+        Returns a queue.Queue, or a LoopQueue for a subscriber on the loop.
+        """
+        if self._use_pg_bridge():
+            self._ensure_listener()
+        return self.hub.subscribe(activity_id, loop)
+
+    def unsubscribe(self, activity_id: int, subscriber) -> None:
+        """Leave an activity room."""
+        self.hub.unsubscribe(activity_id, subscriber)
+
+    def _ensure_listener(self) -> None:
+        # Started lazily so each forked worker gets its own thread and connection
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                url = make_url(self.listen_url) if self.listen_url else db.engine.url
+                dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+                self._listener = PgNotifyListener(self.hub, dsn)
+                self._listener.start()
+
+
+# Singleton instance for convenience
+realtime_service = RealtimeService()
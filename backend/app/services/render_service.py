@@ -0,0 +1,455 @@
+# /backend/app/services/render_service.py
+"""
+Server-side Gantt rendering (SVG and PDF) for printable exports.
+
+Subtask rows are read with yield_per and drawn as they arrive, so memory
+stays flat however large the activity is: only a row count is queried up
+front (it fixes the SVG height and the PDF page count). Both formats share
+one layout and the drawing functions below and differ only in the canvas
+they draw on:
+    - SVG: one tall document, written out every CHUNK_ROWS rows
+    - PDF: A3 landscape pages with a repeated timeline header, written page
+      by page; the page tree and cross-reference table follow at the end
+Bars are placed linearly in days as in GanttTaskBar.vue and coloured by
+effective status with the same palette.
+"""
+import math
+import zlib
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from sqlalchemy import Select, distinct, func, select
+from sqlalchemy.orm import Session
+
+from ..models import Activity, SubTask, SubTaskStatus, Topic, effective_status
+from .gantt_service import calculate_scale, compute_timeline, timeline_columns
+
+# Bar colour and opacity per effective status, mirrors GanttTaskBar.vue
+STATUS_COLORS = {
+    SubTaskStatus.PLANNED: ("#38bdf8", 1.0),      # sky-400
+    SubTaskStatus.IN_PROGRESS: ("#3b82f6", 1.0),  # blue-500
+    SubTaskStatus.COMPLETED: ("#10b981", 0.7),    # emerald-500
+    SubTaskStatus.OVERDUE: ("#f43f5e", 1.0),      # rose-500
+}
+TEXT_COLOR = "#334155"        # slate-700
+MUTED_COLOR = "#64748b"       # slate-500
+GRID_COLOR = "#e2e8f0"        # slate-200
+HEADER_BACKGROUND = "#f8fafc"  # slate-50
+TOPIC_BACKGROUND = "#f1f5f9"  # slate-100
+TODAY_COLOR = "#ef4444"       # red-500
+
+LABEL_WIDTH = 260
+ROW_HEIGHT = 22
+HEADER_HEIGHT = 40
+BAR_PADDING = 5
+FONT_SIZE = 10
+# Average Helvetica glyph width per point of font size, for truncating labels
+CHAR_WIDTH = 0.55
+
+# Rows drawn between two streamed SVG chunks
+CHUNK_ROWS = 200
+# Rows fetched per database round trip
+FETCH_SIZE = 1000
+# Timeline columns per chart: about 5 years by day, 38 by week, 166 by month
+MAX_RENDER_COLUMNS = 2000
+
+# A3 landscape in points
+PDF_PAGE_SIZE = (1190.55, 841.89)
+PDF_MARGIN = 28
+
+# Row: (kind, title, start_date, end_date, effective status)
+Row = Tuple[str, str, Optional[date], Optional[date], Optional[SubTaskStatus]]
+
+
+def render_rows_statement(activity_id: int, window_start: date, window_end: date) -> Select:
+    """Plain tuples in chart order (topic, then start date) for the window."""
+    return (
+        select(Topic.id, Topic.title, SubTask.title, SubTask.start_date, SubTask.end_date,
+               SubTask.status, SubTask.progress_percent)
+        .join(Topic, SubTask.topic_id == Topic.id)
+        .where(Topic.activity_id == activity_id,
+               SubTask.end_date >= window_start, SubTask.start_date <= window_end)
+        .order_by(Topic.id, SubTask.start_date, SubTask.id)
+    )
+
+
+def render_count_statement(activity_id: int, window_start: date, window_end: date) -> Select:
+    """(subtask count, topic count) of render_rows_statement."""
+    return (
+        select(func.count(SubTask.id), func.count(distinct(SubTask.topic_id)))
+        .join(Topic, SubTask.topic_id == Topic.id)
+        .where(Topic.activity_id == activity_id,
+               SubTask.end_date >= window_start, SubTask.start_date <= window_end)
+    )
+
+
+def chart_rows(session: Session, stmt: Select, limit: int) -> Iterator[Row]:
+    """
+    Topic header and subtask rows, streamed; at most `limit` rows so rows
+    added after counting cannot overflow the drawing.
+    """
+    today = date.today()
+    current_topic = None
+    emitted = 0
+    result = session.execute(stmt.execution_options(yield_per=FETCH_SIZE))
+    try:
+        for topic_id, topic_title, title, start_date, end_date, status, progress in result:
+            if topic_id != current_topic:
+                if emitted >= limit:
+                    break
+                current_topic = topic_id
+                yield ("topic", topic_title, None, None, None)
+                emitted += 1
+            if emitted >= limit:
+                break
+            yield ("subtask", title, start_date, end_date, effective_status(status, progress, end_date, today))
+            emitted += 1
+    finally:
+        result.close()
+
+
+def fit_text(text: str, width: float, size: float = FONT_SIZE) -> str:
+    """Truncate text with an ellipsis to roughly fit a width."""
+    max_chars = max(1, int(width / (size * CHAR_WIDTH)))
+    return text if len(text) <= max_chars else text[:max_chars - 1] + "…"
+
+
+@dataclass
+class ChartLayout:
+    """Horizontal geometry of a chart: label column, then the timeline."""
+    title: str
+    start: date
+    end: date
+    timeline: dict
+    timeline_width: float
+
+    @property
+    def width(self) -> float:
+        return LABEL_WIDTH + self.timeline_width
+
+    @property
+    def px_per_day(self) -> float:
+        return self.timeline_width / ((self.end - self.start).days + 1)
+
+    def x(self, day: date) -> float:
+        """Left edge of a day."""
+        return LABEL_WIDTH + (day - self.start).days * self.px_per_day
+
+    def bar(self, start: date, end: date) -> Tuple[float, float]:
+        """(x, width) of a bar clipped to the window."""
+        start, end = max(start, self.start), min(end, self.end)
+        return self.x(start), max(((end - start).days + 1) * self.px_per_day, 2.0)
+
+    def columns(self) -> List[Tuple[float, float, dict]]:
+        """(x, width, tick) per timeline column, placed by date like the bars."""
+        ticks = self.timeline["ticks"]
+        edges = [max(date.fromisoformat(t["date"]), self.start) for t in ticks] + [self.end + timedelta(days=1)]
+        return [
+            (self.x(edges[i]), (edges[i + 1] - edges[i]).days * self.px_per_day, tick)
+            for i, tick in enumerate(ticks)
+        ]
+
+
+def draw_header(canvas, layout: ChartLayout) -> None:
+    """Activity title and timeline labels in the top HEADER_HEIGHT band."""
+    canvas.rect(0, 0, layout.width, HEADER_HEIGHT, HEADER_BACKGROUND)
+    canvas.text(8, 17, fit_text(layout.title, LABEL_WIDTH - 16, FONT_SIZE + 1), bold=True, size=FONT_SIZE + 1)
+    canvas.text(8, 32, f"{layout.start.isoformat()} – {layout.end.isoformat()}", color=MUTED_COLOR)
+    for x, width, tick in layout.columns():
+        canvas.line(x, 0, x, HEADER_HEIGHT, GRID_COLOR)
+        if tick["sub_label"] and width >= len(tick["sub_label"]) * FONT_SIZE * CHAR_WIDTH:
+            canvas.text(x + 3, 16, tick["sub_label"], color=MUTED_COLOR)
+        if width >= len(tick["label"]) * FONT_SIZE * CHAR_WIDTH + 4:
+            canvas.text(x + 3, 32, tick["label"])
+    canvas.line(0, HEADER_HEIGHT, layout.width, HEADER_HEIGHT, GRID_COLOR)
+
+
+def draw_grid(canvas, layout: ChartLayout, bottom: float) -> None:
+    """Column separators and the label column edge, drawn behind the rows."""
+    for x, _, _ in layout.columns():
+        canvas.line(x, HEADER_HEIGHT, x, bottom, GRID_COLOR)
+    canvas.line(LABEL_WIDTH, HEADER_HEIGHT, LABEL_WIDTH, bottom, GRID_COLOR)
+
+
+def draw_row(canvas, layout: ChartLayout, y: float, row: Row) -> None:
+    kind, title, start_date, end_date, status = row
+    if kind == "topic":
+        canvas.rect(0, y, layout.width, ROW_HEIGHT, TOPIC_BACKGROUND)
+        canvas.text(8, y + 15, fit_text(title, LABEL_WIDTH - 16), bold=True)
+        return
+    canvas.text(18, y + 15, fit_text(title, LABEL_WIDTH - 26))
+    x, width = layout.bar(start_date, end_date)
+    color, opacity = STATUS_COLORS.get(status, ("#94a3b8", 1.0))
+    canvas.rect(x, y + BAR_PADDING, width, ROW_HEIGHT - 2 * BAR_PADDING, color, opacity)
+    canvas.line(0, y + ROW_HEIGHT, layout.width, y + ROW_HEIGHT, GRID_COLOR)
+
+
+def draw_today(canvas, layout: ChartLayout, bottom: float) -> None:
+    today = date.today()
+    if layout.start <= today <= layout.end:
+        x = layout.x(today) + layout.px_per_day / 2
+        canvas.line(x, HEADER_HEIGHT, x, bottom, TODAY_COLOR, width=1.5)
+
+
+def _number(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+class SvgCanvas:
+    """Collects SVG elements until flushed."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+
+    def rect(self, x, y, width, height, fill, opacity=1.0) -> None:
+        extra = f' fill-opacity="{opacity}"' if opacity < 1 else ""
+        self.parts.append(
+            f'<rect x="{_number(x)}" y="{_number(y)}" width="{_number(width)}" '
+            f'height="{_number(height)}" fill="{fill}"{extra}/>'
+        )
+
+    def line(self, x1, y1, x2, y2, stroke, width=1.0) -> None:
+        self.parts.append(
+            f'<line x1="{_number(x1)}" y1="{_number(y1)}" x2="{_number(x2)}" y2="{_number(y2)}" '
+            f'stroke="{stroke}" stroke-width="{width}"/>'
+        )
+
+    def text(self, x, y, value, bold=False, size=FONT_SIZE, color=TEXT_COLOR) -> None:
+        attrs = f' font-weight="bold"' if bold else ""
+        if size != FONT_SIZE:
+            attrs += f' font-size="{size}"'
+        self.parts.append(
+            f'<text x="{_number(x)}" y="{_number(y)}" fill="{color}"{attrs}>{escape(value)}</text>'
+        )
+
+    def flush(self) -> str:
+        chunk = "\n".join(self.parts) + "\n"
+        self.parts.clear()
+        return chunk
+
+
+def render_svg(layout: ChartLayout, rows: Iterator[Row], row_count: int) -> Iterator[str]:
+    height = HEADER_HEIGHT + row_count * ROW_HEIGHT
+    canvas = SvgCanvas()
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{_number(layout.width)}" height="{height}" '
+        f'viewBox="0 0 {_number(layout.width)} {height}" '
+        f'font-family="Helvetica, Arial, sans-serif" font-size="{FONT_SIZE}">\n'
+        f'<title>{escape(layout.title)}</title>\n'
+        f'<rect width="100%" height="100%" fill="#ffffff"/>\n'
+    )
+    draw_header(canvas, layout)
+    draw_grid(canvas, layout, height)
+    yield canvas.flush()
+
+    y = HEADER_HEIGHT
+    for index, row in enumerate(rows, 1):
+        draw_row(canvas, layout, y, row)
+        y += ROW_HEIGHT
+        if index % CHUNK_ROWS == 0:
+            yield canvas.flush()
+
+    draw_today(canvas, layout, height)
+    yield canvas.flush() + "</svg>\n"
+
+
+# Standard Helvetica with the Turkish letters of cp1254 mapped in
+_PDF_ENCODING = (
+    b"<< /Type /Encoding /BaseEncoding /WinAnsiEncoding "
+    b"/Differences [208 /Gbreve 221 /Idotaccent 222 /Scedilla 240 /gbreve 253 /dotlessi 254 /scedilla] >>"
+)
+_PDF_CATALOG, _PDF_PAGES, _PDF_FONT, _PDF_FONT_BOLD, _PDF_INFO = 1, 2, 3, 4, 5
+
+
+def _pdf_color(hex_color: str, opacity: float = 1.0) -> str:
+    """PDF rgb components, opacity blended over white (no transparency groups needed)."""
+    rgb = [int(hex_color[i:i + 2], 16) / 255 for i in (1, 3, 5)]
+    return " ".join(_number(c * opacity + 1 - opacity) for c in rgb)
+
+
+def _pdf_string(value: str) -> bytes:
+    raw = value.encode("cp1254", errors="replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+class PdfCanvas:
+    """Content stream of one page; layout units are points, y grows downwards."""
+
+    def __init__(self, page_height: float):
+        # Flip the y axis so the shared drawing code works unchanged
+        self.ops: List[bytes] = [
+            f"1 0 0 -1 {PDF_MARGIN} {_number(page_height - PDF_MARGIN)} cm".encode()
+        ]
+
+    def rect(self, x, y, width, height, fill, opacity=1.0) -> None:
+        self.ops.append(
+            f"{_pdf_color(fill, opacity)} rg {_number(x)} {_number(y)} {_number(width)} {_number(height)} re f".encode()
+        )
+
+    def line(self, x1, y1, x2, y2, stroke, width=1.0) -> None:
+        self.ops.append(
+            f"{_pdf_color(stroke)} RG {_number(width)} w {_number(x1)} {_number(y1)} m "
+            f"{_number(x2)} {_number(y2)} l S".encode()
+        )
+
+    def text(self, x, y, value, bold=False, size=FONT_SIZE, color=TEXT_COLOR) -> None:
+        # The text matrix flips glyphs back upright
+        self.ops.append(
+            f"BT /{'F2' if bold else 'F1'} {size} Tf {_pdf_color(color)} rg 1 0 0 -1 {_number(x)} {_number(y)} Tm ".encode()
+            + _pdf_string(value) + b" Tj ET"
+        )
+
+    def content(self) -> bytes:
+        return zlib.compress(b"\n".join(self.ops))
+
+
+class PdfWriter:
+    """Minimal PDF 1.4 writer emitting objects as soon as they are complete."""
+
+    def __init__(self):
+        self.offset = 0
+        self.offsets = {}
+        self.next_id = _PDF_INFO + 1
+        self.page_ids: List[int] = []
+
+    def _out(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
+
+    def _object(self, object_id: int, body: bytes) -> bytes:
+        self.offsets[object_id] = self.offset
+        return self._out(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+    def start(self, title: str) -> bytes:
+        font = b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding " + _PDF_ENCODING + b" >>"
+        return b"".join([
+            self._out(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"),
+            self._object(_PDF_CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % _PDF_PAGES),
+            self._object(_PDF_FONT, font % b"Helvetica"),
+            self._object(_PDF_FONT_BOLD, font % b"Helvetica-Bold"),
+            self._object(_PDF_INFO, b"<< /Title " + _pdf_string(title) + b" >>"),
+        ])
+
+    def page(self, canvas: PdfCanvas) -> bytes:
+        content = canvas.content()
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self.page_ids.append(page_id)
+        width, height = PDF_PAGE_SIZE
+        return self._object(
+            content_id,
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content) + content + b"\nendstream"
+        ) + self._object(
+            page_id,
+            (f"<< /Type /Page /Parent {_PDF_PAGES} 0 R /MediaBox [0 0 {_number(width)} {_number(height)}] "
+             f"/Resources << /Font << /F1 {_PDF_FONT} 0 R /F2 {_PDF_FONT_BOLD} 0 R >> >> "
+             f"/Contents {content_id} 0 R >>").encode()
+        )
+
+    def finish(self) -> bytes:
+        kids = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        data = self._object(
+            _PDF_PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>".encode()
+        )
+        xref_offset = self.offset
+        size = self.next_id
+        xref = [b"xref\n0 %d\n" % size, b"0000000000 65535 f \n"]
+        xref += [b"%010d 00000 n \n" % self.offsets[i] for i in range(1, size)]
+        return data + b"".join(xref) + (
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, _PDF_CATALOG, _PDF_INFO, xref_offset)
+        )
+
+
+def pdf_rows_per_page() -> int:
+    return int((PDF_PAGE_SIZE[1] - 2 * PDF_MARGIN - HEADER_HEIGHT - 14) // ROW_HEIGHT)
+
+
+def render_pdf(layout: ChartLayout, rows: Iterator[Row], row_count: int) -> Iterator[bytes]:
+    writer = PdfWriter()
+    per_page = pdf_rows_per_page()
+    page_count = max(1, math.ceil(row_count / per_page))
+    page_height = PDF_PAGE_SIZE[1]
+    yield writer.start(layout.title)
+
+    def new_page() -> PdfCanvas:
+        canvas = PdfCanvas(page_height)
+        page_rows = min(per_page, row_count - len(writer.page_ids) * per_page)
+        draw_header(canvas, layout)
+        draw_grid(canvas, layout, HEADER_HEIGHT + max(page_rows, 0) * ROW_HEIGHT)
+        canvas.text(layout.width - 60, page_height - 2 * PDF_MARGIN - 2,
+                    f"{len(writer.page_ids) + 1} / {page_count}", color=MUTED_COLOR)
+        return canvas
+
+    canvas, drawn = new_page(), 0
+    for row in rows:
+        if drawn == per_page:
+            draw_today(canvas, layout, HEADER_HEIGHT + drawn * ROW_HEIGHT)
+            yield writer.page(canvas)
+            canvas, drawn = new_page(), 0
+        draw_row(canvas, layout, HEADER_HEIGHT + drawn * ROW_HEIGHT, row)
+        drawn += 1
+    draw_today(canvas, layout, HEADER_HEIGHT + drawn * ROW_HEIGHT)
+    yield writer.page(canvas)
+    yield writer.finish()
+
+
+def parse_render_window(args, activity: Activity, scale: Optional[str] = None) -> Tuple[date, date]:
+    """
+    ?from=&to= window, defaulting to the activity dates; raises ValueError.
+
+    The header and grid are drawn before the first row, so windows with
+    more than MAX_RENDER_COLUMNS timeline columns at the scale are refused.
+    """
+    try:
+        window_start = date.fromisoformat(args["from"]) if args.get("from") else activity.start_date
+        window_end = date.fromisoformat(args["to"]) if args.get("to") else activity.end_date
+    except ValueError:
+        raise ValueError("Tarih formatı YYYY-MM-DD olmalı")
+    if window_start > window_end:
+        raise ValueError("Başlangıç tarihi bitiş tarihinden sonra olamaz")
+    scale = scale or calculate_scale(window_start, window_end)
+    if timeline_columns(window_start, window_end, scale) > MAX_RENDER_COLUMNS:
+        raise ValueError(
+            f"Zaman ekseni en fazla {MAX_RENDER_COLUMNS} sütun olabilir; "
+            "daha kısa bir aralık ya da daha büyük bir ölçek seçin"
+        )
+    return window_start, window_end
+
+
+def render_gantt(
+    session: Session,
+    activity: Activity,
+    fmt: str,
+    window_start: date,
+    window_end: date,
+    scale: Optional[str] = None,
+    locale: str = "tr",
+):
+    """
+    Generator of the rendered chart ("svg": str chunks, "pdf": bytes chunks).
+
+    The row count is queried here, before the first chunk, so the caller
+    can still turn errors into a normal response.
+    """
+    subtask_count, topic_count = session.execute(
+        render_count_statement(activity.id, window_start, window_end)
+    ).one()
+    row_count = subtask_count + topic_count
+
+    # Client windows stay out of the shared build_timeline cache
+    timeline = compute_timeline(window_start, window_end, scale or calculate_scale(window_start, window_end),
+                                locale)
+    if fmt == "pdf":
+        timeline_width = PDF_PAGE_SIZE[0] - 2 * PDF_MARGIN - LABEL_WIDTH
+    else:
+        timeline_width = timeline["total_width"]
+    layout = ChartLayout(activity.name, window_start, window_end, timeline, timeline_width)
+
+    rows = chart_rows(session, render_rows_statement(activity.id, window_start, window_end), row_count)
+    if fmt == "pdf":
+        return render_pdf(layout, rows, row_count)
+    return render_svg(layout, rows, row_count)
@@ -0,0 +1,184 @@
+# /backend/app/services/search_service.py
+"""
+Full-text search over activities, topics and subtasks.
+
+Queries the index of app/search_index.py: the GIN indexed search_vector
+columns with ts_rank on PostgreSQL, the FTS5 table with bm25 on SQLite.
+Every query word matches as a prefix ("tasar" finds "tasarım"), all words
+must match. The index returns ranked (kind, id) hits for one page; titles
+and parent ids are then loaded for just those rows.
+"""
+import re
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from sqlalchemy import Select, column, func, literal, literal_column, select, table, union_all
+
+from ..db import db
+from ..models import Activity, SubTask, Topic
+from ..search_index import SEARCH_KINDS, SQLITE_TABLE, TS_CONFIG
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# Relevance ranking beyond the first pages is noise; keeps the per-kind windows small
+MAX_OFFSET = 1000
+MAX_QUERY_WORDS = 8
+# Shorter words match exactly; a one or two letter prefix matches half the index
+MIN_PREFIX_LENGTH = 3
+
+# Title column weight vs description in the SQLite bm25 score
+SQLITE_TITLE_WEIGHT = 10.0
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+Hit = Tuple[str, int, float]
+
+_fts = table(SQLITE_TABLE, column("rowid"), column(SQLITE_TABLE))
+_KIND_BY_CODE = {code: kind for kind, (_, _, code) in SEARCH_KINDS.items()}
+_MODELS = {"activity": Activity, "topic": Topic, "subtask": SubTask}
+
+
+def parse_search_params(args: Mapping) -> Tuple[List[str], List[str], int, int]:
+    """
+    Validate ?q=&type=&limit=&offset= of a search request.
+
+    Returns:
+        (words, kinds, limit, offset)
+
+    Raises:
+        ValueError: with the error message for the client
+    """
+    words = query_words(args.get("q", ""))
+    if not words:
+        raise ValueError("Arama terimi gerekli")
+
+    kinds = [k.strip() for k in args.get("type", "").split(",") if k.strip()] or list(SEARCH_KINDS)
+    if any(k not in SEARCH_KINDS for k in kinds):
+        raise ValueError("Geçersiz type değeri")
+
+    try:
+        limit = int(args.get("limit", DEFAULT_LIMIT))
+        offset = int(args.get("offset", 0))
+    except ValueError:
+        raise ValueError("limit ve offset sayı olmalı")
+    if not 1 <= limit <= MAX_LIMIT or not 0 <= offset <= MAX_OFFSET:
+        raise ValueError(f"limit 1-{MAX_LIMIT}, offset 0-{MAX_OFFSET} arasında olmalı")
+
+    return words, kinds, limit, offset
+
+
+def query_words(q: str) -> List[str]:
+    """Lowercased words of a query; punctuation and query syntax are dropped."""
+    return [w.lower() for w in _WORD_RE.findall(q)][:MAX_QUERY_WORDS]
+
+
+def pg_tsquery(words: Sequence[str]) -> str:
+    """to_tsquery text: all words, prefix matched when long enough."""
+    return " & ".join(f"{w}:*" if len(w) >= MIN_PREFIX_LENGTH else w for w in words)
+
+
+def fts5_query(words: Sequence[str]) -> str:
+    """FTS5 MATCH text equivalent to pg_tsquery."""
+    return " AND ".join(f'"{w}"*' if len(w) >= MIN_PREFIX_LENGTH else f'"{w}"' for w in words)
+
+
+def pg_search_statement(words: Sequence[str], kinds: Sequence[str], limit: int, offset: int) -> Select:
+    """
+    Ranked hits on PostgreSQL.
+
+    Each kind contributes its best offset + limit + 1 matches (a GIN index
+    scan plus ranking of the matches), the union is ranked once more.
+    """
+    window = offset + limit + 1
+    tsquery = func.to_tsquery(literal_column(f"'{TS_CONFIG}'"), pg_tsquery(words))
+    branches = []
+    for kind in kinds:
+        model = _MODELS[kind]
+        vector = literal_column(f"{SEARCH_KINDS[kind][0]}.search_vector")
+        rank = func.ts_rank(vector, tsquery)
+        branches.append(
+            select(literal(kind).label("kind"), model.id.label("id"), rank.label("rank"))
+            .where(vector.op("@@")(tsquery))
+            .order_by(rank.desc(), model.id)
+            .limit(window)
+            .subquery()
+            .select()
+        )
+    hits = union_all(*branches).subquery()
+    return (
+        select(hits.c.kind, hits.c.id, hits.c.rank)
+        .order_by(hits.c.rank.desc(), hits.c.kind, hits.c.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+
+
+def sqlite_search_statement(words: Sequence[str], kinds: Sequence[str], limit: int, offset: int) -> Select:
+    """Ranked hits on SQLite (bm25 is lower for better matches)."""
+    rank = func.bm25(literal_column(SQLITE_TABLE), SQLITE_TITLE_WEIGHT, 1.0)
+    stmt = select(_fts.c.rowid, rank.label("rank")).where(
+        _fts.c[SQLITE_TABLE].match(fts5_query(words))
+    )
+    if len(kinds) < len(SEARCH_KINDS):
+        stmt = stmt.where((_fts.c.rowid % 4).in_([SEARCH_KINDS[k][2] for k in kinds]))
+    return stmt.order_by(rank, _fts.c.rowid).limit(limit + 1).offset(offset)
+
+
+def _hits(words: Sequence[str], kinds: Sequence[str], limit: int, offset: int) -> List[Hit]:
+    if db.session.get_bind().dialect.name == "postgresql":
+        rows = db.session.execute(pg_search_statement(words, kinds, limit, offset)).all()
+        return [(kind, id_, float(rank)) for kind, id_, rank in rows]
+
+    rows = db.session.execute(sqlite_search_statement(words, kinds, limit, offset)).all()
+    # Higher is better in the response, as with ts_rank
+    return [(_KIND_BY_CODE[rowid % 4], rowid // 4, -float(rank)) for rowid, rank in rows]
+
+
+def _details(hits: Sequence[Hit]) -> Dict[Tuple[str, int], dict]:
+    """Title and parent ids of the hit rows, three IN queries at most."""
+    ids: Dict[str, List[int]] = {}
+    for kind, id_, _ in hits:
+        ids.setdefault(kind, []).append(id_)
+
+    details = {}
+    if ids.get("activity"):
+        for id_, name in db.session.execute(
+            select(Activity.id, Activity.name).where(Activity.id.in_(ids["activity"]))
+        ):
+            details["activity", id_] = {"title": name, "activity_id": id_, "topic_id": None}
+    if ids.get("topic"):
+        for id_, title, activity_id in db.session.execute(
+            select(Topic.id, Topic.title, Topic.activity_id).where(Topic.id.in_(ids["topic"]))
+        ):
+            details["topic", id_] = {"title": title, "activity_id": activity_id, "topic_id": id_}
+    if ids.get("subtask"):
+        for id_, title, topic_id, activity_id in db.session.execute(
+            select(SubTask.id, SubTask.title, SubTask.topic_id, Topic.activity_id)
+            .join(Topic, SubTask.topic_id == Topic.id)
+            .where(SubTask.id.in_(ids["subtask"]))
+        ):
+            details["subtask", id_] = {"title": title, "activity_id": activity_id, "topic_id": topic_id}
+    return details
+
+
+def search(words: Sequence[str], kinds: Sequence[str], limit: int = DEFAULT_LIMIT, offset: int = 0) -> dict:
+    """
+    One page of ranked search results.
+
+    Returns:
+        {"results": [{type, id, title, activity_id, topic_id, rank}],
+         "limit", "offset", "has_more"}
+    """
+    hits = _hits(words, kinds, limit, offset)
+    has_more = len(hits) > limit
+    hits = hits[:limit]
+    details = _details(hits)
+
+    results = []
+    for kind, id_, rank in hits:
+        row = details.get((kind, id_))
+        if row is None:
+            # Deleted between the index read and the detail read
+            continue
+        results.append({"type": kind, "id": id_, **row, "rank": round(rank, 6)})
+
+    return {"results": results, "limit": limit, "offset": offset, "has_more": has_more}
@@ -0,0 +1,112 @@
+# /backend/app/services/subtask_service.py
+"""
+Cross-activity subtask listing ("my tasks").
+
+Subtasks of one assignee across all activities, ordered by end date and
+paged with a keyset cursor: each page continues after the (end_date, id)
+of the previous page's last row, a range scan on the
+(assignee_id, end_date) index however deep the client pages.
+"""
+from datetime import date, datetime
+from typing import List, Mapping, Optional, Tuple
+
+from sqlalchemy import Select, or_, select, tuple_
+
+from ..models import Activity, SubTask, SubTaskStatus, Topic
+from .activity_service import effective_status_conditions
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+Cursor = Tuple[date, int]
+
+
+def encode_cursor(subtask: SubTask) -> str:
+    return f"{subtask.end_date.isoformat()}_{subtask.id}"
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Raises ValueError for anything encode_cursor did not produce."""
+    end_date, _, subtask_id = cursor.partition("_")
+    return datetime.strptime(end_date, "%Y-%m-%d").date(), int(subtask_id)
+
+
+def parse_assigned_params(args: Mapping) -> dict:
+    """
+    Validate ?status=&from=&to=&limit=&cursor= of a task list request.
+
+    Returns:
+        Keyword arguments of assigned_subtasks_statement except assignee_id
+
+    Raises:
+        ValueError: with the error message for the client
+    """
+    statuses = [s.strip().upper() for s in args.get("status", "").split(",") if s.strip()]
+    valid = {s.value for s in SubTaskStatus}
+    if any(s not in valid for s in statuses):
+        raise ValueError("Geçersiz durum değeri")
+
+    try:
+        window_start = datetime.strptime(args["from"], "%Y-%m-%d").date() if args.get("from") else None
+        window_end = datetime.strptime(args["to"], "%Y-%m-%d").date() if args.get("to") else None
+    except ValueError:
+        raise ValueError("Tarih formatı YYYY-MM-DD olmalı")
+
+    try:
+        limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit bir sayı olmalı")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit 1-{MAX_PAGE_SIZE} arasında olmalı")
+
+    after = None
+    if args.get("cursor"):
+        try:
+            after = decode_cursor(args["cursor"])
+        except ValueError:
+            raise ValueError("cursor geçerli bir imleç olmalı")
+
+    return {
+        "statuses": statuses,
+        "window_start": window_start,
+        "window_end": window_end,
+        "limit": limit,
+        "after": after,
+    }
+
+
+def assigned_subtasks_statement(
+    assignee_id: int,
+    statuses: Optional[List[str]] = None,
+    window_start: Optional[date] = None,
+    window_end: Optional[date] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[Cursor] = None,
+    today: Optional[date] = None,
+) -> Select:
+    """
+    One page (plus one row to detect more) of (SubTask, topic title,
+    activity id, activity name, activity calendar id) rows.
+
+    Args:
+        statuses: Effective status values (as in SubTask.to_dict()), any of
+        window_start / window_end: Only subtasks overlapping the window
+        after: Cursor of the previous page's last row
+        today: Reference date for effective OVERDUE status
+    """
+    stmt = (
+        select(SubTask, Topic.title, Activity.id, Activity.name, Activity.calendar_id)
+        .join(Topic, SubTask.topic_id == Topic.id)
+        .join(Activity, Topic.activity_id == Activity.id)
+        .where(SubTask.assignee_id == assignee_id)
+    )
+    if statuses:
+        conditions = effective_status_conditions(today or date.today())
+        stmt = stmt.where(or_(*(conditions[s] for s in statuses)))
+    if window_start:
+        stmt = stmt.where(SubTask.end_date >= window_start)
+    if window_end:
+        stmt = stmt.where(SubTask.start_date <= window_end)
+    if after:
+        stmt = stmt.where(tuple_(SubTask.end_date, SubTask.id) > tuple_(*after))
+    return stmt.order_by(SubTask.end_date, SubTask.id).limit(limit + 1)
@@ -0,0 +1,191 @@
+# /backend/app/services/sync_service.py
+"""
+Gantt delta sync - change sequence assignment and tombstones.
+
+Every insert or update of a Topic or SubTask stamps the row with the next
+value of a global monotonic change sequence. Clients send back the highest
+sequence they have seen and only receive rows changed after it, plus
+tombstones for rows deleted since.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, List
+
+from sqlalchemy import Select, case, event, func, select, text
+from sqlalchemy.orm import Session, selectinload
+
+from ..db import db
+from ..models import Topic, SubTask, Tombstone
+
+# Rows changed more recently than this are resent on the next sync, so a
+# transaction that drew a lower sequence number but committed later is not
+# skipped by an already advanced cursor.
+SYNC_SETTLE_SECONDS = 2
+
+_TRACKED_MODELS = (Topic, SubTask)
+
+_local_seq_lock = threading.Lock()
+_local_seq = {"value": None}
+
+
+def _next_change_seqs(session: Session, count: int) -> List[int]:
+    """
+    Reserve `count` consecutive change sequence values.
+
+    PostgreSQL uses the gantt_change_seq sequence. Other dialects (SQLite for
+    development and tests) use an in-process counter seeded from the tables.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        rows = session.execute(
+            text("SELECT nextval('gantt_change_seq') FROM generate_series(1, :n)"),
+            {"n": count}
+        ).scalars().all()
+        return list(rows)
+
+    with _local_seq_lock:
+        if _local_seq["value"] is None:
+            current = 0
+            for model in (Topic, SubTask, Tombstone):
+                value = session.execute(select(func.max(model.change_seq))).scalar()
+                current = max(current, value or 0)
+            _local_seq["value"] = current
+        start = _local_seq["value"] + 1
+        _local_seq["value"] += count
+    return list(range(start, start + count))
+
+
+def reset_local_sequence() -> None:
+    """Forget the in-process counter (e.g. after switching databases)."""
+    with _local_seq_lock:
+        _local_seq["value"] = None
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_change_seqs(session: Session, flush_context, instances) -> None:
+    """Stamp new and modified topics/subtasks with fresh change sequences."""
+    changed = [obj for obj in session.new if isinstance(obj, _TRACKED_MODELS)]
+    changed += [
+        obj for obj in session.dirty
+        if isinstance(obj, _TRACKED_MODELS) and session.is_modified(obj, include_collections=False)
+    ]
+    pending_tombstones = [obj for obj in session.new if isinstance(obj, Tombstone)]
+
+    targets = changed + pending_tombstones
+    if not targets:
+        return
+
+    for obj, seq in zip(targets, _next_change_seqs(session, len(targets))):
+        obj.change_seq = seq
+
+
+def record_deletion(activity_id: int, topics: Iterable[Topic] = (), subtasks: Iterable[SubTask] = ()) -> None:
+    """
+    Add tombstones for topics/subtasks about to be deleted.
+
+    Must be called in the same transaction as the delete; the change
+    sequence is assigned on flush.
+    """
+    for topic in topics:
+        db.session.add(Tombstone(entity_type="topic", entity_id=topic.id, activity_id=activity_id))
+    for subtask in subtasks:
+        db.session.add(Tombstone(entity_type="subtask", entity_id=subtask.id, activity_id=activity_id))
+
+
+def get_changes(activity_id: int, since: int) -> dict:
+    """
+    Load topics, subtasks and tombstones of an activity changed after `since`.
+
+    Each query is an index range scan on (activity_id, change_seq) or
+    change_seq.
+
+    Returns:
+        Dictionary with topics, subtasks, deleted ids and the new cursor
+    """
+    topics = db.session.query(Topic).filter(
+        Topic.activity_id == activity_id,
+        Topic.change_seq > since
+    ).order_by(Topic.change_seq).all()
+
+    subtasks = db.session.query(SubTask).options(selectinload(SubTask.assignee)).join(
+        Topic, SubTask.topic_id == Topic.id
+    ).filter(
+        Topic.activity_id == activity_id,
+        SubTask.change_seq > since
+    ).order_by(SubTask.change_seq).all()
+
+    tombstones = db.session.query(Tombstone).filter(
+        Tombstone.activity_id == activity_id,
+        Tombstone.change_seq > since
+    ).order_by(Tombstone.change_seq).all()
+
+    changes = [(row.change_seq, row.updated_at) for row in topics + subtasks]
+    changes += [(row.change_seq, row.deleted_at) for row in tombstones]
+
+    return {
+        "topics": topics,
+        "subtasks": subtasks,
+        "deleted": {
+            "topics": [t.entity_id for t in tombstones if t.entity_type == "topic"],
+            "subtasks": [t.entity_id for t in tombstones if t.entity_type == "subtask"],
+        },
+        "cursor": next_cursor(since, changes),
+    }
+
+
+def next_cursor(since: int, changes: List[tuple]) -> int:
+    """
+    Compute the cursor to hand back to the client.
+
+    Args:
+        since: Cursor the client sent
+        changes: (change_seq, changed_at) pairs returned in this response
+
+    Returns:
+        Highest settled change sequence; recent changes are left above the
+        cursor so they are sent again on the next sync
+    """
+    if not changes:
+        return since
+
+    settle_limit = datetime.utcnow() - timedelta(seconds=SYNC_SETTLE_SECONDS)
+    recent = [seq for seq, changed_at in changes if changed_at > settle_limit]
+    if recent:
+        return max(since, min(recent) - 1)
+    return max(seq for seq, _ in changes)
+
+
+def cursor_statements(activity_id: int) -> List[Select]:
+    """(max change_seq, lowest recently changed seq) per tracked table."""
+    settle_limit = datetime.utcnow() - timedelta(seconds=SYNC_SETTLE_SECONDS)
+    return [
+        select(
+            func.max(Topic.change_seq),
+            func.min(case((Topic.updated_at > settle_limit, Topic.change_seq)))
+        ).where(Topic.activity_id == activity_id),
+        select(
+            func.max(SubTask.change_seq),
+            func.min(case((SubTask.updated_at > settle_limit, SubTask.change_seq)))
+        ).join(Topic, SubTask.topic_id == Topic.id).where(Topic.activity_id == activity_id),
+        select(
+            func.max(Tombstone.change_seq),
+            func.min(case((Tombstone.deleted_at > settle_limit, Tombstone.change_seq)))
+        ).where(Tombstone.activity_id == activity_id),
+    ]
+
+
+def cursor_from_rows(rows: Iterable[tuple]) -> int:
+    """Combine the rows of cursor_statements() into a cursor."""
+    cursor = 0
+    recent = []
+    for max_seq, min_recent_seq in rows:
+        cursor = max(cursor, max_seq or 0)
+        if min_recent_seq is not None:
+            recent.append(min_recent_seq)
+    if recent:
+        return min(cursor, min(recent) - 1)
+    return cursor
+
+
+def current_cursor(activity_id: int) -> int:
+    """Cursor for a client that just loaded the full Gantt of an activity."""
+    return cursor_from_rows(db.session.execute(stmt).one() for stmt in cursor_statements(activity_id))
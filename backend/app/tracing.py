@@ -0,0 +1,340 @@
+# /backend/app/tracing.py
+"""
+Per-request tracing spans.
+
+A sampled request gets a root span with nested spans for auth, every SQL
+statement, serialization, notification creation and commits. Finished
+traces are exported in OTLP/JSON form to a JSONL file and/or an OTLP HTTP
+endpoint (e.g. a local collector on :4318) from a background thread.
+
+When a request is not sampled the current-span context variable stays
+None and every span() call returns a shared no-op context manager.
+"""
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, List, Optional
+
+from flask import Flask, Response, current_app, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .db import all_engines, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "gantt-backend"
+
+# Finished traces waiting for the exporter; dropped when full
+EXPORT_QUEUE_SIZE = 1000
+
+# W3C trace context: version-traceid-parentid-flags
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_NOOP = nullcontext()
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attributes", "start_ns", "end_ns", "_token")
+
+    def __init__(self, trace: "Trace", name: str, parent: Optional["Span"], attributes: dict):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else trace.remote_parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self._token = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.trace.spans.append(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.attributes["error"] = repr(exc)
+        _current_span.reset(self._token)
+        self.end()
+
+
+class Trace:
+    """Spans of one sampled request."""
+
+    def __init__(self, trace_id: Optional[str] = None, remote_parent_id: Optional[str] = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.remote_parent_id = remote_parent_id
+        self.spans: List[Span] = []
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span of the current request, if it is traced."""
+    return _current_span.get()
+
+
+def span(name: str, **attributes):
+    """Context manager for a child span; a no-op when not tracing."""
+    parent = _current_span.get()
+    if parent is None:
+        return _NOOP
+    return Span(parent.trace, name, parent, attributes)
+
+
+def traced(name: str) -> Callable:
+    """Decorator wrapping a function in a child span."""
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return f(*args, **kwargs)
+            with span(name):
+                return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace: Trace) -> dict:
+    """Trace as an OTLP/JSON ExportTraceServiceRequest."""
+    spans = []
+    for s in trace.spans:
+        otlp_span = {
+            "traceId": trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 2 if s.parent_id == trace.remote_parent_id else 1,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+        }
+        if s.parent_id:
+            otlp_span["parentSpanId"] = s.parent_id
+        if "error" in s.attributes:
+            otlp_span["status"] = {"code": 2, "message": s.attributes["error"]}
+        spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": "app.tracing"}, "spans": spans}],
+        }]
+    }
+
+
+class TraceExporter:
+    """Background exporter writing finished traces to a file and/or OTLP endpoint."""
+
+    def __init__(self):
+        self.export_file: Optional[str] = None
+        self.otlp_endpoint: Optional[str] = None
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, trace: Trace) -> None:
+        if not (self.export_file or self.otlp_endpoint):
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until queued traces are exported (tests and benchmarks)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            try:
+                payload = json.dumps(to_otlp(trace), separators=(",", ":"))
+                if self.export_file:
+                    with open(self.export_file, "a", encoding="utf-8") as f:
+                        f.write(payload + "\n")
+                if self.otlp_endpoint:
+                    req = urllib.request.Request(
+                        self.otlp_endpoint,
+                        data=payload.encode("utf-8"),
+                        headers={"Content-Type": "application/json"},
+                        method="POST"
+                    )
+                    urllib.request.urlopen(req, timeout=2).close()
+            except Exception:
+                logger.exception("Trace export failed")
+            finally:
+                self._queue.task_done()
+
+
+# Singleton instance for convenience
+trace_exporter = TraceExporter()
+
+
+def _sampling_decision() -> tuple:
+    """
+    (sampled, trace_id, remote parent span id) for the current request.
+
+    Any client can send a traceparent, so its sampled flag decides only with
+    TRACE_TRUST_REMOTE_SAMPLED (a gateway that strips client headers in
+    front). Otherwise the header only links the trace to the caller's when
+    TRACE_SAMPLE_RATE samples the request.
+    """
+    trace_id = parent_id = None
+    match = _TRACEPARENT_RE.match(request.headers.get("traceparent", ""))
+    if match:
+        trace_id, parent_id, flags = match.groups()
+        if current_app.config["TRACE_TRUST_REMOTE_SAMPLED"]:
+            return int(flags, 16) & 1 == 1, trace_id, parent_id
+
+    rate = current_app.config["TRACE_SAMPLE_RATE"]
+    return rate > 0 and random.random() < rate, trace_id, parent_id
+
+
+def _before_request() -> None:
+    sampled, trace_id, parent_id = _sampling_decision()
+    if not sampled or request.blueprint == "realtime":
+        return
+
+    trace = Trace(trace_id, parent_id)
+    root = Span(trace, f"{request.method} {request.path}", None, {
+        "http.method": request.method,
+        "http.target": request.full_path.rstrip("?"),
+    })
+    root._token = _current_span.set(root)
+
+
+def _after_request(response: Response) -> Response:
+    root = _current_span.get()
+    if root is not None:
+        root.set_attribute("http.status_code", response.status_code)
+        if request.url_rule is not None:
+            root.set_attribute("http.route", request.url_rule.rule)
+            root.name = f"{request.method} {request.url_rule.rule}"
+        response.headers["traceparent"] = f"00-{root.trace.trace_id}-{root.span_id}-01"
+    return response
+
+
+def _teardown_request(exc) -> None:
+    span_ = _current_span.get()
+    if span_ is None:
+        return
+    trace = span_.trace
+    # Close spans left open by an exception, then the root span
+    while span_ is not None:
+        if exc is not None:
+            span_.attributes.setdefault("error", repr(exc))
+        _current_span.reset(span_._token)
+        span_.end()
+        span_ = _current_span.get()
+    trace_exporter.submit(trace)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    parent = _current_span.get()
+    if parent is None:
+        return
+    sql_span = Span(parent.trace, "SQL " + statement.lstrip().split(None, 1)[0].upper(), parent, {
+        "db.system": conn.dialect.name,
+        "db.statement": normalize_sql(statement),
+    })
+    if executemany:
+        sql_span.attributes["db.executemany"] = True
+    # On the execution context, which goes away with the statement even
+    # when it raises; a span kept on the pooled connection would keep its
+    # whole trace alive
+    if context is not None:
+        context.trace_sql_span = sql_span
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    sql_span = getattr(context, "trace_sql_span", None)
+    if sql_span is None:
+        return
+    context.trace_sql_span = None
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        sql_span.attributes["db.rowcount"] = cursor.rowcount
+    sql_span.end()
+
+
+def _handle_error(exception_context) -> None:
+    """End the span of a statement that raised (after_cursor_execute is skipped)."""
+    context = exception_context.execution_context
+    sql_span = getattr(context, "trace_sql_span", None)
+    if sql_span is None:
+        return
+    context.trace_sql_span = None
+    sql_span.attributes["error"] = repr(exception_context.original_exception)
+    sql_span.end()
+
+
+def _before_commit(session) -> None:
+    parent = _current_span.get()
+    if parent is not None:
+        commit_span = Span(parent.trace, "db.commit", parent, {})
+        commit_span._token = _current_span.set(commit_span)
+        session.info["trace_commit_span"] = commit_span
+
+
+def _end_commit_span(session) -> None:
+    commit_span = session.info.pop("trace_commit_span", None)
+    if commit_span is not None:
+        if _current_span.get() is commit_span:
+            _current_span.reset(commit_span._token)
+        commit_span.end()
+
+
+def init_tracing(app: Flask) -> None:
+    """Register request hooks, SQL/commit events and configure the exporter."""
+    trace_exporter.export_file = app.config.get("TRACE_EXPORT_FILE") or None
+    trace_exporter.otlp_endpoint = app.config.get("TRACE_OTLP_ENDPOINT") or None
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+
+    with app.app_context():
+        for engine in all_engines():
+            if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+                event.listen(engine, "handle_error", _handle_error)
+
+    if not event.contains(Session, "before_commit", _before_commit):
+        event.listen(Session, "before_commit", _before_commit)
+        event.listen(Session, "after_commit", _end_commit_span)
+        event.listen(Session, "after_rollback", _end_commit_span)
@@ -0,0 +1,10 @@
+# /backend/asgi.py
+"""
+ASGI entry point: async read path in front of the Flask app.
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 2
+"""
+from app import create_app
+from app.asgi import create_asgi_app
+
+app = create_asgi_app(create_app())
@@ -0,0 +1,4 @@
+# /backend/benchmarks/__init__.py
+"""
+Benchmark scripts for backend hot paths.
+"""
@@ -0,0 +1,289 @@
+# /backend/benchmarks/bench_api.py
+"""
+End-to-end benchmark for the hot API endpoints.
+
+Boots the app with create_app against a generated dataset (see
+benchmarks.datagen) and measures throughput and p50/p95/p99 latency of:
+    - GET /api/activities/:id/gantt for several activity sizes
+    - PATCH /api/subtasks/:id (drag-drop date shift)
+    - notification polling (unread count + list)
+    - POST /api/auth/login
+    - GET /api/activities
+each sequentially and with concurrent client threads. Results are written
+as JSON; pass --compare to print the change against an earlier run.
+
+Usage (from /backend):
+    python -m benchmarks.bench_api --output bench-api.json
+    python -m benchmarks.bench_api --database-url postgresql+psycopg2://... --concurrency 8
+    python -m benchmarks.bench_api --output new.json --compare bench-api.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import func
+
+from app import create_app
+from app.config import Config
+from app.db import db
+from app.models import Activity, SubTask, Topic, User, UserRole
+from benchmarks.datagen import BENCHMARK_PASSWORD, DatasetSpec, generate
+
+# Subtask counts of the activities measured by the Gantt scenarios
+GANTT_SIZES = (10, 100, 1000, 5000)
+
+BASE_SPEC = DatasetSpec(users=200, activities=200, topics_per_activity=5, subtasks_per_topic=20)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def prepare_dataset(engine) -> Dict[int, int]:
+    """
+    Generate the base dataset plus one activity per Gantt size.
+
+    Returns:
+        Mapping of subtask count → activity id
+    """
+    db.metadata.create_all(engine)
+    generate(engine, BASE_SPEC)
+
+    activities = {}
+    for size in GANTT_SIZES:
+        topics = max(1, size // 100)
+        generate(engine, DatasetSpec(
+            users=0, activities=1, topics_per_activity=topics, subtasks_per_topic=size // topics,
+            notification_density=0, seed=size
+        ))
+        activities[size] = db.session.query(func.max(Activity.id)).scalar()
+    return activities
+
+
+def existing_gantt_activities() -> Dict[int, int]:
+    """Pick activities of an existing database closest to each Gantt size."""
+    counts = db.session.query(Topic.activity_id, func.count(SubTask.id)).join(
+        SubTask, SubTask.topic_id == Topic.id
+    ).group_by(Topic.activity_id).all()
+    if not counts:
+        raise SystemExit("Veritabanında alt görevli faaliyet yok; --generate kullanın")
+    return {
+        size: min(counts, key=lambda row: abs(row[1] - size))[0]
+        for size in GANTT_SIZES
+    }
+
+
+def measure(
+    name: str,
+    make_request: Callable[[object, int], int],
+    app,
+    iterations: int,
+    concurrency: int
+) -> dict:
+    """
+    Run a scenario and collect latency percentiles.
+
+    make_request(client, i) performs one request and returns its status code.
+    With concurrency > 1 each thread has its own test client and the
+    iterations are split between threads.
+    """
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(thread_index: int, count: int) -> None:
+        nonlocal errors
+        client = app.test_client()
+        local, local_errors = [], 0
+        for i in range(count):
+            t0 = time.perf_counter()
+            status = make_request(client, thread_index * iterations + i)
+            local.append(time.perf_counter() - t0)
+            if status >= 400:
+                local_errors += 1
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    # Warm-up: connections, caches and code paths
+    warm_client = app.test_client()
+    for i in range(min(10, iterations)):
+        make_request(warm_client, -1 - i)
+
+    per_thread = max(1, iterations // concurrency)
+    threads = [threading.Thread(target=worker, args=(t, per_thread)) for t in range(concurrency)]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    to_ms = 1000
+    return {
+        "name": name,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies) * to_ms, 2),
+        "p50_ms": round(percentile(latencies, 50) * to_ms, 2),
+        "p95_ms": round(percentile(latencies, 95) * to_ms, 2),
+        "p99_ms": round(percentile(latencies, 99) * to_ms, 2),
+    }
+
+
+def build_scenarios(app, gantt_activities: Dict[int, int]) -> Dict[str, Callable]:
+    """Request functions per scenario name."""
+    from app.auth.utils import generate_token
+
+    admin = db.session.query(User).filter_by(role=UserRole.ADMIN).order_by(User.id).first()
+    headers = {"Authorization": f"Bearer {generate_token(admin)}"}
+
+    largest = gantt_activities[max(gantt_activities)]
+    subtask_ids = [
+        row[0] for row in db.session.query(SubTask.id).join(Topic, SubTask.topic_id == Topic.id).filter(
+            Topic.activity_id == largest
+        ).order_by(SubTask.id).limit(500)
+    ]
+    originals = {
+        st.id: (st.start_date, st.end_date)
+        for st in db.session.query(SubTask).filter(SubTask.id.in_(subtask_ids))
+    }
+
+    scenarios = {}
+    for size, activity_id in sorted(gantt_activities.items()):
+        url = f"/api/activities/{activity_id}/gantt"
+        scenarios[f"gantt_{size}"] = lambda c, i, url=url: c.get(url, headers=headers).status_code
+
+    def drag_drop(client, i):
+        # Shift a subtask one day forward or back, like dragging its bar
+        subtask_id = subtask_ids[i % len(subtask_ids)]
+        start, end = originals[subtask_id]
+        shift = timedelta(days=(i // len(subtask_ids)) % 2)
+        return client.patch(f"/api/subtasks/{subtask_id}", json={
+            "start_date": (start + shift).isoformat(),
+            "end_date": (end + shift).isoformat()
+        }, headers=headers).status_code
+
+    def poll_notifications(client, i):
+        status = client.get("/api/notifications/unread-count", headers=headers).status_code
+        return max(status, client.get("/api/notifications", headers=headers).status_code)
+
+    def login(client, i):
+        return client.post("/api/auth/login", json={
+            "email": admin.email, "password": BENCHMARK_PASSWORD
+        }).status_code
+
+    scenarios["subtask_patch"] = drag_drop
+    scenarios["notification_poll"] = poll_notifications
+    scenarios["login"] = login
+    scenarios["activities_list"] = lambda c, i: c.get("/api/activities", headers=headers).status_code
+    return scenarios
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_comparison(results: List[dict], baseline_path: str) -> None:
+    """Print p50/p95/throughput deltas against an earlier results file."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["name"], r["concurrency"]): r for r in json.load(f)["results"]}
+
+    print(f"\nComparison with {baseline_path}:")
+    for result in results:
+        old = baseline.get((result["name"], result["concurrency"]))
+        if not old:
+            continue
+        changes = []
+        for key in ("p50_ms", "p95_ms", "throughput_rps"):
+            if old[key]:
+                changes.append(f"{key} {100 * (result[key] - old[key]) / old[key]:+.1f}%")
+        print(f"  {result['name']:<20} c={result['concurrency']:<3} " + "  ".join(changes))
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the hot API endpoints")
+    parser.add_argument("--database-url", help="existing database (default: generated SQLite file)")
+    parser.add_argument("--generate", action="store_true", help="generate the dataset into --database-url")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--scenarios", help="comma separated scenario names (default: all)")
+    parser.add_argument("--output", default="bench-api.json")
+    parser.add_argument("--compare", help="earlier results file to compare with")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    generate_data = args.generate or not database_url
+    if not database_url:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gantt-bench-"), "bench.db")
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+
+    app = create_app(BenchConfig)
+    results = []
+    with app.app_context():
+        if generate_data:
+            print(f"Generating dataset into {database_url}")
+            gantt_activities = prepare_dataset(db.engine)
+        else:
+            gantt_activities = existing_gantt_activities()
+
+        scenarios = build_scenarios(app, gantt_activities)
+        selected = args.scenarios.split(",") if args.scenarios else list(scenarios)
+
+        for name in selected:
+            for concurrency in sorted({1, args.concurrency}):
+                result = measure(name, scenarios[name], app, args.iterations, concurrency)
+                results.append(result)
+                print(
+                    f"{name:<20} c={concurrency:<3} {result['throughput_rps']:>8} req/s  "
+                    f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                    f"p99 {result['p99_ms']:>8} ms  errors {result['errors']}"
+                )
+
+        dialect = db.engine.dialect.name
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "database": dialect,
+            "iterations": args.iterations,
+            "dataset": {k: str(v) for k, v in asdict(BASE_SPEC).items()} if generate_data else None,
+            "gantt_activities": gantt_activities,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    run()
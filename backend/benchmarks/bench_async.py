@@ -0,0 +1,223 @@
+# /backend/benchmarks/bench_async.py
+"""
+Sync vs asyncio serving benchmark for the read-heavy endpoints.
+
+Starts the app twice on a generated dataset (see benchmarks.datagen):
+    - sync:  gunicorn --workers 4 with the worker class of backend/Dockerfile
+    - async: uvicorn asgi:app (app/asgi.py) with --async-workers processes
+and drives both with the same closed-loop read mix (Gantt of a ~100
+subtask activity, notification list, unread count) from --concurrency
+keep-alive clients. Reports throughput, latency percentiles, peak memory
+of the server process tree (PSS, so forked workers' shared pages are not
+double counted) and throughput per GB of RAM.
+
+Usage (from /backend):
+    python -m benchmarks.bench_async --output bench-async.json
+    python -m benchmarks.bench_async --database-url postgresql+psycopg2://... --concurrency 128
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.load_sessions import HttpSession, Stats
+
+READ_MIX = (("gantt", 0.4), ("notifications", 0.2), ("unread_count", 0.4))
+
+
+def process_tree(pid: int) -> List[int]:
+    """pid and all of its descendants (Linux /proc)."""
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def tree_memory_mb(pid: int) -> float:
+    """Proportional set size of a process tree in MB (RSS where PSS is unavailable)."""
+    total_kb = 0
+    for current in process_tree(pid):
+        for path, key in ((f"/proc/{current}/smaps_rollup", "Pss:"), (f"/proc/{current}/status", "VmRSS:")):
+            try:
+                with open(path) as f:
+                    value = next((line.split()[1] for line in f if line.startswith(key)), None)
+            except OSError:
+                value = None
+            if value is not None:
+                total_kb += int(value)
+                break
+    return total_kb / 1024
+
+
+def prepare(database_url: Optional[str]) -> dict:
+    """Generate the dataset if needed; pick the Gantt activity and a user with notifications."""
+    from sqlalchemy import func
+
+    from app import create_app
+    from app.auth.utils import generate_token
+    from app.config import Config
+    from app.db import db
+    from app.models import Notification, User
+    from benchmarks.bench_api import existing_gantt_activities, prepare_dataset
+
+    generate_data = not database_url
+    if generate_data:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gantt-async-"), "bench.db")
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        if generate_data:
+            print(f"Generating dataset into {database_url}")
+            gantt_activities = prepare_dataset(db.engine)
+        else:
+            gantt_activities = existing_gantt_activities()
+
+        user_id = db.session.query(Notification.target_user_id).group_by(
+            Notification.target_user_id
+        ).order_by(func.count(Notification.id).desc()).limit(1).scalar()
+        user = db.session.get(User, user_id) if user_id else db.session.query(User).first()
+        return {
+            "database_url": database_url,
+            "token": generate_token(user),
+            "paths": {
+                "gantt": f"/api/activities/{gantt_activities[100]}/gantt",
+                "notifications": "/api/notifications",
+                "unread_count": "/api/notifications/unread-count",
+            },
+        }
+
+
+def server_command(mode: str, port: int, args) -> List[str]:
+    if mode == "sync":
+        command = [sys.executable, "-m", "gunicorn", "-b", f"127.0.0.1:{port}", "--workers", "4",
+                   "--worker-class", args.sync_worker_class, "--timeout", "120"]
+        if args.sync_worker_class == "gthread" and args.sync_threads:
+            command += ["--threads", str(args.sync_threads)]
+        return command + ["wsgi:app"]
+    return [sys.executable, "-m", "uvicorn", "asgi:app", "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.async_workers), "--no-access-log", "--log-level", "warning"]
+
+
+def start_server(mode: str, port: int, database_url: str, args) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=database_url)
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(server_command(mode, port, args), cwd=backend_dir, env=env)
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise SystemExit(f"{mode} server exited with {process.returncode}")
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit(f"{mode} server did not start")
+
+
+def drive(base_url: str, dataset: dict, concurrency: int, seconds: float, server_pid: int) -> dict:
+    """Closed-loop read mix; returns the stats snapshot plus peak memory."""
+    stats = Stats()
+    stop = threading.Event()
+    labels = [label for label, _ in READ_MIX]
+    weights = [weight for _, weight in READ_MIX]
+
+    def client(index: int) -> None:
+        session = HttpSession(base_url, stats)
+        session.token = dataset["token"]
+        rng = random.Random(index)
+        while not stop.is_set():
+            label = rng.choices(labels, weights)[0]
+            session.request(label, "GET", dataset["paths"][label])
+        session.close()
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    # Warm-up, then measure
+    time.sleep(min(5.0, seconds / 4))
+    stats.reset()
+
+    peak_mb = 0.0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        peak_mb = max(peak_mb, tree_memory_mb(server_pid))
+        time.sleep(0.5)
+    result = stats.snapshot()
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    result["peak_memory_mb"] = round(peak_mb, 1)
+    result["rps_per_gb"] = round(result["throughput_rps"] / (peak_mb / 1024), 1) if peak_mb else 0.0
+    return result
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Compare sync gunicorn and asyncio serving of the read endpoints")
+    parser.add_argument("--database-url", help="existing database (default: generated SQLite file)")
+    parser.add_argument("--modes", default="sync,async")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--port", type=int, default=5051)
+    parser.add_argument("--sync-worker-class", default="gthread", choices=("gthread", "sync"))
+    parser.add_argument("--sync-threads", type=int, default=None,
+                        help="gthread threads per worker (default: gunicorn.conf.py, one per pooled connection)")
+    parser.add_argument("--async-workers", type=int, default=2)
+    parser.add_argument("--output", default="bench-async.json")
+    args = parser.parse_args()
+
+    dataset = prepare(args.database_url)
+    results: Dict[str, dict] = {}
+    for mode in args.modes.split(","):
+        process = start_server(mode, args.port, dataset["database_url"], args)
+        try:
+            print(f"{mode}: {args.concurrency} clients for {args.seconds:.0f} s")
+            result = drive(f"http://127.0.0.1:{args.port}", dataset, args.concurrency, args.seconds, process.pid)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+        result["command"] = " ".join(server_command(mode, args.port, args)[1:])
+        results[mode] = result
+        print(
+            f"  {result['throughput_rps']:>8} req/s  p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  "
+            f"errors {result['errors']}  memory {result['peak_memory_mb']} MB  "
+            f"{result['rps_per_gb']} req/s per GB"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "database": dataset["database_url"].split(":", 1)[0],
+            "concurrency": args.concurrency,
+            "seconds": args.seconds,
+            "read_mix": dict(READ_MIX),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    run()
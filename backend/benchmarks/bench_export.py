@@ -0,0 +1,72 @@
+# /backend/benchmarks/bench_export.py
+"""
+Benchmark for the streaming CSV / XLSX / MS Project XML exports.
+
+Generates one activity per size (see benchmarks.datagen) and streams
+GET /api/activities/:id/export.<fmt> through the test client. Reports
+time, rows per second, output size and peak Python memory (tracemalloc,
+in a separate pass since tracing slows the export). Peak memory should
+not grow with the number of subtasks.
+
+Usage (from /backend):
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --sizes 10000,1000000 --formats csv,xlsx
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from app import create_app
+from app.config import Config
+from app.db import db
+from app.models import User, UserRole
+from benchmarks.bench_render import prepare_dataset, stream
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the streaming subtask exports")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma separated subtask counts")
+    parser.add_argument("--formats", default="csv,xlsx,xml")
+    parser.add_argument("--gzip", action="store_true", help="request gzip transfer encoding")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gantt-bench-"), "bench.db")
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        from app.auth.utils import generate_token
+
+        t0 = time.perf_counter()
+        activities = prepare_dataset(db.engine, sizes)
+        print(f"Generated {sum(sizes)} subtasks in {time.perf_counter() - t0:.1f}s")
+        admin = db.session.query(User).filter_by(role=UserRole.ADMIN).order_by(User.id).first()
+        headers = {"Authorization": f"Bearer {generate_token(admin)}"}
+        if args.gzip:
+            headers["Accept-Encoding"] = "gzip"
+        client = app.test_client()
+
+        for size, activity_id in activities.items():
+            for fmt in args.formats.split(","):
+                url = f"/api/activities/{activity_id}/export.{fmt}"
+                total, first, nbytes = stream(client, url, headers)
+
+                tracemalloc.start()
+                stream(client, url, headers)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                print(
+                    f"{size:>8} subtasks {fmt:>4}: {total:7.2f} s | {size / total:9.0f} rows/s | "
+                    f"first chunk {first * 1000:6.1f} ms | {nbytes / 1024 / 1024:8.1f} MiB | "
+                    f"peak {peak / 1024 / 1024:6.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,99 @@
+# /backend/benchmarks/bench_render.py
+"""
+Benchmark for server-side SVG/PDF Gantt rendering.
+
+Generates one activity per size (see benchmarks.datagen) and streams
+GET /api/activities/:id/gantt.svg and .pdf through the test client.
+Reports total time, time to first chunk, output size and peak Python
+memory (tracemalloc, in a separate pass since tracing slows rendering).
+Peak memory should stay flat as the activity grows.
+
+Usage (from /backend):
+    python -m benchmarks.bench_render
+    python -m benchmarks.bench_render --sizes 1000,10000,50000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, Tuple
+
+from sqlalchemy import func
+
+from app import create_app
+from app.config import Config
+from app.db import db
+from app.models import Activity, User, UserRole
+from benchmarks.datagen import DatasetSpec, generate
+
+ROUNDS = 3
+
+
+def prepare_dataset(engine, sizes) -> Dict[int, int]:
+    """Subtask count → id of a generated activity of that size."""
+    db.metadata.create_all(engine)
+    generate(engine, DatasetSpec(users=20, activities=0, notification_density=0))
+    activities = {}
+    for size in sizes:
+        topics = max(1, size // 100)
+        generate(engine, DatasetSpec(
+            users=0, activities=1, topics_per_activity=topics, subtasks_per_topic=size // topics,
+            notification_density=0, seed=size
+        ))
+        activities[size] = db.session.query(func.max(Activity.id)).scalar()
+    return activities
+
+
+def stream(client, url: str, headers: dict) -> Tuple[float, float, int]:
+    """(total seconds, seconds to first chunk, bytes) of one streamed response."""
+    t0 = time.perf_counter()
+    response = client.get(url, headers=headers, buffered=False)
+    first_chunk, size = None, 0
+    for chunk in response.response:
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - t0
+        size += len(chunk)
+    response.close()
+    return time.perf_counter() - t0, first_chunk or 0.0, size
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark server-side Gantt rendering")
+    parser.add_argument("--sizes", default="1000,10000", help="comma separated subtask counts")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gantt-bench-"), "bench.db")
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        from app.auth.utils import generate_token
+
+        activities = prepare_dataset(db.engine, sizes)
+        admin = db.session.query(User).filter_by(role=UserRole.ADMIN).order_by(User.id).first()
+        headers = {"Authorization": f"Bearer {generate_token(admin)}"}
+        client = app.test_client()
+
+        for size, activity_id in activities.items():
+            for fmt in ("svg", "pdf"):
+                url = f"/api/activities/{activity_id}/gantt.{fmt}"
+                stream(client, url, headers)  # warm-up
+                total, first, nbytes = min(stream(client, url, headers) for _ in range(ROUNDS))
+
+                tracemalloc.start()
+                stream(client, url, headers)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                print(
+                    f"{size:>7} subtasks {fmt}: {total * 1000:8.1f} ms | first chunk {first * 1000:6.1f} ms | "
+                    f"{nbytes / 1024:8.0f} KiB | peak {peak / 1024 / 1024:6.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,40 @@
+# /backend/benchmarks/bench_timeline.py
+"""
+Benchmark for server-side timeline header generation.
+
+Usage (from /backend):
+    python -m benchmarks.bench_timeline
+"""
+import time
+from datetime import date
+
+from app.services.gantt_service import build_timeline, SCALES
+
+START = date(2020, 1, 1)
+END = date(2029, 12, 31)  # 10-year range
+ROUNDS = 20
+
+
+def run() -> None:
+    """Measure cold (uncached) and warm (memoized) header generation."""
+    for scale in SCALES:
+        cold = []
+        for _ in range(ROUNDS):
+            build_timeline.cache_clear()
+            t0 = time.perf_counter()
+            timeline = build_timeline(START, END, scale)
+            cold.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for _ in range(ROUNDS):
+            build_timeline(START, END, scale)
+        warm = (time.perf_counter() - t0) / ROUNDS
+
+        print(
+            f"{scale:>5}: {len(timeline['ticks']):>5} ticks | "
+            f"cold {min(cold) * 1000:8.3f} ms | warm {warm * 1_000_000:8.3f} µs"
+        )
+
+
+if __name__ == "__main__":
+    run()
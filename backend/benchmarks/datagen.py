@@ -0,0 +1,343 @@
+# /backend/benchmarks/datagen.py
+"""
+Scalable synthetic data generator for benchmarks and performance tests.
+
+Generates users, activities, topics, subtasks and notifications from a
+DatasetSpec, deterministically for a given seed. Rows are produced in
+vectorized batches and written with COPY on PostgreSQL and executemany on
+SQLite, so tens of millions of subtasks load in minutes.
+
+Usage (from /backend):
+    python -m benchmarks.datagen --database-url sqlite:////tmp/bench.db --create-schema \\
+        --users 1000 --activities 1000 --topics-per-activity 10 --subtasks-per-topic 100
+
+From Python (tests, other benchmarks):
+    from benchmarks.datagen import DatasetSpec, generate
+    generate(db.engine, DatasetSpec(activities=10, subtasks_per_topic=50))
+"""
+import argparse
+import io
+import time
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Sequence
+
+import bcrypt
+import numpy as np
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Engine
+
+from app.db import db
+from app.models import User, Activity, Topic, SubTask, Notification, NotificationType, SubTaskStatus
+
+# Password of every generated user; emails are user<id>@bench.local
+BENCHMARK_PASSWORD = "benchmark123"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Shape of a generated dataset."""
+    users: int = 50
+    activities: int = 20
+    topics_per_activity: int = 5
+    subtasks_per_topic: int = 20
+    # Notifications per user on average
+    notification_density: float = 10.0
+    # Activities start uniformly within [date_start, date_start + date_spread_days]
+    date_start: date = date(2024, 1, 1)
+    date_spread_days: int = 730
+    max_activity_days: int = 365
+    max_subtask_days: int = 30
+    # Zipf-like exponent for owner/assignee popularity (0 = uniform)
+    skew: float = 1.0
+    # Share of subtasks without an assignee
+    unassigned_ratio: float = 0.1
+    seed: int = 42
+    batch_size: int = 50_000
+
+    @property
+    def total_topics(self) -> int:
+        return self.activities * self.topics_per_activity
+
+    @property
+    def total_subtasks(self) -> int:
+        return self.total_topics * self.subtasks_per_topic
+
+    @property
+    def total_notifications(self) -> int:
+        return int(round(self.users * self.notification_density))
+
+
+class _Writer:
+    """Bulk row writer: COPY on PostgreSQL, executemany elsewhere."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.dialect = connection.dialect.name
+        self.raw = connection.connection.driver_connection
+
+    def write(self, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+        if not rows:
+            return
+        cursor = self.raw.cursor()
+        try:
+            if self.dialect == "postgresql":
+                buffer = io.StringIO()
+                for row in rows:
+                    buffer.write(",".join(_csv_field(v) for v in row))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            else:
+                placeholders = ", ".join("?" if self.dialect == "sqlite" else "%s" for _ in columns)
+                cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+        finally:
+            cursor.close()
+
+
+def _csv_field(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, str) and any(c in value for c in ',"\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+def popularity_weights(n: int, skew: float) -> np.ndarray:
+    """Probability of picking each of n items; rank-based with exponent skew."""
+    weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** skew
+    return weights / weights.sum()
+
+
+def _id_offsets(connection) -> Dict[str, int]:
+    """Highest existing id per table so generated rows append to existing data."""
+    return {
+        model.__tablename__: connection.execute(select(func.coalesce(func.max(model.id), 0))).scalar()
+        for model in (User, Activity, Topic, SubTask, Notification)
+    }
+
+
+def _max_change_seq(connection) -> int:
+    return max(
+        connection.execute(select(func.coalesce(func.max(model.change_seq), 0))).scalar()
+        for model in (Topic, SubTask)
+    )
+
+
+def _sync_sequences(connection) -> None:
+    """Move PostgreSQL sequences past the explicitly inserted ids."""
+    if connection.dialect.name != "postgresql":
+        return
+    for model in (User, Activity, Topic, SubTask, Notification):
+        table = model.__tablename__
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+    connection.execute(text(
+        "SELECT setval('gantt_change_seq', GREATEST("
+        "(SELECT COALESCE(MAX(change_seq), 1) FROM topics), "
+        "(SELECT COALESCE(MAX(change_seq), 1) FROM subtasks)))"
+    ))
+
+
+def generate(engine: Engine, spec: DatasetSpec, progress: bool = False) -> Dict[str, int]:
+    """
+    Fill a database with a synthetic dataset.
+
+    Rows are appended after the existing ids. All random choices come from a
+    single generator seeded with spec.seed.
+
+    Returns:
+        Number of rows written per table
+    """
+    rng = np.random.default_rng(spec.seed)
+    stamp = datetime.combine(spec.date_start, datetime.min.time())
+    stamp_str = stamp.isoformat(sep=" ")
+
+    # ISO strings for every day a generated row can touch
+    horizon = spec.date_spread_days + spec.max_activity_days + spec.max_subtask_days + 2
+    day_strings = np.array([(spec.date_start + timedelta(days=i)).isoformat() for i in range(horizon)])
+
+    with engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql("PRAGMA synchronous = OFF")
+        writer = _Writer(connection)
+        offsets = _id_offsets(connection)
+        seq = _max_change_seq(connection)
+        t0 = time.perf_counter()
+
+        def report(label: str) -> None:
+            if progress:
+                print(f"  {label} ({time.perf_counter() - t0:.1f}s)")
+
+        # Users: the first generated user is an admin, ~20% editors
+        user_base = offsets["users"]
+        password_hash = bcrypt.hashpw(BENCHMARK_PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode()
+        roles = np.where(rng.random(spec.users) < 0.2, "editor", "viewer")
+        if spec.users:
+            roles[0] = "admin"
+        writer.write(
+            "users",
+            ("id", "email", "password_hash", "full_name", "role", "is_active", "created_at", "updated_at"),
+            [
+                (user_base + i + 1, f"user{user_base + i + 1}@bench.local", password_hash,
+                 f"Kullanıcı {user_base + i + 1}", roles[i], True, stamp_str, stamp_str)
+                for i in range(spec.users)
+            ]
+        )
+        report(f"{spec.users} users")
+
+        # Owners, assignees and notification users come from the new users,
+        # or from the existing ones when spec.users is 0
+        pool_base, pool_size = (user_base, spec.users) if spec.users else (0, user_base)
+        user_weights = popularity_weights(pool_size, spec.skew)
+
+        # Activities
+        activity_base = offsets["activities"]
+        activity_start = rng.integers(0, spec.date_spread_days + 1, spec.activities)
+        activity_length = rng.integers(30, spec.max_activity_days + 1, spec.activities)
+        activity_end = activity_start + activity_length
+        owners = pool_base + 1 + rng.choice(pool_size, spec.activities, p=user_weights)
+        writer.write(
+            "activities",
+            ("id", "name", "start_date", "end_date", "owner_id", "created_at", "updated_at"),
+            [
+                (activity_base + i + 1, f"Faaliyet {activity_base + i + 1}",
+                 day_strings[activity_start[i]], day_strings[activity_end[i]], int(owners[i]),
+                 stamp_str, stamp_str)
+                for i in range(spec.activities)
+            ]
+        )
+        report(f"{spec.activities} activities")
+
+        # Topics
+        topic_base = offsets["topics"]
+        topic_rows = []
+        for i in range(spec.total_topics):
+            seq += 1
+            topic_rows.append((
+                topic_base + i + 1, activity_base + i // spec.topics_per_activity + 1,
+                f"Konu {topic_base + i + 1}", seq, stamp_str, stamp_str
+            ))
+            if len(topic_rows) >= spec.batch_size:
+                writer.write("topics", ("id", "activity_id", "title", "change_seq", "created_at", "updated_at"), topic_rows)
+                topic_rows = []
+        writer.write("topics", ("id", "activity_id", "title", "change_seq", "created_at", "updated_at"), topic_rows)
+        report(f"{spec.total_topics} topics")
+
+        # Subtasks, in vectorized batches
+        subtask_base = offsets["subtasks"]
+        per_activity = spec.topics_per_activity * spec.subtasks_per_topic
+        subtask_columns = (
+            "id", "topic_id", "title", "start_date", "end_date", "status", "assignee_id",
+            "progress_percent", "change_seq", "created_at", "updated_at"
+        )
+        for first in range(0, spec.total_subtasks, spec.batch_size):
+            count = min(spec.batch_size, spec.total_subtasks - first)
+            index = np.arange(first, first + count)
+            activity_index = index // per_activity
+
+            a_start = activity_start[activity_index]
+            a_length = activity_length[activity_index]
+            start = a_start + (rng.random(count) * a_length).astype(np.int64)
+            end = np.minimum(start + rng.integers(0, spec.max_subtask_days, count), a_start + a_length)
+
+            progress_values = rng.choice((0, 0, 10, 25, 50, 75, 90, 100), count)
+            status = np.where(
+                progress_values == 100, SubTaskStatus.COMPLETED.value,
+                np.where(progress_values > 0, SubTaskStatus.IN_PROGRESS.value, SubTaskStatus.PLANNED.value)
+            )
+            assignees = pool_base + 1 + rng.choice(pool_size, count, p=user_weights)
+            unassigned = rng.random(count) < spec.unassigned_ratio
+
+            ids = (subtask_base + index + 1).tolist()
+            topic_ids = (topic_base + index // spec.subtasks_per_topic + 1).tolist()
+            starts = day_strings[start].tolist()
+            ends = day_strings[end].tolist()
+            assignee_list = [None if u else int(a) for u, a in zip(unassigned, assignees)]
+            seqs = range(seq + 1, seq + count + 1)
+            seq += count
+
+            writer.write("subtasks", subtask_columns, list(zip(
+                ids, topic_ids, [f"Görev {i}" for i in ids], starts, ends, status.tolist(),
+                assignee_list, progress_values.tolist(), seqs, [stamp_str] * count, [stamp_str] * count
+            )))
+            report(f"{first + count}/{spec.total_subtasks} subtasks")
+
+        # Notifications, targeted at popular users more often
+        notification_base = offsets["notifications"]
+        total = spec.total_notifications
+        types = [t.value for t in NotificationType]
+        for first in range(0, total, spec.batch_size):
+            count = min(spec.batch_size, total - first)
+            targets = pool_base + 1 + rng.choice(pool_size, count, p=user_weights)
+            creators = pool_base + 1 + rng.integers(0, pool_size, count)
+            subtask_refs = subtask_base + 1 + rng.integers(0, max(spec.total_subtasks, 1), count)
+            activity_refs = activity_base + 1 + (subtask_refs - subtask_base - 1) // max(per_activity, 1)
+            kinds = rng.integers(0, len(types), count)
+            read = rng.random(count) < 0.5
+            created = rng.integers(0, spec.date_spread_days + 1, count)
+
+            rows = []
+            for j in range(count):
+                has_subtask = spec.total_subtasks > 0
+                rows.append((
+                    notification_base + first + j + 1, types[kinds[j]], "Sentetik bildirim",
+                    int(activity_refs[j]) if has_subtask else None,
+                    int(subtask_refs[j]) if has_subtask else None,
+                    int(targets[j]), int(creators[j]), bool(read[j]), day_strings[created[j]] + " 09:00:00",
+                    day_strings[created[j]] + " 09:00:00"
+                ))
+            writer.write(
+                "notifications",
+                ("id", "type", "message", "activity_id", "subtask_id", "target_user_id",
+                 "created_by_id", "is_read", "created_at", "updated_at"),
+                rows
+            )
+        report(f"{total} notifications")
+
+        _sync_sequences(connection)
+
+    # The in-process change sequence counter must see the new rows
+    from app.services.sync_service import reset_local_sequence
+    reset_local_sequence()
+
+    return {
+        "users": spec.users,
+        "activities": spec.activities,
+        "topics": spec.total_topics,
+        "subtasks": spec.total_subtasks,
+        "notifications": spec.total_notifications,
+    }
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Gantt dataset")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--create-schema", action="store_true", help="create tables (SQLite / scratch databases)")
+    defaults = DatasetSpec()
+    for field in fields(DatasetSpec):
+        option = "--" + field.name.replace("_", "-")
+        if field.type in (date, "date"):
+            parser.add_argument(option, type=date.fromisoformat, default=getattr(defaults, field.name))
+        else:
+            parser.add_argument(option, type=type(getattr(defaults, field.name)), default=getattr(defaults, field.name))
+    args = parser.parse_args()
+
+    spec = DatasetSpec(**{field.name: getattr(args, field.name) for field in fields(DatasetSpec)})
+    engine = create_engine(args.database_url)
+    if args.create_schema:
+        db.metadata.create_all(engine)
+
+    print(f"Generating {spec.total_subtasks} subtasks into {engine.url.render_as_string()}")
+    t0 = time.perf_counter()
+    counts = generate(engine, spec, progress=True)
+    elapsed = time.perf_counter() - t0
+    print(f"Done in {elapsed:.1f}s: {counts} ({counts['subtasks'] / elapsed:,.0f} subtasks/s)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,407 @@
+# /backend/benchmarks/load_sessions.py
+"""
+Mixed-workload load generator replaying realistic user sessions.
+
+Every virtual user logs in, lists activities, opens a Gantt chart, drags
+bars (PATCH, editors and admins only), polls the unread notification count
+every 30 seconds like NotificationBell.vue and now and then opens the
+notification list and marks one as read. Users are added in stages; each
+stage reports throughput, latency percentiles per endpoint and DB pool
+usage scraped from /api/metrics, which shows where the deployment saturates.
+
+Usage (from /backend):
+    # against the gunicorn container built from backend/Dockerfile
+    python -m benchmarks.load_sessions --url http://localhost:5000 --stages 10,50,100,200
+
+    # in-process threaded server on a generated SQLite dataset
+    python -m benchmarks.load_sessions --in-process --stages 5,20 --stage-seconds 30
+
+Users are the ones created by benchmarks.datagen (user<id>@bench.local).
+--time-scale < 1 shortens think times and the polling interval. The pool
+columns need the server's METRICS_TOKEN (--metrics-token or $METRICS_TOKEN).
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.bench_api import percentile
+from benchmarks.datagen import BENCHMARK_PASSWORD
+
+# Seconds between unread-count polls in NotificationBell.vue
+NOTIFICATION_POLL_SECONDS = 30
+
+# Relative weights of the actions a user takes between polls
+ACTION_WEIGHTS = {
+    "open_gantt": 3,
+    "drag_bar": 6,
+    "list_activities": 1,
+    "open_notifications": 1,
+}
+
+_METRIC_RE = re.compile(r"^(gantt_db_pool_checked_out|gantt_db_pool_overflow)(?:\{[^}]*\})? ([0-9.e+-]+)$", re.M)
+
+
+class Stats:
+    """Thread-safe latency and error collection per endpoint label."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latencies: Dict[str, List[float]] = defaultdict(list)
+            self.errors: Dict[str, int] = defaultdict(int)
+            self.started = time.perf_counter()
+
+    def record(self, label: str, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.latencies[label].append(latency)
+            if not ok:
+                self.errors[label] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            everything = sorted(v for values in self.latencies.values() for v in values)
+            endpoints = {}
+            for label, values in sorted(self.latencies.items()):
+                values = sorted(values)
+                endpoints[label] = {
+                    "requests": len(values),
+                    "errors": self.errors[label],
+                    "p50_ms": round(percentile(values, 50) * 1000, 2),
+                    "p95_ms": round(percentile(values, 95) * 1000, 2),
+                    "p99_ms": round(percentile(values, 99) * 1000, 2),
+                }
+            return {
+                "requests": len(everything),
+                "errors": sum(self.errors.values()),
+                "throughput_rps": round(len(everything) / elapsed, 1) if elapsed else 0.0,
+                "p50_ms": round(percentile(everything, 50) * 1000, 2),
+                "p95_ms": round(percentile(everything, 95) * 1000, 2),
+                "p99_ms": round(percentile(everything, 99) * 1000, 2),
+                "endpoints": endpoints,
+            }
+
+
+class HttpSession:
+    """Keep-alive HTTP connection of one virtual user."""
+
+    def __init__(self, base_url: str, stats: Stats):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._connect = lambda: connection_class(parts.hostname, parts.port, timeout=60)
+        self.connection = self._connect()
+        self.stats = stats
+        self.token: Optional[str] = None
+
+    def request(self, label: str, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, Optional[dict]]:
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = json.dumps(body) if body is not None else None
+
+        t0 = time.perf_counter()
+        try:
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            # Dropped keep-alive connection or refused under overload
+            self.connection.close()
+            self.connection = self._connect()
+            self.stats.record(label, time.perf_counter() - t0, False)
+            return 0, None
+        self.stats.record(label, time.perf_counter() - t0, status < 400)
+
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            return status, None
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class VirtualUser(threading.Thread):
+    """One simulated planner running sessions until stopped."""
+
+    def __init__(self, index: int, args, stats: Stats, stop: threading.Event):
+        super().__init__(name=f"virtual-user-{index}", daemon=True)
+        self.args = args
+        self.stats = stats
+        self.stop_event = stop
+        self.rng = random.Random(args.seed * 100_003 + index)
+        self.user_id = args.first_user_id + index % args.user_pool
+        self.is_admin = False
+        self.is_editor = False
+
+    def think(self) -> None:
+        self.stop_event.wait(self.rng.expovariate(1 / self.args.think_time) * self.args.time_scale)
+
+    def run(self) -> None:
+        session = HttpSession(self.args.url, self.stats)
+        # Spread logins so stages do not start with a thundering herd
+        self.stop_event.wait(self.rng.random() * self.args.think_time * self.args.time_scale)
+        try:
+            while not self.stop_event.is_set():
+                self.run_session(session)
+        finally:
+            session.close()
+
+    def run_session(self, session: HttpSession) -> None:
+        status, data = session.request("login", "POST", "/api/auth/login", {
+            "email": f"user{self.user_id}@bench.local", "password": BENCHMARK_PASSWORD
+        })
+        if status != 200:
+            self.stop_event.wait(1)
+            return
+        session.token = data["token"]
+        self.is_admin = data["user"]["role"] == "admin"
+        self.is_editor = data["user"]["role"] == "editor"
+
+        activities = self.list_activities(session)
+        if not activities:
+            self.stop_event.wait(1)
+            return
+        subtasks, editable = self.open_gantt(session, activities)
+
+        session_end = time.monotonic() + self.args.session_seconds * self.args.time_scale
+        next_poll = time.monotonic()
+        actions = list(ACTION_WEIGHTS)
+        weights = list(ACTION_WEIGHTS.values())
+
+        while not self.stop_event.is_set() and time.monotonic() < session_end:
+            if time.monotonic() >= next_poll:
+                session.request("notifications_unread_count", "GET", "/api/notifications/unread-count")
+                next_poll = time.monotonic() + NOTIFICATION_POLL_SECONDS * self.args.time_scale
+
+            action = self.rng.choices(actions, weights)[0]
+            if action == "open_gantt":
+                subtasks, editable = self.open_gantt(session, activities)
+            elif action == "drag_bar" and editable and subtasks:
+                self.drag_bar(session, subtasks)
+            elif action == "list_activities":
+                activities = self.list_activities(session) or activities
+            elif action == "open_notifications":
+                self.open_notifications(session)
+            self.think()
+
+        session.token = None
+
+    def list_activities(self, session: HttpSession) -> List[dict]:
+        status, data = session.request("activities_list", "GET", "/api/activities")
+        return data["activities"] if status == 200 else []
+
+    def open_gantt(self, session: HttpSession, activities: List[dict]) -> Tuple[List[dict], bool]:
+        """Open a Gantt chart; editors mostly open their own activities."""
+        own = [a for a in activities if a["owner_id"] == self.user_id]
+        if self.is_editor and own and self.rng.random() < 0.8:
+            activity = self.rng.choice(own)
+        else:
+            activity = self.rng.choice(activities)
+
+        status, data = session.request("gantt", "GET", f"/api/activities/{activity['id']}/gantt")
+        # PATCH is allowed for admins and for the owner of the activity
+        editable = self.is_admin or (self.is_editor and activity["owner_id"] == self.user_id)
+        return (data["subtasks"] if status == 200 else []), editable
+
+    def drag_bar(self, session: HttpSession, subtasks: List[dict]) -> None:
+        subtask = self.rng.choice(subtasks)
+        shift = timedelta(days=self.rng.choice((-1, 1)))
+        start = date.fromisoformat(subtask["start_date"]) + shift
+        end = date.fromisoformat(subtask["end_date"]) + shift
+        status, _ = session.request("subtask_patch", "PATCH", f"/api/subtasks/{subtask['id']}", {
+            "start_date": start.isoformat(), "end_date": end.isoformat()
+        })
+        if status == 200:
+            subtask["start_date"], subtask["end_date"] = start.isoformat(), end.isoformat()
+
+    def open_notifications(self, session: HttpSession) -> None:
+        status, data = session.request("notifications_list", "GET", "/api/notifications")
+        if status != 200:
+            return
+        unread = [n for n in data["notifications"] if not n["is_read"]]
+        if unread:
+            session.request("notification_read", "PATCH", f"/api/notifications/{unread[0]['id']}", {"is_read": True})
+
+
+class PoolSampler(threading.Thread):
+    """Scrapes DB pool gauges from /api/metrics once per second."""
+
+    def __init__(self, base_url: str, token: Optional[str]):
+        super().__init__(name="pool-sampler", daemon=True)
+        self.base_url = base_url
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.samples: List[Tuple[float, float]] = []
+        self.available = True
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        parts = urlsplit(self.base_url)
+        while not self._stop_event.wait(1):
+            try:
+                connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=5)
+                connection.request("GET", "/api/metrics", headers=self.headers)
+                body = connection.getresponse().read().decode()
+                connection.close()
+            except (OSError, http.client.HTTPException):
+                continue
+            values = defaultdict(float)
+            for name, value in _METRIC_RE.findall(body):
+                values[name] += float(value)
+            if not values:
+                self.available = False
+            with self._lock:
+                self.samples.append((values["gantt_db_pool_checked_out"], values["gantt_db_pool_overflow"]))
+
+    def take(self) -> dict:
+        with self._lock:
+            samples, self.samples = self.samples, []
+        if not samples or not self.available:
+            return {"checked_out_max": None, "checked_out_mean": None, "overflow_max": None}
+        return {
+            "checked_out_max": max(s[0] for s in samples),
+            "checked_out_mean": round(statistics.fmean(s[0] for s in samples), 2),
+            "overflow_max": max(s[1] for s in samples),
+        }
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_in_process_server(database_url: Optional[str], port: int, metrics_token: str) -> str:
+    """Generate a dataset if needed and serve the app from a threaded server."""
+    from werkzeug.serving import make_server
+
+    from app import create_app
+    from app.config import Config
+    from app.db import db
+    from benchmarks.bench_api import prepare_dataset
+
+    generate_data = not database_url
+    if generate_data:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gantt-load-"), "load.db")
+
+    class LoadConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+        METRICS_TOKEN = metrics_token
+
+    app = create_app(LoadConfig)
+    if generate_data:
+        with app.app_context():
+            print(f"Generating dataset into {database_url}")
+            prepare_dataset(db.engine)
+
+    server = make_server("127.0.0.1", port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="load-server", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def find_saturation(stages: List[dict]) -> Optional[int]:
+    """
+    User count after which adding users no longer adds throughput.
+
+    A stage saturates when it gains less than 10% throughput over the
+    previous stage while its p95 latency grows by more than 50%.
+    """
+    for previous, current in zip(stages, stages[1:]):
+        gain = current["throughput_rps"] / previous["throughput_rps"] if previous["throughput_rps"] else 0
+        slowdown = current["p95_ms"] / previous["p95_ms"] if previous["p95_ms"] else 0
+        if gain < 1.1 and slowdown > 1.5:
+            return previous["users"]
+    return None
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Replay mixed user sessions against the API")
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--in-process", action="store_true", help="serve the app from this process")
+    parser.add_argument("--database-url", help="with --in-process: existing database instead of a generated one")
+    parser.add_argument("--port", type=int, default=0, help="with --in-process: port (0 = any free port)")
+    parser.add_argument("--stages", default="10,50,100", help="concurrent user counts, one stage each")
+    parser.add_argument("--stage-seconds", type=float, default=60)
+    parser.add_argument("--think-time", type=float, default=3.0, help="mean seconds between actions")
+    parser.add_argument("--session-seconds", type=float, default=300, help="session length before re-login")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiplier for think/poll/session times")
+    parser.add_argument("--first-user-id", type=int, default=1)
+    parser.add_argument("--user-pool", type=int, default=200, help="number of generated users to log in as")
+    parser.add_argument("--metrics-token", default=os.environ.get("METRICS_TOKEN"),
+                        help="METRICS_TOKEN of the server, for the pool gauges (default: $METRICS_TOKEN)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="load-sessions.json")
+    args = parser.parse_args()
+
+    if args.in_process:
+        args.metrics_token = args.metrics_token or "load-sessions"
+        args.url = start_in_process_server(args.database_url, args.port, args.metrics_token)
+    print(f"Target: {args.url}")
+
+    stats = Stats()
+    stop = threading.Event()
+    sampler = PoolSampler(args.url, args.metrics_token)
+    sampler.start()
+
+    users: List[VirtualUser] = []
+    stages = []
+    for target in (int(n) for n in args.stages.split(",")):
+        while len(users) < target:
+            user = VirtualUser(len(users), args, stats, stop)
+            user.start()
+            users.append(user)
+
+        stats.reset()
+        sampler.take()
+        time.sleep(args.stage_seconds)
+
+        stage = {"users": target, **stats.snapshot(), "db_pool": sampler.take()}
+        stages.append(stage)
+        print(
+            f"users {target:>5}  {stage['throughput_rps']:>8} req/s  p50 {stage['p50_ms']:>8} ms  "
+            f"p95 {stage['p95_ms']:>8} ms  p99 {stage['p99_ms']:>8} ms  errors {stage['errors']}  "
+            f"pool max {stage['db_pool']['checked_out_max']}"
+        )
+
+    stop.set()
+    sampler.stop()
+    for user in users:
+        user.join(timeout=5)
+
+    saturation = find_saturation(stages)
+    report = {
+        "meta": {
+            "url": args.url,
+            "in_process": args.in_process,
+            "stage_seconds": args.stage_seconds,
+            "think_time": args.think_time,
+            "time_scale": args.time_scale,
+            "seed": args.seed,
+        },
+        "stages": stages,
+        "saturation_users": saturation,
+        "peak_throughput_rps": max((s["throughput_rps"] for s in stages), default=0.0),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\nPeak throughput: {report['peak_throughput_rps']} req/s"
+          + (f", saturates above {saturation} users" if saturation else ""))
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,110 @@
+# /backend/benchmarks/load_ws_subscribers.py
+"""
+Load test for live Gantt updates: many WebSocket subscribers in one room.
+
+Opens SUBSCRIBERS connections to one activity room, patches a subtask and
+measures how long each subscriber takes to receive the change event.
+--ws-url points the sockets at a separate WebSocket server such as the
+realtime service of infra/docker-compose.yml; the patch goes to --url.
+
+Usage (from /backend, against a running server):
+    python -m benchmarks.load_ws_subscribers --url http://localhost:5000 \\
+        --token <jwt> --activity 1 --subtask 1 --subscribers 1000
+    python -m benchmarks.load_ws_subscribers --url http://localhost:5000 --ws-url http://localhost:5001 \\
+        --token <jwt> --activity 1 --subtask 1 --subscribers 1000
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.request
+
+from simple_websocket import Client
+
+
+def subscriber(ws_url: str, connected: list, failed: list, received: list, subtask_id: int) -> None:
+    """Connect, wait for the patch and record the arrival time of its event."""
+    try:
+        ws = Client.connect(ws_url)
+    except Exception:
+        failed.append(1)
+        return
+    try:
+        if ws.receive(timeout=10) is None:  # "subscribed"
+            failed.append(1)
+            return
+        connected.append(1)
+        while True:
+            message = ws.receive(timeout=60)
+            if message is None:
+                return
+            event = json.loads(message)
+            if event.get("type") == "change" and event.get("id") == subtask_id:
+                received.append(time.perf_counter())
+                return
+    finally:
+        ws.close()
+
+
+def patch_subtask(base_url: str, token: str, subtask_id: int) -> None:
+    """Send a progress update that triggers one change event."""
+    body = json.dumps({"progress_percent": int(time.time()) % 100}).encode()
+    req = urllib.request.Request(
+        f"{base_url}/api/subtasks/{subtask_id}",
+        data=body,
+        method="PATCH",
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    )
+    urllib.request.urlopen(req, timeout=30).read()
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--ws-url", help="WebSocket server (default: --url)")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--activity", type=int, required=True)
+    parser.add_argument("--subtask", type=int, required=True)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--connect-timeout", type=float, default=60, help="seconds to wait for all handshakes")
+    args = parser.parse_args()
+
+    ws_base = (args.ws_url or args.url).replace("http", "ws", 1)
+    ws_url = f"{ws_base}/api/ws/activities/{args.activity}?token={args.token}"
+    connected, failed, received = [], [], []
+
+    t0 = time.perf_counter()
+    threads = [
+        threading.Thread(target=subscriber, args=(ws_url, connected, failed, received, args.subtask), daemon=True)
+        for _ in range(args.subscribers)
+    ]
+    for thread in threads:
+        thread.start()
+    # Handshakes a server cannot serve hang, so stop waiting at the deadline
+    deadline = t0 + args.connect_timeout
+    while len(connected) + len(failed) < args.subscribers and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    print(
+        f"{len(connected)}/{args.subscribers} subscribers connected in {time.perf_counter() - t0:.2f}s "
+        f"({len(failed)} failed, {args.subscribers - len(connected) - len(failed)} pending)"
+    )
+
+    sent = time.perf_counter()
+    patch_subtask(args.url, args.token, args.subtask)
+    deadline = time.perf_counter() + 30
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.perf_counter()))
+
+    latencies = sorted((t - sent) * 1000 for t in received)
+    print(f"received: {len(latencies)}/{args.subscribers}")
+    if latencies:
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+        print(
+            f"fan-out latency ms: median {statistics.median(latencies):.1f}  "
+            f"p95 {p95:.1f}  max {latencies[-1]:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
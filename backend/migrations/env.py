@@ -15,7 +15,7 @@ from alembic import context
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db import db
-from app.models import User, Activity, Topic, SubTask  # noqa: F401
+from app.models import User, Activity, Topic, SubTask, Notification, Tombstone  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,54 @@
+"""Add change sequence and tombstones for Gantt delta sync
+
+Revision ID: 003_delta_sync
+Revises: 002_notifications
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '003_delta_sync'
+down_revision: Union[str, None] = '002_notifications'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Global monotonic change sequence
+    op.execute("CREATE SEQUENCE IF NOT EXISTS gantt_change_seq")
+
+    op.add_column('topics', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('subtasks', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+
+    # Delta queries are index range scans on these
+    op.create_index('ix_topics_activity_id_change_seq', 'topics', ['activity_id', 'change_seq'])
+    op.create_index('ix_subtasks_change_seq', 'subtasks', ['change_seq'])
+
+    # Create tombstones table
+    op.create_table(
+        'gantt_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('activity_id', sa.Integer(), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['activity_id'], ['activities.id'], ondelete='CASCADE')
+    )
+    op.create_index(
+        'ix_gantt_tombstones_activity_id_change_seq', 'gantt_tombstones', ['activity_id', 'change_seq']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_gantt_tombstones_activity_id_change_seq', table_name='gantt_tombstones')
+    op.drop_table('gantt_tombstones')
+    op.drop_index('ix_subtasks_change_seq', table_name='subtasks')
+    op.drop_index('ix_topics_activity_id_change_seq', table_name='topics')
+    op.drop_column('subtasks', 'change_seq')
+    op.drop_column('topics', 'change_seq')
+    op.execute("DROP SEQUENCE IF EXISTS gantt_change_seq")
@@ -0,0 +1,42 @@
+"""Add full-text search vectors with GIN indexes
+
+Revision ID: 004_full_text_search
+Revises: 003_delta_sync
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '004_full_text_search'
+down_revision: Union[str, None] = '003_delta_sync'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, title column); mirrors app/search_index.py
+SEARCH_TABLES = (
+    ('activities', 'name'),
+    ('topics', 'title'),
+    ('subtasks', 'title'),
+)
+
+
+def upgrade() -> None:
+    # Stored generated columns rewrite the table once; afterwards PostgreSQL
+    # keeps the vectors current on every insert and update
+    for table, title_column in SEARCH_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('simple', coalesce({title_column}, '')), 'A') || "
+            f"setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    for table, _ in reversed(SEARCH_TABLES):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
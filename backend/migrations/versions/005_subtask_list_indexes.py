@@ -0,0 +1,28 @@
+"""Add indexes for the cross-activity subtask list
+
+Revision ID: 005_subtask_list_indexes
+Revises: 004_full_text_search
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '005_subtask_list_indexes'
+down_revision: Union[str, None] = '004_full_text_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /api/subtasks: keyset range scan of one assignee by end date
+    op.create_index('ix_subtasks_assignee_id_end_date', 'subtasks', ['assignee_id', 'end_date'])
+    # Subtasks of a topic (Gantt loads, cascading deletes). topics.activity_id
+    # is already covered by ix_topics_activity_id_change_seq from 003.
+    op.create_index('ix_subtasks_topic_id', 'subtasks', ['topic_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subtasks_topic_id', table_name='subtasks')
+    op.drop_index('ix_subtasks_assignee_id_end_date', table_name='subtasks')
@@ -0,0 +1,54 @@
+"""Add working-day calendars
+
+Revision ID: 006_work_calendars
+Revises: 005_subtask_list_indexes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '006_work_calendars'
+down_revision: Union[str, None] = '005_subtask_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'calendars',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('weekmask', sa.String(7), nullable=False, server_default='1111100'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+
+    op.create_table(
+        'calendar_holidays',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('calendar_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('name', sa.String(255), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='CASCADE'),
+        # Also serves the per-calendar holiday lookup
+        sa.UniqueConstraint('calendar_id', 'day', name='uq_calendar_holidays_calendar_id_day')
+    )
+
+    # NULL = default Monday-Friday week
+    op.add_column('activities', sa.Column('calendar_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_activities_calendar_id', 'activities', 'calendars', ['calendar_id'], ['id'], ondelete='SET NULL'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_activities_calendar_id', 'activities', type_='foreignkey')
+    op.drop_column('activities', 'calendar_id')
+    op.drop_table('calendar_holidays')
+    op.drop_table('calendars')
@@ -0,0 +1,25 @@
+"""Index subtasks.updated_at for incremental analytics exports
+
+Revision ID: 007_subtask_updated_at_index
+Revises: 006_work_calendars
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '007_subtask_updated_at_index'
+down_revision: Union[str, None] = '006_work_calendars'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # export_analytics.py --incremental: range scan past the last watermark.
+    # notifications.created_at is indexed since 002; the other tables are small.
+    op.create_index('ix_subtasks_updated_at', 'subtasks', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subtasks_updated_at', table_name='subtasks')
@@ -0,0 +1,43 @@
+"""Record deletions and notification updates for incremental analytics exports
+
+Revision ID: 008_analytics_deletions
+Revises: 007_subtask_updated_at_index
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '008_analytics_deletions'
+down_revision: Union[str, None] = '007_subtask_updated_at_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No foreign keys: rows outlive the deleted activity and its tombstones
+    op.create_table(
+        'analytics_deletions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('activity_id', sa.Integer(), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analytics_deletions_deleted_at', 'analytics_deletions', ['deleted_at'])
+
+    # is_read changes move the watermark; existing rows start at created_at
+    op.add_column('notifications', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE notifications SET updated_at = created_at")
+    op.alter_column('notifications', 'updated_at', nullable=False)
+    op.create_index('ix_notifications_updated_at', 'notifications', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_updated_at', table_name='notifications')
+    op.drop_column('notifications', 'updated_at')
+    op.drop_index('ix_analytics_deletions_deleted_at', table_name='analytics_deletions')
+    op.drop_table('analytics_deletions')
@@ -0,0 +1,92 @@
+# /backend/tests/conftest.py
+"""
+Shared pytest fixtures for backend tests.
+"""
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.config import TestingConfig
+from app.db import db
+from app.models import User, UserRole
+from app.auth.utils import generate_token
+
+
+@pytest.fixture
+def app():
+    """Application with a fresh in-memory SQLite database."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """Flask test client."""
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_user(app):
+    """Active admin user."""
+    user = User(
+        email="admin@test.local",
+        password_hash="not-used",
+        full_name="Test Admin",
+        role=UserRole.ADMIN,
+        is_active=True
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(admin_user):
+    """Authorization headers for the admin user."""
+    return {"Authorization": f"Bearer {generate_token(admin_user)}"}
+
+
+class QueryCounter:
+    """SQL statements executed while a count_queries block was open."""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __str__(self) -> str:
+        return "\n".join(self.statements)
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    Context manager counting SQL statements on the app engine.
+
+    Usage:
+        with count_queries() as counter:
+            client.get(...)
+        assert counter.count <= 3, counter
+    """
+    @contextmanager
+    def counting():
+        counter = QueryCounter()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            counter.statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield counter
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return counting
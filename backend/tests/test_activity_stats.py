@@ -0,0 +1,74 @@
+# /backend/tests/test_activity_stats.py
+"""
+Tests for activity list rollup aggregates.
+"""
+from datetime import date, timedelta
+
+from app.db import db
+from app.models import Activity, Topic, SubTask, SubTaskStatus
+
+
+def _create_activity(owner_id: int) -> Activity:
+    today = date.today()
+    activity = Activity(
+        name="Rollup",
+        start_date=today - timedelta(days=10),
+        end_date=today + timedelta(days=10),
+        owner_id=owner_id
+    )
+    db.session.add(activity)
+    db.session.commit()
+
+    topic = Topic(activity_id=activity.id, title="Topic")
+    db.session.add(topic)
+    db.session.commit()
+
+    db.session.add_all([
+        # 3 days, completed via progress
+        SubTask(topic_id=topic.id, title="Done", start_date=today - timedelta(days=10),
+                end_date=today - timedelta(days=8), status=SubTaskStatus.IN_PROGRESS,
+                progress_percent=100),
+        # 1 day, overdue
+        SubTask(topic_id=topic.id, title="Late", start_date=today - timedelta(days=2),
+                end_date=today - timedelta(days=2), status=SubTaskStatus.PLANNED),
+        # 6 days, in progress
+        SubTask(topic_id=topic.id, title="Running", start_date=today,
+                end_date=today + timedelta(days=5), status=SubTaskStatus.IN_PROGRESS,
+                progress_percent=50),
+    ])
+    db.session.commit()
+    return activity
+
+
+class TestActivityStats:
+    """Tests for GET /api/activities aggregates."""
+
+    def test_list_includes_rollup_stats(self, client, admin_user, auth_headers):
+        """Should return effective status counts and duration-weighted progress."""
+        activity = _create_activity(admin_user.id)
+
+        response = client.get("/api/activities", headers=auth_headers)
+
+        assert response.status_code == 200
+        stats = response.get_json()["activities"][0]["stats"]
+        assert stats["subtask_count"] == 3
+        assert stats["status_counts"] == {
+            "PLANNED": 0, "IN_PROGRESS": 1, "COMPLETED": 1, "OVERDUE": 1
+        }
+        assert stats["overdue_count"] == 1
+        # (100 * 3 + 0 * 1 + 50 * 6) / 10
+        assert stats["progress_percent"] == 60.0
+        assert stats["actual_start_date"] == activity.start_date.isoformat()
+
+    def test_subtask_write_invalidates_cache(self, client, admin_user, auth_headers):
+        """Should recompute aggregates after a subtask is patched."""
+        _create_activity(admin_user.id)
+        client.get("/api/activities", headers=auth_headers)
+        late = db.session.query(SubTask).filter_by(title="Late").one()
+
+        client.patch(f"/api/subtasks/{late.id}", json={"progress_percent": 100}, headers=auth_headers)
+        response = client.get("/api/activities", headers=auth_headers)
+
+        stats = response.get_json()["activities"][0]["stats"]
+        assert stats["status_counts"]["COMPLETED"] == 2
+        assert stats["overdue_count"] == 0
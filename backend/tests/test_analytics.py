@@ -0,0 +1,156 @@
+# /backend/tests/test_analytics.py
+"""
+Tests for the Parquet / Arrow analytics export.
+"""
+import io
+import os
+from datetime import date, datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from app.db import db
+from app.models import Activity, Notification, SubTask, SubTaskStatus, Topic
+from app.services import analytics_service
+from app.services.analytics_service import export_dataset, load_watermarks
+
+
+@pytest.fixture(autouse=True)
+def no_watermark_lag(monkeypatch):
+    """Rows written by the test are a few milliseconds old."""
+    monkeypatch.setattr(analytics_service, "WATERMARK_LAG", timedelta(0))
+
+
+@pytest.fixture
+def activities(admin_user):
+    """Two activities in different months with two subtasks each."""
+    result = []
+    for month in (1, 2):
+        activity = Activity(name=f"Faaliyet {month}", start_date=date(2025, month, 1),
+                            end_date=date(2025, month, 28), owner_id=admin_user.id)
+        db.session.add(activity)
+        db.session.flush()
+        topic = Topic(activity_id=activity.id, title="Konu")
+        db.session.add(topic)
+        db.session.flush()
+        db.session.add_all([
+            SubTask(topic_id=topic.id, title=f"Görev {month}.{i}", start_date=date(2025, month, 1 + i),
+                    end_date=date(2025, month, 10 + i), status=SubTaskStatus.IN_PROGRESS, assignee_id=admin_user.id)
+            for i in range(2)
+        ])
+        result.append(activity)
+    db.session.commit()
+    return result
+
+
+class TestAnalyticsEndpoint:
+    """Tests for GET /api/admin/analytics/:table.<format>."""
+
+    def test_parquet_types(self, client, auth_headers, activities):
+        """Should stream typed columns with dictionary-encoded enums."""
+        response = client.get("/api/admin/analytics/subtasks.parquet", headers=auth_headers)
+        assert response.status_code == 200
+        assert datetime.fromisoformat(response.headers["X-Export-Watermark"])
+
+        table = pq.read_table(io.BytesIO(response.get_data()))
+
+        assert table.num_rows == 4
+        assert table.schema.field("start_date").type == pa.date32()
+        assert table.schema.field("updated_at").type == pa.timestamp("us")
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert set(table.column("status").to_pylist()) == {"IN_PROGRESS"}
+        assert sorted(table.column("activity_id").to_pylist()) == sorted([a.id for a in activities] * 2)
+
+    def test_arrow_stream_since(self, client, auth_headers, activities):
+        """Should only return rows changed after the since watermark."""
+        db.session.query(SubTask).update({"updated_at": datetime(2025, 1, 1)})
+        subtask = db.session.query(SubTask).first()
+        subtask.progress_percent = 50
+        db.session.commit()
+
+        response = client.get("/api/admin/analytics/subtasks.arrow?since=2025-06-01T00:00:00",
+                              headers=auth_headers)
+
+        table = pa.ipc.open_stream(response.get_data()).read_all()
+        assert table.column("id").to_pylist() == [subtask.id]
+        users = pa.ipc.open_stream(
+            client.get("/api/admin/analytics/users.arrow", headers=auth_headers).get_data()
+        ).read_all()
+        assert "password_hash" not in users.schema.names
+
+    def test_invalid_requests(self, client, auth_headers):
+        assert client.get("/api/admin/analytics/secrets.parquet", headers=auth_headers).status_code == 404
+        response = client.get("/api/admin/analytics/users.parquet?since=dün", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestExportDataset:
+    """Tests for file exports with partitioning and watermarks."""
+
+    def test_partition_by_activity(self, app, activities, tmp_path):
+        """Should write hive partitions per activity and leave users unpartitioned."""
+        summary = export_dataset(db.session, str(tmp_path), ["subtasks", "users"], partition="activity")
+
+        assert summary["subtasks"]["rows"] == 4
+        assert sorted(os.listdir(tmp_path / "subtasks")) == sorted(f"activity_id={a.id}" for a in activities)
+        assert ds.dataset(tmp_path / "users").to_table().num_rows == 1
+
+    def test_partition_by_month_as_arrow(self, app, activities, tmp_path):
+        export_dataset(db.session, str(tmp_path), ["activities"], fmt="arrow", partition="month")
+
+        dataset = ds.dataset(tmp_path / "activities", format="ipc", partitioning="hive")
+        assert sorted(os.listdir(tmp_path / "activities")) == ["month=2025-01", "month=2025-02"]
+        assert dataset.to_table().num_rows == 2
+
+    def test_incremental(self, app, activities, tmp_path):
+        """Should add only rows changed since the saved watermark."""
+        export_dataset(db.session, str(tmp_path), ["subtasks"])
+        first_watermark = load_watermarks(str(tmp_path))["subtasks"]
+
+        subtask = db.session.query(SubTask).order_by(SubTask.id).first()
+        subtask.updated_at = first_watermark + timedelta(microseconds=1)
+        db.session.commit()
+        summary = export_dataset(db.session, str(tmp_path), ["subtasks"], incremental=True)
+
+        assert summary["subtasks"]["rows"] == 1
+        assert load_watermarks(str(tmp_path))["subtasks"] > first_watermark
+        table = ds.dataset(tmp_path / "subtasks").to_table()
+        # Consumers keep the newest version of each id
+        assert table.num_rows == 5
+        assert table.column("id").to_pylist().count(subtask.id) == 2
+
+        # A full export starts over
+        summary = export_dataset(db.session, str(tmp_path), ["subtasks"])
+        assert ds.dataset(tmp_path / "subtasks").to_table().num_rows == 4
+
+    def test_incremental_deletions(self, app, client, auth_headers, activities, tmp_path):
+        """Should export deleted activities with their topics and subtasks."""
+        export_dataset(db.session, str(tmp_path), ["activities", "subtasks"])
+        activity = activities[0]
+        subtask_ids = sorted(st.id for st in activity.topics[0].subtasks)
+
+        assert client.delete(f"/api/activities/{activity.id}", headers=auth_headers).status_code == 200
+        summary = export_dataset(db.session, str(tmp_path), ["activities", "subtasks"], incremental=True)
+
+        assert summary["deletions"]["rows"] == 4
+        deletions = ds.dataset(tmp_path / "deletions").to_table().to_pylist()
+        assert {(d["entity_type"], d["activity_id"]) for d in deletions} == {
+            ("activity", activity.id), ("topic", activity.id), ("subtask", activity.id)
+        }
+        assert sorted(d["entity_id"] for d in deletions if d["entity_type"] == "subtask") == subtask_ids
+
+    def test_incremental_read_flags(self, app, client, auth_headers, admin_user, tmp_path):
+        """Should pick up notifications marked as read after the last export."""
+        notification = Notification(type="TASK_ASSIGNED", message="Görev atandı", target_user_id=admin_user.id)
+        db.session.add(notification)
+        db.session.commit()
+        export_dataset(db.session, str(tmp_path), ["notifications"])
+
+        client.patch(f"/api/notifications/{notification.id}", json={"is_read": True}, headers=auth_headers)
+        summary = export_dataset(db.session, str(tmp_path), ["notifications"], incremental=True)
+
+        assert summary["notifications"]["rows"] == 1
+        table = ds.dataset(tmp_path / "notifications").to_table()
+        assert table.column("is_read").to_pylist() == [False, True]
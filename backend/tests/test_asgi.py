@@ -0,0 +1,178 @@
+# /backend/tests/test_asgi.py
+"""
+Tests for the asyncio read path: the async handlers must return the same
+JSON as the Flask routes they stand in for.
+"""
+import asyncio
+import json
+
+import pytest
+
+from app import create_app
+from app.asgi import async_database_url, create_asgi_app
+from app.config import TestingConfig
+from app.db import db
+from app.models import User, UserRole
+from app.services.realtime_service import realtime_service
+from app.auth.utils import generate_token
+from tests.test_query_budgets import SeedData
+
+
+@pytest.fixture
+def stack(tmp_path):
+    """Flask app, ASGI app and auth headers on a shared SQLite file."""
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'gantt.db'}"
+
+    flask_app = create_app(FileConfig)
+    with flask_app.app_context():
+        db.create_all()
+        admin = User(email="admin@test.local", password_hash="x", full_name="Admin", role=UserRole.ADMIN)
+        db.session.add(admin)
+        db.session.commit()
+        seed = SeedData(admin)
+        seed.add(3)
+
+        asgi_app = create_asgi_app(flask_app)
+        loop = asyncio.new_event_loop()
+        yield flask_app, asgi_app, loop, seed, {"Authorization": f"Bearer {generate_token(admin)}"}
+        loop.run_until_complete(asgi_app.primary.dispose())
+        loop.close()
+        db.session.remove()
+        db.drop_all()
+
+
+def asgi_get(stack, path: str, headers: dict = None, query: str = ""):
+    """(status, parsed JSON body) of a GET through the ASGI app."""
+    _, asgi_app, loop, _, _ = stack
+    messages = []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": query.encode(), "server": ("test", 80),
+        "client": ("127.0.0.1", 1),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    loop.run_until_complete(asgi_app(scope, receive, send))
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return messages[0]["status"], json.loads(body)
+
+
+class TestAsyncReadPath:
+    """Tests for AsyncReadApp."""
+
+    def test_database_url_mapping(self):
+        """Should swap in the asyncio driver of the same backend."""
+        assert async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+        assert async_database_url("sqlite:////tmp/x.db") == "sqlite+aiosqlite:////tmp/x.db"
+
+    @pytest.mark.parametrize("query", ["", "lod=binned", "scale=week&locale=en"])
+    def test_gantt_matches_flask(self, stack, query):
+        """Should return the same Gantt body as the Flask route."""
+        flask_app, _, _, seed, headers = stack
+        path = f"/api/activities/{seed.activity.id}/gantt"
+
+        status, body = asgi_get(stack, path, headers, query)
+        expected = flask_app.test_client().get(f"{path}?{query}", headers=headers)
+
+        assert status == 200
+        assert body == expected.get_json()
+
+    def test_notifications_match_flask(self, stack):
+        """Should return the same notifications and unread count."""
+        flask_app, _, _, _, headers = stack
+        client = flask_app.test_client()
+
+        for path in ("/api/notifications", "/api/notifications/unread-count"):
+            status, body = asgi_get(stack, path, headers)
+            assert status == 200
+            assert body == client.get(path, headers=headers).get_json()
+
+    def test_errors(self, stack):
+        """Should reject missing tokens and unknown activities like Flask."""
+        _, _, _, seed, headers = stack
+
+        assert asgi_get(stack, "/api/notifications")[0] == 401
+        assert asgi_get(stack, "/api/activities/999/gantt", headers)[0] == 404
+        status, body = asgi_get(stack, f"/api/activities/{seed.activity.id}/gantt", headers, "lod=x")
+        assert (status, body["error"]) == (400, "Geçersiz lod değeri")
+
+    def test_other_routes_fall_through_to_flask(self, stack):
+        """Should serve delta syncs and other routes with the Flask app."""
+        _, _, _, seed, headers = stack
+
+        status, body = asgi_get(stack, f"/api/activities/{seed.activity.id}/gantt", headers, "since=0")
+        assert status == 200
+        assert body["delta"] is True
+        assert asgi_get(stack, "/api/health")[1]["status"] == "ok"
+
+
+def asgi_websocket(stack, path: str, query: str, on_message) -> list:
+    """
+    Messages sent by the ASGI app on a WebSocket connection.
+
+    on_message(message) runs in a worker thread for every message and
+    returns True once the client should disconnect.
+    """
+    _, asgi_app, loop, _, _ = stack
+    scope = {
+        "type": "websocket", "asgi": {"version": "3.0"}, "scheme": "ws", "path": path,
+        "raw_path": path.encode(), "root_path": "", "query_string": query.encode(), "headers": [],
+        "server": ("test", 80), "client": ("127.0.0.1", 1), "subprotocols": [],
+    }
+    messages = []
+
+    async def run():
+        incoming = asyncio.Queue()
+        await incoming.put({"type": "websocket.connect"})
+
+        async def receive():
+            return await incoming.get()
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "websocket.close" or await loop.run_in_executor(None, on_message, message):
+                await incoming.put({"type": "websocket.disconnect", "code": 1000})
+
+        await asyncio.wait_for(asgi_app(scope, receive, send), 5)
+
+    loop.run_until_complete(run())
+    return messages
+
+
+class TestAsyncActivityUpdates:
+    """Tests for the WebSocket route of AsyncReadApp."""
+
+    def test_streams_events_from_other_threads(self, stack):
+        """Should forward events dispatched on another thread and unsubscribe on disconnect."""
+        _, _, _, seed, headers = stack
+        activity_id = seed.activity.id
+        token = headers["Authorization"].split(" ")[1]
+
+        def on_message(message):
+            event = json.loads(message.get("text") or "{}")
+            if event.get("type") == "subscribed":
+                realtime_service.hub.dispatch(activity_id, '{"type":"change","id":7}')
+            return event.get("type") == "change"
+
+        messages = asgi_websocket(stack, f"/api/ws/activities/{activity_id}", f"token={token}", on_message)
+
+        assert messages[0]["type"] == "websocket.accept"
+        assert [json.loads(m["text"])["type"] for m in messages[1:]] == ["subscribed", "change"]
+        assert realtime_service.hub.subscriber_count(activity_id) == 0
+
+    def test_rejects_bad_token_and_unknown_activity(self, stack):
+        _, _, _, seed, headers = stack
+        token = headers["Authorization"].split(" ")[1]
+
+        for path, query in ((f"/api/ws/activities/{seed.activity.id}", "token=x"),
+                            ("/api/ws/activities/999", f"token={token}")):
+            messages = asgi_websocket(stack, path, query, lambda message: False)
+            assert (messages[-1]["type"], messages[-1]["code"]) == ("websocket.close", 1008)
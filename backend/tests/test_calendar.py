@@ -0,0 +1,114 @@
+# /backend/tests/test_calendar.py
+"""
+Tests for working-day calendars.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.db import db
+from app.models import Activity, Topic, SubTask
+from app.services.calendar_service import CompiledCalendar, to_datetime64
+
+# 2025-01-01 is a Wednesday
+NEW_YEAR = {"date": "2025-01-01", "name": "Yılbaşı"}
+
+
+class TestCompiledCalendar:
+    """Tests for CompiledCalendar arithmetic."""
+
+    def test_inclusive_working_days(self):
+        """Should count both ends and skip weekends and holidays."""
+        calendar = CompiledCalendar(holidays=[date(2025, 1, 1)])
+
+        assert calendar.working_days_between(date(2024, 12, 30), date(2025, 1, 5)) == 4
+        assert calendar.working_days_between(date(2025, 1, 4), date(2025, 1, 5)) == 0
+        assert calendar.working_days_between(date(2025, 1, 6), date(2025, 1, 3)) == 0
+        assert CompiledCalendar("1111110").working_days_between(date(2025, 1, 6), date(2025, 1, 12)) == 6
+
+    def test_vectorized_matches_scalar(self):
+        """Should give the same counts for arrays as one by one."""
+        calendar = CompiledCalendar(holidays=[date(2025, 1, 1), date(2025, 4, 23)])
+        rng = np.random.default_rng(7)
+        starts = [date.fromordinal(date(2025, 1, 1).toordinal() + int(d)) for d in rng.integers(0, 200, 500)]
+        ends = [date.fromordinal(s.toordinal() + int(d)) for s, d in zip(starts, rng.integers(0, 60, 500))]
+
+        counts = calendar.working_days(to_datetime64(starts), to_datetime64(ends))
+
+        assert counts.tolist() == [calendar.working_days_between(s, e) for s, e in zip(starts, ends)]
+
+    def test_add_working_days(self):
+        """Should step over weekends and holidays, rolling non-working starts forward."""
+        calendar = CompiledCalendar(holidays=[date(2025, 1, 1)])
+
+        result = calendar.add_working_days(to_datetime64([date(2024, 12, 31), date(2025, 1, 4)]), np.array([1, 0]))
+
+        assert result.astype(object).tolist() == [date(2025, 1, 2), date(2025, 1, 6)]
+
+
+@pytest.fixture
+def activity(admin_user):
+    """Activity over the first week of 2025 with one subtask per day."""
+    activity = Activity(name="Plan", start_date=date(2024, 12, 30), end_date=date(2025, 1, 5),
+                        owner_id=admin_user.id)
+    db.session.add(activity)
+    db.session.flush()
+    topic = Topic(activity_id=activity.id, title="Topic")
+    db.session.add(topic)
+    db.session.flush()
+    db.session.add(SubTask(topic_id=topic.id, title="Week", start_date=date(2024, 12, 30), end_date=date(2025, 1, 5)))
+    db.session.commit()
+    return activity
+
+
+class TestCalendarApi:
+    """Tests for calendar routes and working-day durations in responses."""
+
+    def _gantt(self, client, auth_headers, activity):
+        return client.get(f"/api/activities/{activity.id}/gantt", headers=auth_headers).get_json()
+
+    def test_gantt_uses_activity_calendar(self, client, auth_headers, activity):
+        """Should report durations on the activity's calendar and follow its edits."""
+        body = self._gantt(client, auth_headers, activity)
+        assert (body["activity"]["working_days"], body["subtasks"][0]["working_days"]) == (5, 5)
+
+        response = client.post("/api/calendars", headers=auth_headers,
+                               json={"name": "TR", "holidays": [NEW_YEAR]})
+        assert response.status_code == 201
+        calendar_id = response.get_json()["calendar"]["id"]
+        client.put(f"/api/activities/{activity.id}", headers=auth_headers, json={"calendar_id": calendar_id})
+        assert self._gantt(client, auth_headers, activity)["subtasks"][0]["working_days"] == 4
+
+        # Re-adding an existing date must not trip the unique constraint
+        response = client.put(f"/api/calendars/{calendar_id}", headers=auth_headers, json={
+            "weekmask": "1111110", "holidays": [NEW_YEAR, {"date": "2025-01-02"}]
+        })
+        assert response.status_code == 200
+        assert len(response.get_json()["calendar"]["holidays"]) == 2
+        assert self._gantt(client, auth_headers, activity)["subtasks"][0]["working_days"] == 4
+
+        client.delete(f"/api/calendars/{calendar_id}", headers=auth_headers)
+        body = self._gantt(client, auth_headers, activity)
+        assert (body["activity"]["calendar_id"], body["subtasks"][0]["working_days"]) == (None, 5)
+
+    def test_weekend_dates_warn(self, client, auth_headers, activity):
+        """Should warn when a subtask starts or ends on a non-working day."""
+        subtask_id = self._gantt(client, auth_headers, activity)["subtasks"][0]["id"]
+
+        response = client.patch(f"/api/subtasks/{subtask_id}", headers=auth_headers,
+                                json={"end_date": "2025-01-04"})
+
+        body = response.get_json()
+        assert body["warnings"] == ["Bitiş tarihi çalışma günü değil"]
+        assert body["subtask"]["working_days"] == 5
+
+    @pytest.mark.parametrize("payload", [
+        {"name": "X", "weekmask": "0000000"},
+        {"name": "X", "weekmask": "11111"},
+        {"name": "X", "holidays": [{"date": "2025-02-30"}]},
+        {"weekmask": "1111100"},
+    ])
+    def test_invalid_calendar(self, client, auth_headers, payload):
+        """Should reject bad weekmasks, holiday dates and missing names."""
+        assert client.post("/api/calendars", headers=auth_headers, json=payload).status_code == 400
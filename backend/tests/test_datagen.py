@@ -0,0 +1,51 @@
+# /backend/tests/test_datagen.py
+"""
+Tests for the synthetic benchmark data generator.
+"""
+from sqlalchemy import create_engine, func, select
+
+from app.db import db
+from app.models import Activity, SubTask, Notification, User
+from benchmarks.datagen import DatasetSpec, generate
+
+SPEC = DatasetSpec(users=5, activities=3, topics_per_activity=2, subtasks_per_topic=7, batch_size=10)
+
+
+def _subtask_rows(engine) -> list:
+    with engine.connect() as conn:
+        return conn.execute(
+            select(SubTask.id, SubTask.topic_id, SubTask.start_date, SubTask.end_date,
+                   SubTask.assignee_id, SubTask.progress_percent).order_by(SubTask.id)
+        ).all()
+
+
+class TestDatagen:
+    """Tests for generated dataset shape and determinism."""
+
+    def test_counts_and_date_bounds(self, app):
+        """Should write the requested number of rows with subtasks inside their activity."""
+        counts = generate(db.engine, SPEC)
+
+        assert counts["subtasks"] == 42
+        assert db.session.query(func.count(SubTask.id)).scalar() == 42
+        assert db.session.query(func.count(Notification.id)).scalar() == SPEC.total_notifications
+        for activity in db.session.query(Activity):
+            for topic in activity.topics:
+                for subtask in topic.subtasks:
+                    assert activity.start_date <= subtask.start_date <= subtask.end_date <= activity.end_date
+
+    def test_same_seed_same_data(self):
+        """Should generate identical rows for the same seed."""
+        engines = [create_engine("sqlite://") for _ in range(2)]
+        for engine in engines:
+            db.metadata.create_all(engine)
+            generate(engine, SPEC)
+
+        assert _subtask_rows(engines[0]) == _subtask_rows(engines[1])
+
+    def test_appends_after_existing_rows(self, app, admin_user):
+        """Should continue ids after existing data."""
+        generate(db.engine, SPEC)
+
+        ids = [u.id for u in db.session.query(User).order_by(User.id)]
+        assert ids == list(range(1, SPEC.users + 2))
@@ -0,0 +1,95 @@
+# /backend/tests/test_db_pool.py
+"""
+Tests for connection pool configuration and the idle liveness check.
+"""
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import NullPool
+
+from app.config import Config, TestingConfig
+from app.db import enable_idle_ping, engine_options
+
+
+def _config(**overrides) -> dict:
+    config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+    config.update(overrides)
+    return config
+
+
+class TestEngineOptions:
+    """Tests for engine_options()."""
+
+    def test_queue_pool_settings(self):
+        """Should pass the DB_POOL_* settings to the engine."""
+        options = engine_options(_config(
+            SQLALCHEMY_DATABASE_URI="postgresql+psycopg2://u:p@db/app",
+            DB_POOL_SIZE=3, DB_MAX_OVERFLOW=2, DB_PGBOUNCER=False
+        ))
+
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 2
+        assert options["pool_pre_ping"] is False
+
+    def test_pgbouncer_mode(self):
+        """Should disable the app-side pool and prepared statements."""
+        options = engine_options(_config(
+            SQLALCHEMY_DATABASE_URI="postgresql+psycopg://u:p@pgbouncer/app", DB_PGBOUNCER=True
+        ))
+
+        assert options["poolclass"] is NullPool
+        assert options["connect_args"] == {"prepare_threshold": None}
+        assert "pool_size" not in options
+
+    def test_in_memory_sqlite_keeps_static_pool(self):
+        """Should not pass queue pool arguments to in-memory SQLite."""
+        assert engine_options(_config(SQLALCHEMY_DATABASE_URI=TestingConfig.SQLALCHEMY_DATABASE_URI)) == {}
+
+
+class TestIdlePing:
+    """Tests for the checkout liveness check."""
+
+    def _engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=1, max_overflow=0)
+        enable_idle_ping(engine, idle_seconds=60)
+        connects = []
+        event.listen(engine.pool, "connect", lambda *args: connects.append(1))
+        return engine, connects
+
+    def _age_idle_connections(self, engine):
+        for record in engine.pool._pool.queue:
+            record.info["checked_in_at"] = time.monotonic() - 120
+
+    def test_recent_connection_is_reused(self, tmp_path):
+        """Should hand out a recently used connection without reconnecting."""
+        engine, connects = self._engine(tmp_path)
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert len(connects) == 1
+
+    def test_dead_idle_connection_is_replaced(self, tmp_path):
+        """Should replace an idle connection that fails the ping."""
+        engine, connects = self._engine(tmp_path)
+        with engine.connect() as conn:
+            conn.connection.dbapi_connection.close()
+
+        self._age_idle_connections(engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+        assert len(connects) == 2
+
+
+class TestPoolEndpoint:
+    """Tests for GET /api/admin/db-pool."""
+
+    def test_reports_worker_pool(self, client, auth_headers):
+        """Should return the pool class and settings of this worker."""
+        response = client.get("/api/admin/db-pool", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["pool"]["pool_class"] == "StaticPool"
+        assert data["settings"]["pool_size"] == Config.DB_POOL_SIZE
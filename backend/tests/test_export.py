@@ -0,0 +1,205 @@
+# /backend/tests/test_export.py
+"""
+Tests for streaming CSV / XLSX / MS Project XML exports.
+"""
+import csv
+import gzip
+import io
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import date
+
+import pytest
+
+from app.db import db
+from app.models import Activity, SubTask, SubTaskStatus, Topic
+from app.services import export_service
+from app.services.export_service import EXPORT_COLUMNS, msp_task_uid
+
+XLSX = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+MSP = "{http://schemas.microsoft.com/project}"
+
+
+@pytest.fixture
+def activity(admin_user):
+    """Activity over the first week of 2025; "Kazı" is assigned and completed."""
+    activity = Activity(name="Şantiye", start_date=date(2024, 12, 30), end_date=date(2025, 1, 12),
+                        owner_id=admin_user.id)
+    db.session.add(activity)
+    db.session.flush()
+    first = Topic(activity_id=activity.id, title="Kaba inşaat")
+    second = Topic(activity_id=activity.id, title="İnce işler")
+    db.session.add_all([first, second])
+    db.session.flush()
+    db.session.add_all([
+        SubTask(topic_id=first.id, title="Kazı", start_date=date(2024, 12, 30), end_date=date(2025, 1, 5),
+                status=SubTaskStatus.COMPLETED, progress_percent=100, assignee_id=admin_user.id),
+        SubTask(topic_id=first.id, title="Temel, \"perde\"", start_date=date(2025, 1, 6), end_date=date(2025, 1, 8)),
+        SubTask(topic_id=second.id, title="Boya", start_date=date(2025, 1, 9), end_date=date(2025, 1, 12)),
+    ])
+    db.session.commit()
+    return activity
+
+
+def _get(client, auth_headers, url, **headers):
+    response = client.get(url, headers={**auth_headers, **headers})
+    assert response.status_code == 200
+    return response
+
+
+class TestCsvExport:
+    """Tests for CSV exports."""
+
+    def _rows(self, data: bytes):
+        assert data.startswith(b"\xef\xbb\xbf")
+        return list(csv.DictReader(io.StringIO(data.decode("utf-8-sig"))))
+
+    def test_activity_rows(self, client, auth_headers, activity, admin_user):
+        """Should export every subtask in chart order with working days and status."""
+        response = _get(client, auth_headers, f"/api/activities/{activity.id}/export.csv")
+        assert response.mimetype == "text/csv"
+        assert "activity-" in response.headers["Content-Disposition"]
+
+        rows = self._rows(response.get_data())
+
+        assert [r["title"] for r in rows] == ["Kazı", "Temel, \"perde\"", "Boya"]
+        assert list(rows[0]) == list(EXPORT_COLUMNS)
+        assert (rows[0]["working_days"], rows[0]["status"], rows[0]["assignee_email"]) == (
+            "5", "COMPLETED", admin_user.email
+        )
+        assert rows[2]["working_days"] == "2"
+        assert rows[2]["status"] == "OVERDUE"
+
+    def test_neutralises_formulas(self, client, auth_headers, activity):
+        """Should prefix text cells a spreadsheet would evaluate with a quote."""
+        subtask = activity.topics[1].subtasks[0]
+        subtask.title = '=HYPERLINK("http://x","tıkla")'
+        activity.topics[1].title = "@SUM(A1)"
+        db.session.commit()
+
+        rows = self._rows(_get(client, auth_headers, f"/api/activities/{activity.id}/export.csv").get_data())
+
+        assert (rows[2]["title"], rows[2]["topic"]) == ('\'=HYPERLINK("http://x","tıkla")', "'@SUM(A1)")
+        assert rows[0]["title"] == "Kazı"
+        assert rows[2]["activity_id"] == str(activity.id)
+
+    def test_window_and_gzip(self, client, auth_headers, activity):
+        """Should honour the window and compress when the client accepts gzip."""
+        response = _get(client, auth_headers, f"/api/activities/{activity.id}/export.csv?from=2025-01-07",
+                        **{"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        rows = self._rows(gzip.decompress(response.get_data()))
+        assert [r["title"] for r in rows] == ["Temel, \"perde\"", "Boya"]
+
+    def test_streams_in_batches(self, client, auth_headers, activity, monkeypatch):
+        """Should write one chunk per fetched batch."""
+        monkeypatch.setattr(export_service, "FETCH_SIZE", 1)
+        response = client.get(f"/api/activities/{activity.id}/export.csv", headers=auth_headers,
+                              buffered=False)
+
+        chunks = list(response.response)
+        response.close()
+        assert len(chunks) == 4
+
+    def test_portfolio_filters(self, client, auth_headers, activity):
+        """Should filter by owner and reject malformed parameters."""
+        rows = self._rows(_get(client, auth_headers,
+                               f"/api/export/subtasks.csv?owner_id={activity.owner_id}").get_data())
+        assert len(rows) == 3
+        rows = self._rows(_get(client, auth_headers, "/api/export/subtasks.csv?owner_id=999").get_data())
+        assert rows == []
+
+        for query in ("activity_ids=a,b", "from=2025-02-30", "from=2025-02-01&to=2025-01-01"):
+            assert client.get(f"/api/export/subtasks.csv?{query}", headers=auth_headers).status_code == 400
+        assert client.get("/api/activities/999/export.xlsx", headers=auth_headers).status_code == 404
+
+
+class TestXlsxExport:
+    """Tests for XLSX exports."""
+
+    def _sheets(self, data: bytes):
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        assert archive.testzip() is None
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        names = [s.get("name") for s in workbook.iter(f"{XLSX}sheet")]
+        sheets = [
+            ET.fromstring(archive.read(f"xl/worksheets/sheet{n}.xml")).findall(f"{XLSX}sheetData/{XLSX}row")
+            for n in range(1, len(names) + 1)
+        ]
+        return names, sheets
+
+    def test_workbook(self, client, auth_headers, activity):
+        """Should write a valid workbook with typed date and number cells."""
+        response = _get(client, auth_headers, f"/api/activities/{activity.id}/export.xlsx",
+                        **{"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+        names, sheets = self._sheets(response.get_data())
+
+        assert names == ["Alt görevler"]
+        rows = sheets[0]
+        assert len(rows) == 4
+        cells = rows[1].findall(f"{XLSX}c")
+        assert cells[5].find(f"{XLSX}is/{XLSX}t").text == "Kazı"
+        # 2024-12-30 as an Excel date serial with the date style
+        assert (cells[6].get("s"), cells[6].find(f"{XLSX}v").text) == ("1", "45656")
+        assert cells[8].find(f"{XLSX}v").text == "5"
+
+    def test_splits_sheets(self, client, auth_headers, activity, monkeypatch):
+        """Should continue on a new worksheet past the row limit."""
+        monkeypatch.setattr(export_service, "XLSX_MAX_ROWS", 2)
+
+        names, sheets = self._sheets(
+            _get(client, auth_headers, f"/api/activities/{activity.id}/export.xlsx").get_data()
+        )
+
+        assert names == ["Alt görevler", "Alt görevler 2"]
+        assert [len(rows) for rows in sheets] == [3, 2]
+
+
+class TestMsProjectExport:
+    """Tests for MS Project XML exports."""
+
+    def test_project(self, client, auth_headers, activity, admin_user):
+        """Should nest subtasks under activity and topic summaries with resources and assignments."""
+        data = _get(client, auth_headers, f"/api/activities/{activity.id}/export.xml").get_data()
+
+        project = ET.fromstring(data)
+        tasks = project.findall(f"{MSP}Tasks/{MSP}Task")
+        assert [(t.find(f"{MSP}Name").text, t.find(f"{MSP}OutlineLevel").text) for t in tasks] == [
+            ("Şantiye", "1"), ("Kaba inşaat", "2"), ("Kazı", "3"), ("Temel, \"perde\"", "3"),
+            ("İnce işler", "2"), ("Boya", "3"),
+        ]
+        assert [t.find(f"{MSP}ID").text for t in tasks] == ["1", "2", "3", "4", "5", "6"]
+        assert tasks[2].find(f"{MSP}Duration").text == "PT40H0M0S"
+        assert tasks[2].find(f"{MSP}PercentComplete").text == "100"
+
+        resources = project.findall(f"{MSP}Resources/{MSP}Resource")
+        assert [r.find(f"{MSP}UID").text for r in resources] == [str(admin_user.id)]
+        assignments = project.findall(f"{MSP}Assignments/{MSP}Assignment")
+        assert len(assignments) == 1
+        assert assignments[0].find(f"{MSP}TaskUID").text == tasks[2].find(f"{MSP}UID").text
+
+    def test_activity_calendar(self, client, auth_headers, activity):
+        """Should export the activity's calendar with its holidays."""
+        response = client.post("/api/calendars", headers=auth_headers, json={
+            "name": "TR", "weekmask": "1111110", "holidays": [{"date": "2025-01-01"}]
+        })
+        client.put(f"/api/activities/{activity.id}", headers=auth_headers,
+                   json={"calendar_id": response.get_json()["calendar"]["id"]})
+
+        project = ET.fromstring(_get(client, auth_headers, f"/api/activities/{activity.id}/export.xml").get_data())
+
+        calendar_uid = project.find(f"{MSP}CalendarUID").text
+        calendar = next(c for c in project.iter(f"{MSP}Calendar") if c.find(f"{MSP}UID").text == calendar_uid)
+        working = {d.find(f"{MSP}DayType").text: d.find(f"{MSP}DayWorking").text
+                   for d in calendar.iter(f"{MSP}WeekDay")}
+        assert (working["1"], working["7"]) == ("0", "1")
+        assert calendar.find(f"{MSP}Exceptions/{MSP}Exception/{MSP}TimePeriod/{MSP}FromDate").text.startswith(
+            "2025-01-01"
+        )
+        task = next(t for t in project.iter(f"{MSP}Task")
+                    if t.find(f"{MSP}UID").text == str(msp_task_uid("subtask", activity.topics[0].subtasks[0].id)))
+        # Saturday is a working day, New Year's Day is not
+        assert task.find(f"{MSP}Duration").text == "PT40H0M0S"
@@ -5,7 +5,16 @@ Tests for Gantt chart functionality.
 import pytest
 from datetime import date, timedelta
 
-from app.services.gantt_service import calculate_scale, get_date_range_info
+from app.models import SubTaskStatus
+from app.services.gantt_service import (
+    calculate_scale,
+    get_date_range_info,
+    build_timeline,
+    compute_timeline,
+    bin_subtasks,
+    timeline_columns,
+    use_binned_lod,
+)
 
 
 class TestCalculateScale:
@@ -56,3 +65,82 @@ class TestDateRangeInfo:
         assert info["total_weeks"] == pytest.approx(4.3, rel=0.1)
         assert info["total_months"] == 1.0
 
+
+class TestBuildTimeline:
+    """Tests for server-side timeline header generation."""
+
+    def test_day_ticks(self):
+        """Should create one tick per day with month label on the 1st."""
+        timeline = build_timeline(date(2025, 1, 30), date(2025, 2, 2), "day")
+
+        assert [t["label"] for t in timeline["ticks"]] == ["30", "31", "1", "2"]
+        assert timeline["ticks"][2]["sub_label"] == "Şub"
+        assert timeline["ticks"][3]["offset"] == 120
+        assert timeline["total_width"] == 160
+        assert timeline["month_boundaries"] == [{"date": "2025-02-01", "offset": 80}]
+
+    def test_week_ticks(self):
+        """Should group days into 7-day blocks starting at the range start."""
+        timeline = build_timeline(date(2025, 1, 1), date(2025, 1, 10), "week")
+
+        assert [t["label"] for t in timeline["ticks"]] == ["1-7", "8-10"]
+        assert timeline["ticks"][0]["week_number"] == 1
+
+    def test_month_ticks_with_locale(self):
+        """Should create one tick per calendar month with localized names."""
+        timeline = build_timeline(date(2024, 11, 15), date(2025, 2, 1), "month", "en")
+
+        assert [t["label"] for t in timeline["ticks"]] == [
+            "November", "December", "January", "February"
+        ]
+        assert timeline["ticks"][2]["sub_label"] == "2025"
+        assert timeline["month_boundaries"][0]["offset"] == 120
+
+    def test_timeline_is_memoized(self):
+        """Should return the cached model for identical arguments."""
+        start, end = date(2020, 1, 1), date(2029, 12, 31)
+
+        assert build_timeline(start, end, "month") is build_timeline(start, end, "month")
+
+    def test_timeline_columns_matches_ticks(self):
+        """Should count columns the same way the timeline builds them."""
+        start, end = date(2024, 11, 15), date(2025, 2, 1)
+
+        for scale in ("day", "week", "month"):
+            assert timeline_columns(start, end, scale) == len(compute_timeline(start, end, scale)["ticks"])
+
+
+class TestBinSubtasks:
+    """Tests for level-of-detail binning."""
+
+    def test_bins_per_topic_and_bucket(self):
+        """Should count active tasks, mean progress and overdue per bucket."""
+        buckets = [date(2025, 1, 1), date(2025, 2, 1), date(2025, 3, 1)]
+        rows = [
+            (1, date(2025, 1, 10), date(2025, 2, 5), 40, SubTaskStatus.IN_PROGRESS),
+            (1, date(2025, 1, 20), date(2025, 1, 25), 100, SubTaskStatus.IN_PROGRESS),
+            (2, date(2025, 3, 1), date(2025, 6, 1), 0, SubTaskStatus.OVERDUE),
+        ]
+
+        bins = bin_subtasks(rows, buckets, date(2025, 3, 31), today=date(2025, 1, 1))
+
+        assert bins["topic_ids"] == [1, 2]
+        assert bins["active"] == [[2, 1, 0], [0, 0, 1]]
+        assert bins["mean_progress"] == [[70.0, 40.0, None], [None, None, 0.0]]
+        assert bins["overdue"] == [[0, 0, 0], [0, 0, 1]]
+
+    def test_tasks_outside_range_are_ignored(self):
+        """Should skip tasks ending before the first bucket or after the range."""
+        buckets = [date(2025, 1, 1)]
+        rows = [(1, date(2024, 1, 1), date(2024, 2, 1), 0, SubTaskStatus.PLANNED)]
+
+        bins = bin_subtasks(rows, buckets, date(2025, 1, 31), today=date(2025, 1, 1))
+
+        assert bins["topic_ids"] == []
+
+    def test_auto_lod_only_for_coarse_scales(self):
+        """Should bin automatically at month scale only."""
+        assert use_binned_lod("auto", "month")
+        assert not use_binned_lod("auto", "week")
+        assert use_binned_lod("binned", "day")
+        assert not use_binned_lod("full", "month")
@@ -0,0 +1,123 @@
+# /backend/tests/test_gantt_api.py
+"""
+Tests for Gantt API endpoints.
+"""
+from datetime import date
+
+from app.db import db
+from app.models import Activity, Topic, SubTask
+
+
+def _create_activities(owner_id: int, count: int, subtasks_per_activity: int) -> list:
+    activities = []
+    for i in range(count):
+        activity = Activity(
+            name=f"Activity {i}",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            owner_id=owner_id
+        )
+        db.session.add(activity)
+        db.session.flush()
+        topic = Topic(activity_id=activity.id, title="Topic")
+        db.session.add(topic)
+        db.session.flush()
+        for j in range(subtasks_per_activity):
+            db.session.add(SubTask(
+                topic_id=topic.id,
+                title=f"Task {j}",
+                start_date=date(2025, 1 + j % 12, 1),
+                end_date=date(2025, 1 + j % 12, 20),
+                assignee_id=owner_id
+            ))
+        activities.append(activity)
+    db.session.commit()
+    return activities
+
+
+class TestPortfolioGantt:
+    """Tests for GET /api/gantt/portfolio."""
+
+    def test_returns_requested_activities(self, client, admin_user, auth_headers):
+        """Should return topics and subtasks grouped per requested activity."""
+        activities = _create_activities(admin_user.id, 3, 2)
+        ids = f"{activities[0].id},{activities[2].id}"
+
+        response = client.get(f"/api/gantt/portfolio?activity_ids={ids}", headers=auth_headers)
+
+        assert response.status_code == 200
+        items = response.get_json()["activities"]
+        assert sorted(i["activity"]["id"] for i in items) == [activities[0].id, activities[2].id]
+        assert all(len(i["subtasks"]) == 2 for i in items)
+        assert items[0]["subtasks"][0]["assignee"]["id"] == admin_user.id
+
+    def test_date_window_filters_subtasks(self, client, admin_user, auth_headers):
+        """Should only include subtasks overlapping the window."""
+        _create_activities(admin_user.id, 1, 3)
+
+        response = client.get(
+            "/api/gantt/portfolio?from=2025-02-01&to=2025-02-28", headers=auth_headers
+        )
+
+        subtasks = response.get_json()["activities"][0]["subtasks"]
+        assert [st["title"] for st in subtasks] == ["Task 1"]
+
+    def test_summary_only(self, client, admin_user, auth_headers):
+        """Should omit topics and subtasks in summary mode."""
+        _create_activities(admin_user.id, 2, 2)
+
+        response = client.get("/api/gantt/portfolio?summary_only=true", headers=auth_headers)
+
+        item = response.get_json()["activities"][0]
+        assert "subtasks" not in item
+        assert item["stats"]["subtask_count"] == 2
+
+    def test_has_more_when_truncated(self, client, admin_user, auth_headers, monkeypatch):
+        """Should flag that activities were cut off at the limit."""
+        monkeypatch.setattr("app.routes.gantt.MAX_PORTFOLIO_ACTIVITIES", 2)
+        _create_activities(admin_user.id, 3, 1)
+
+        data = client.get("/api/gantt/portfolio?summary_only=true", headers=auth_headers).get_json()
+        assert (len(data["activities"]), data["has_more"]) == (2, True)
+
+        monkeypatch.setattr("app.routes.gantt.MAX_PORTFOLIO_ACTIVITIES", 3)
+        data = client.get("/api/gantt/portfolio?summary_only=true", headers=auth_headers).get_json()
+        assert (len(data["activities"]), data["has_more"]) == (3, False)
+
+
+class TestDeltaSync:
+    """Tests for GET /api/activities/:id/gantt?since=."""
+
+    def test_delta_returns_only_changes_and_tombstones(self, client, admin_user, auth_headers, monkeypatch):
+        """Should return changed subtasks, deleted ids and an advanced cursor."""
+        monkeypatch.setattr("app.services.sync_service.SYNC_SETTLE_SECONDS", 0)
+        activity = _create_activities(admin_user.id, 1, 3)[0]
+        full = client.get(f"/api/activities/{activity.id}/gantt", headers=auth_headers).get_json()
+        first, second, _ = full["subtasks"]
+
+        client.patch(f"/api/subtasks/{first['id']}", json={"progress_percent": 50}, headers=auth_headers)
+        client.delete(f"/api/subtasks/{second['id']}", headers=auth_headers)
+        delta = client.get(
+            f"/api/activities/{activity.id}/gantt?since={full['cursor']}", headers=auth_headers
+        ).get_json()
+
+        assert delta["delta"] is True
+        assert [st["id"] for st in delta["subtasks"]] == [first["id"]]
+        assert delta["deleted"] == {"topics": [], "subtasks": [second["id"]]}
+        assert delta["cursor"] > full["cursor"]
+
+        empty = client.get(
+            f"/api/activities/{activity.id}/gantt?since={delta['cursor']}", headers=auth_headers
+        ).get_json()
+        assert empty["subtasks"] == [] and empty["cursor"] == delta["cursor"]
+
+    def test_recent_changes_are_resent(self, client, admin_user, auth_headers):
+        """Should not advance the cursor past changes inside the settle window."""
+        activity = _create_activities(admin_user.id, 1, 1)[0]
+        url = f"/api/activities/{activity.id}/gantt"
+
+        delta = client.get(f"{url}?since=0", headers=auth_headers).get_json()
+        again = client.get(f"{url}?since={delta['cursor']}", headers=auth_headers).get_json()
+
+        assert len(delta["subtasks"]) == 1
+        assert [st["id"] for st in again["subtasks"]] == [delta["subtasks"][0]["id"]]
@@ -0,0 +1,73 @@
+# /backend/tests/test_metrics.py
+"""
+Tests for the Prometheus metrics endpoint.
+"""
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.metrics import REQUEST_COUNT, SQL_STATEMENTS, _register_engine_events
+
+
+def _sample(metric, name: str, **labels) -> float:
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name == name and all(sample.labels.get(k) == v for k, v in labels.items()):
+                return sample.value
+    return 0.0
+
+
+class TestMetrics:
+    """Tests for request and SQL metrics."""
+
+    def test_request_is_counted_by_rule(self, client, auth_headers):
+        """Should count requests per blueprint, rule and status code."""
+        labels = {"blueprint": "activities", "rule": "/api/activities/<int:activity_id>", "status": "404"}
+        before = _sample(REQUEST_COUNT, "gantt_http_requests_total", **labels)
+
+        client.get("/api/activities/999", headers=auth_headers)
+
+        assert _sample(REQUEST_COUNT, "gantt_http_requests_total", **labels) == before + 1
+
+    def test_sql_statements_are_observed(self, client, auth_headers):
+        """Should record the number of SQL statements of a request."""
+        labels = {"blueprint": "activities", "rule": "/api/activities"}
+        count_before = _sample(SQL_STATEMENTS, "gantt_sql_statements_per_request_count", **labels)
+        sum_before = _sample(SQL_STATEMENTS, "gantt_sql_statements_per_request_sum", **labels)
+
+        client.get("/api/activities", headers=auth_headers)
+
+        assert _sample(SQL_STATEMENTS, "gantt_sql_statements_per_request_count", **labels) == count_before + 1
+        assert _sample(SQL_STATEMENTS, "gantt_sql_statements_per_request_sum", **labels) > sum_before
+
+    def test_failed_statement_leaves_no_state(self, app):
+        """Should keep nothing on the pooled connection when a statement raises."""
+        engine = create_engine("sqlite://")
+        _register_engine_events(engine, pool_gauges=False)
+
+        with engine.connect() as conn:
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info == {}
+
+    def test_metrics_endpoint_exposition_format(self, app, client, auth_headers):
+        """Should expose metrics in text exposition format."""
+        app.config["METRICS_TOKEN"] = "scrape-secret"
+        client.get("/api/activities", headers=auth_headers)
+
+        response = client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        body = response.get_data(as_text=True)
+        assert "gantt_http_request_duration_seconds_bucket" in body
+        assert "gantt_cache_requests_total" in body
+
+    def test_metrics_endpoint_needs_token(self, app, client, auth_headers):
+        """Should hide metrics without the scrape token, even from logged-in users."""
+        assert client.get("/api/metrics", headers=auth_headers).status_code == 404
+
+        app.config["METRICS_TOKEN"] = "scrape-secret"
+        assert client.get("/api/metrics").status_code == 401
+        assert client.get("/api/metrics", headers=auth_headers).status_code == 401
+        assert client.get("/api/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
@@ -0,0 +1,30 @@
+# /backend/tests/test_migrate.py
+"""
+Tests for the fast migration check in migrate.py.
+"""
+import os
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+
+from migrate import BACKEND_DIR, current_revisions, head_revisions
+
+
+class TestMigrate:
+    """Tests for head and current revision detection."""
+
+    def test_heads_match_alembic(self):
+        """Should find the same heads as Alembic without importing the scripts."""
+        script = ScriptDirectory.from_config(Config(os.path.join(BACKEND_DIR, "alembic.ini")))
+        assert head_revisions() == set(script.get_heads())
+
+    def test_current_revisions(self, tmp_path):
+        """Should read the stamped revision and treat a new database as empty."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+        with engine.connect() as connection:
+            assert current_revisions(connection) == set()
+            with connection.begin():
+                connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+                connection.execute(text("INSERT INTO alembic_version VALUES ('003_delta_sync')"))
+            assert current_revisions(connection) == {"003_delta_sync"}
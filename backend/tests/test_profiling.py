@@ -0,0 +1,94 @@
+# /backend/tests/test_profiling.py
+"""
+Tests for on-demand request profiling.
+"""
+import os
+
+from app.db import db
+from app.models import User, UserRole
+from app.auth.utils import generate_token
+from app.profiling import collapsed_to_speedscope, prune_profiles
+
+
+class TestRequestProfiling:
+    """Tests for the X-Profile hook and profile downloads."""
+
+    def test_admin_profile_is_saved(self, app, client, auth_headers, tmp_path):
+        """Should profile the request and return the profile id."""
+        app.config["PROFILE_DIR"] = str(tmp_path)
+        headers = {**auth_headers, "X-Profile": "deterministic"}
+
+        response = client.get("/api/activities", headers=headers)
+
+        assert response.status_code == 200
+        profile_id = response.headers["X-Profile-Id"]
+
+        listing = client.get("/api/admin/profiles", headers=auth_headers).get_json()["profiles"]
+        assert listing[0]["id"] == profile_id
+        assert listing[0]["request"].startswith("GET /api/activities -> 200")
+
+        collapsed = client.get(f"/api/admin/profiles/{profile_id}", headers=auth_headers)
+        assert "get_activities (activities.py" in collapsed.get_data(as_text=True)
+
+        speedscope = client.get(
+            f"/api/admin/profiles/{profile_id}?format=speedscope", headers=auth_headers
+        ).get_json()
+        assert speedscope["profiles"][0]["unit"] == "microseconds"
+
+    def test_non_admin_flag_is_ignored(self, app, client, tmp_path):
+        """Should not profile requests of non-admin users."""
+        app.config["PROFILE_DIR"] = str(tmp_path)
+        editor = User(email="editor@test.local", password_hash="x", full_name="Editor", role=UserRole.EDITOR)
+        db.session.add(editor)
+        db.session.commit()
+
+        response = client.get(
+            "/api/activities?_profile=sampling",
+            headers={"Authorization": f"Bearer {generate_token(editor)}"}
+        )
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+
+    def test_random_sampling(self, app, client, tmp_path):
+        """Should profile unauthenticated requests when the sample rate hits."""
+        app.config["PROFILE_DIR"] = str(tmp_path)
+        app.config["PROFILE_SAMPLE_RATE"] = 1.0
+
+        response = client.get("/api/health")
+
+        assert "-random-" in response.headers["X-Profile-Id"]
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_keeps_newest_profiles(self, app, client, tmp_path):
+        """Should delete the oldest profiles beyond PROFILE_MAX_FILES."""
+        app.config["PROFILE_DIR"] = str(tmp_path)
+        app.config["PROFILE_SAMPLE_RATE"] = 1.0
+        app.config["PROFILE_MAX_FILES"] = 2
+        for _ in range(4):
+            client.get("/api/health")
+        assert len(list(tmp_path.iterdir())) == 2
+
+        older = tmp_path / "older"
+        older.mkdir()
+        (older / "notes.txt").write_text("not a profile")
+        for mtime, name in enumerate(["c", "b", "a"]):
+            path = older / f"{name}.collapsed.txt"
+            path.write_text("")
+            os.utime(path, ns=(mtime, mtime))
+
+        assert prune_profiles(str(older), 1) == 2
+        assert sorted(p.name for p in older.iterdir()) == ["a.collapsed.txt", "notes.txt"]
+
+    def test_invalid_profile_id(self, client, auth_headers):
+        """Should reject ids that are not plain file names."""
+        response = client.get("/api/admin/profiles/..%2Fsecret", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_collapsed_to_speedscope(self):
+        """Should share frames between stacks."""
+        profile = collapsed_to_speedscope("# header\na;b 3\na;c 1\n", "p", "samples")
+
+        assert [f["name"] for f in profile["shared"]["frames"]] == ["a", "b", "c"]
+        assert profile["profiles"][0]["samples"] == [[0, 1], [0, 2]]
+        assert profile["profiles"][0]["weights"] == [3, 1]
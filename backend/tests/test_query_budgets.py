@@ -0,0 +1,121 @@
+# /backend/tests/test_query_budgets.py
+"""
+Query-count budgets per route and N+1 detection.
+
+Every route below runs within a fixed number of SQL statements that must not
+depend on how many rows it returns. A new lazy load per row shows up as a
+failed budget or as a count that grows between two data sizes.
+"""
+from datetime import date
+
+import pytest
+
+from app.db import db
+from app.models import Activity, Topic, SubTask, User, UserRole, Notification
+from app.services.activity_service import activity_stats_cache
+
+# Route name → (URL template, maximum SQL statements incl. authentication)
+ROUTE_BUDGETS = {
+    "activities": ("/api/activities", 3),
+    "activity": ("/api/activities/{activity_id}", 2),
+    "gantt": ("/api/activities/{activity_id}/gantt", 8),
+    "gantt_delta": ("/api/activities/{activity_id}/gantt?since=0", 6),
+    "portfolio": ("/api/gantt/portfolio?activity_ids={activity_id}", 6),
+    "topics": ("/api/activities/{activity_id}/topics", 4),
+    "subtasks": ("/api/topics/{topic_id}/subtasks", 3),
+    "notifications": ("/api/notifications", 3),
+    "users": ("/api/users", 2),
+    "workload": ("/api/users/workload?from=2025-01-01&to=2025-03-31", 3),
+}
+
+
+class SeedData:
+    """Activity owned by the admin user that can grow by `add` calls."""
+
+    def __init__(self, owner: User):
+        self.owner = owner
+        self.activity = Activity(
+            name="Budget", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31), owner_id=owner.id
+        )
+        db.session.add(self.activity)
+        db.session.flush()
+        self.first_topic = None
+        self.users = 0
+
+    def add(self, count: int) -> None:
+        """Add `count` topics with two subtasks each, new assignees and notifications."""
+        for _ in range(count):
+            self.users += 1
+            user = User(
+                email=f"user{self.users}@test.local",
+                password_hash="x",
+                full_name=f"User {self.users}",
+                role=UserRole.EDITOR
+            )
+            topic = Topic(activity_id=self.activity.id, title=f"Topic {self.users}")
+            db.session.add_all([user, topic])
+            db.session.flush()
+            self.first_topic = self.first_topic or topic
+
+            for month in (1, 2):
+                subtask = SubTask(
+                    topic_id=(self.first_topic if month == 1 else topic).id,
+                    title=f"Task {self.users}-{month}",
+                    start_date=date(2025, month, 1),
+                    end_date=date(2025, month, 20),
+                    assignee_id=user.id
+                )
+                db.session.add(subtask)
+                db.session.flush()
+
+            db.session.add(Notification(
+                type="task_assigned",
+                message="Görev atandı",
+                target_user_id=self.owner.id,
+                created_by_id=user.id,
+                activity_id=self.activity.id,
+                subtask_id=subtask.id
+            ))
+        db.session.commit()
+
+    def url(self, route: str) -> str:
+        return ROUTE_BUDGETS[route][0].format(activity_id=self.activity.id, topic_id=self.first_topic.id)
+
+
+@pytest.fixture
+def seed(admin_user):
+    return SeedData(admin_user)
+
+
+def _request_count(client, auth_headers, count_queries, url: str):
+    # Measure the cold path: no identity map or aggregate cache from earlier requests
+    db.session.expire_all()
+    activity_stats_cache.clear()
+    with count_queries() as counter:
+        response = client.get(url, headers=auth_headers)
+    assert response.status_code == 200, response.get_json()
+    return counter
+
+
+@pytest.mark.parametrize("route", sorted(ROUTE_BUDGETS))
+def test_route_within_query_budget(route, client, auth_headers, count_queries, seed):
+    """Should not exceed the declared number of SQL statements."""
+    seed.add(3)
+    budget = ROUTE_BUDGETS[route][1]
+
+    counter = _request_count(client, auth_headers, count_queries, seed.url(route))
+
+    assert counter.count <= budget, f"{route}: {counter.count} queries (budget {budget})\n{counter}"
+
+
+@pytest.mark.parametrize("route", sorted(ROUTE_BUDGETS))
+def test_query_count_independent_of_data_size(route, client, auth_headers, count_queries, seed):
+    """Should run the same number of SQL statements for 2 and 8 rows (N+1 detection)."""
+    seed.add(2)
+    small = _request_count(client, auth_headers, count_queries, seed.url(route))
+    seed.add(6)
+    large = _request_count(client, auth_headers, count_queries, seed.url(route))
+
+    assert large.count == small.count, (
+        f"{route}: {small.count} queries with 2 rows, {large.count} with 8\n{large}"
+    )
@@ -0,0 +1,147 @@
+# /backend/tests/test_render.py
+"""
+Tests for server-side SVG/PDF Gantt rendering.
+"""
+import re
+import xml.etree.ElementTree as ET
+from datetime import date, timedelta
+
+import pytest
+
+from app.db import db
+from app.models import Activity, SubTask, SubTaskStatus, Topic
+from app.services import render_service
+from app.services.render_service import HEADER_HEIGHT, ROW_HEIGHT, pdf_rows_per_page
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.fixture
+def activity(admin_user):
+    """Two topics over January 2025; the second topic's task is in the last week."""
+    activity = Activity(name="Şantiye planı", start_date=date(2025, 1, 1), end_date=date(2025, 1, 31),
+                        owner_id=admin_user.id)
+    db.session.add(activity)
+    db.session.flush()
+    first = Topic(activity_id=activity.id, title="Kaba inşaat")
+    second = Topic(activity_id=activity.id, title="İnce işler")
+    db.session.add_all([first, second])
+    db.session.flush()
+    db.session.add_all([
+        SubTask(topic_id=first.id, title="Kazı", start_date=date(2025, 1, 1), end_date=date(2025, 1, 5),
+                status=SubTaskStatus.COMPLETED, progress_percent=100),
+        SubTask(topic_id=first.id, title="Temel & perde", start_date=date(2025, 1, 6), end_date=date(2025, 1, 12)),
+        SubTask(topic_id=second.id, title="Boya", start_date=date(2025, 1, 25), end_date=date(2025, 1, 31)),
+    ])
+    db.session.commit()
+    return activity
+
+
+def _svg(client, auth_headers, activity, query=""):
+    response = client.get(f"/api/activities/{activity.id}/gantt.svg{query}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.mimetype == "image/svg+xml"
+    return ET.fromstring(response.get_data())
+
+
+def _row_labels(root):
+    return [t.text for t in root.iter(f"{SVG}text")
+            if float(t.get("y")) > HEADER_HEIGHT]
+
+
+class TestRenderSvg:
+    """Tests for GET /api/activities/:id/gantt.svg."""
+
+    def test_renders_all_rows(self, client, auth_headers, activity):
+        """Should draw topic headers and subtasks in chart order, sized to the rows."""
+        root = _svg(client, auth_headers, activity)
+
+        assert _row_labels(root) == ["Kaba inşaat", "Kazı", "Temel & perde", "İnce işler", "Boya"]
+        assert float(root.get("height")) == HEADER_HEIGHT + 5 * ROW_HEIGHT
+        fills = {r.get("fill") for r in root.iter(f"{SVG}rect")}
+        assert "#10b981" in fills
+
+    def test_date_window(self, client, auth_headers, activity):
+        """Should only draw subtasks overlapping the window, clipped to it."""
+        root = _svg(client, auth_headers, activity, "?from=2025-01-10&to=2025-01-20")
+
+        assert _row_labels(root) == ["Kaba inşaat", "Temel & perde"]
+        assert float(root.get("height")) == HEADER_HEIGHT + 2 * ROW_HEIGHT
+
+    def test_streams_in_chunks(self, client, auth_headers, activity, monkeypatch):
+        """Should yield the document in several chunks."""
+        monkeypatch.setattr(render_service, "CHUNK_ROWS", 2)
+        response = client.get(f"/api/activities/{activity.id}/gantt.svg", headers=auth_headers,
+                              buffered=False)
+
+        chunks = list(response.response)
+        response.close()
+        assert len(chunks) >= 4
+        ET.fromstring("".join(c.decode() if isinstance(c, bytes) else c for c in chunks))
+
+    def test_invalid_window(self, client, auth_headers, activity):
+        """Should reject malformed and reversed windows."""
+        for query in ("?from=2025-13-01", "?from=2025-01-20&to=2025-01-10", "?scale=year"):
+            response = client.get(f"/api/activities/{activity.id}/gantt.svg{query}", headers=auth_headers)
+            assert response.status_code == 400
+
+    def test_window_column_limit(self, client, auth_headers, activity):
+        """Should refuse windows with too many timeline columns before building them."""
+        url = f"/api/activities/{activity.id}/gantt.svg"
+        for query in ("?from=0001-01-01&to=9999-12-31&scale=day", "?from=0001-01-01&to=9999-12-31",
+                      "?from=2020-01-01&to=2030-01-01&scale=day"):
+            response = client.get(url + query, headers=auth_headers)
+            assert response.status_code == 400
+            assert "2000" in response.get_json()["error"]
+
+        assert client.get(url + "?from=2020-01-01&to=2030-01-01&scale=week", headers=auth_headers).status_code == 200
+
+    def test_not_found(self, client, auth_headers):
+        response = client.get("/api/activities/999/gantt.pdf", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestRenderPdf:
+    """Tests for GET /api/activities/:id/gantt.pdf."""
+
+    def _pdf(self, client, auth_headers, activity):
+        response = client.get(f"/api/activities/{activity.id}/gantt.pdf", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.mimetype == "application/pdf"
+        return response.get_data()
+
+    def _check_xref(self, data: bytes) -> None:
+        """Every xref entry should point at its object."""
+        xref_offset = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", data).group(1))
+        assert data[xref_offset:].startswith(b"xref\n0 ")
+        size = int(re.search(rb"/Size (\d+)", data).group(1))
+        entries = data[xref_offset:].split(b"\n")[3:3 + size - 1]
+        for object_id, entry in enumerate(entries, 1):
+            offset = int(entry[:10])
+            assert data[offset:].startswith(b"%d 0 obj" % object_id)
+
+    def test_single_page(self, client, auth_headers, activity):
+        data = self._pdf(client, auth_headers, activity)
+
+        assert data.startswith(b"%PDF-1.4")
+        assert b"/Count 1" in data
+        self._check_xref(data)
+
+    def test_paginates(self, client, auth_headers, activity):
+        """Should split rows over pages and keep a valid cross-reference table."""
+        topic = activity.topics[0]
+        start = date(2025, 1, 1)
+        per_page = pdf_rows_per_page()
+        db.session.add_all([
+            SubTask(topic_id=topic.id, title=f"Görev {i}", start_date=start + timedelta(days=i % 30),
+                    end_date=start + timedelta(days=i % 30))
+            for i in range(per_page)
+        ])
+        db.session.commit()
+
+        data = self._pdf(client, auth_headers, activity)
+
+        # per_page + 5 rows
+        assert b"/Count 2" in data
+        assert data.count(b"/Type /Page ") == 2
+        self._check_xref(data)
@@ -0,0 +1,104 @@
+# /backend/tests/test_replicas.py
+"""
+Tests for read-replica routing with two SQLite files standing in for the
+primary and the replica.
+"""
+import time
+
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+from app.db import db
+from app.models import User, UserRole
+from app.auth.utils import generate_token
+from app.replicas import READ_PRIMARY_HEADER, read_primary_until, replica_engines, sticky_writes
+
+ACTIVITY = {"name": "Yalnızca primary", "start_date": "2025-01-01", "end_date": "2025-02-01"}
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """App whose replica has the users but none of the later writes."""
+    class ReplicaConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        DATABASE_REPLICA_URLS = f"sqlite:///{tmp_path / 'replica.db'}"
+
+    app = create_app(ReplicaConfig)
+    with app.app_context():
+        replica = replica_engines()[0]
+        db.create_all()
+        db.metadata.create_all(replica)
+        admin = User(email="admin@test.local", password_hash="x", full_name="Admin", role=UserRole.ADMIN)
+        db.session.add(admin)
+        db.session.commit()
+        with replica.begin() as conn:
+            conn.execute(User.__table__.insert(), [{
+                c.name: getattr(admin, c.key) for c in User.__table__.columns
+            }])
+        sticky_writes.clear()
+        yield app, {"Authorization": f"Bearer {generate_token(admin)}"}
+        db.session.remove()
+        db.drop_all()
+        replica.dispose()
+    sticky_writes.clear()
+
+
+def _activity_names(client, headers) -> list:
+    response = client.get("/api/activities", headers=headers)
+    assert response.status_code == 200
+    return [a["name"] for a in response.get_json()["activities"]]
+
+
+class TestReplicaRouting:
+    """Tests for RoutingSession and read-your-writes pinning."""
+
+    def test_reads_go_to_replica(self, replica_app):
+        """Should serve GET requests from the replica."""
+        app, headers = replica_app
+        client = app.test_client()
+        client.post("/api/activities", json=ACTIVITY, headers=headers)
+        sticky_writes.clear()
+
+        assert _activity_names(client, headers) == []
+
+    def test_writer_is_pinned_to_primary(self, replica_app):
+        """Should read from the primary right after the user's own write."""
+        app, headers = replica_app
+        client = app.test_client()
+
+        response = client.post("/api/activities", json=ACTIVITY, headers=headers)
+
+        assert response.status_code == 201
+        assert float(response.headers[READ_PRIMARY_HEADER]) > time.time()
+        assert _activity_names(client, headers) == [ACTIVITY["name"]]
+
+    def test_pin_header_works_on_any_worker(self, replica_app):
+        """Should honour the pin header even without a local pin."""
+        app, headers = replica_app
+        client = app.test_client()
+        pin = client.post("/api/activities", json=ACTIVITY, headers=headers).headers[READ_PRIMARY_HEADER]
+        sticky_writes.clear()
+
+        assert _activity_names(client, {**headers, READ_PRIMARY_HEADER: pin}) == [ACTIVITY["name"]]
+        expired = {**headers, READ_PRIMARY_HEADER: str(time.time() - 1)}
+        assert _activity_names(client, expired) == []
+        for forged in ("inf", "nan", "1e309"):
+            assert _activity_names(client, {**headers, READ_PRIMARY_HEADER: forged}) == []
+
+    def test_pin_header_is_clamped(self):
+        """Should ignore non-finite pins and cap pins at REPLICA_STICKY_SECONDS."""
+        now = time.time()
+
+        assert read_primary_until(None, 5) == 0.0
+        assert read_primary_until("yarın", 5) == 0.0
+        assert read_primary_until("-inf", 5) == 0.0
+        assert read_primary_until(str(now + 2), 5) == pytest.approx(now + 2)
+        assert read_primary_until(str(now + 86400 * 365), 5) <= time.time() + 5
+
+    def test_without_replicas_no_pin_header(self, client, auth_headers):
+        """Should leave responses unchanged when no replica is configured."""
+        response = client.post("/api/activities", json=ACTIVITY, headers=auth_headers)
+
+        assert response.status_code == 201
+        assert READ_PRIMARY_HEADER not in response.headers
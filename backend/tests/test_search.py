@@ -0,0 +1,108 @@
+# /backend/tests/test_search.py
+"""
+Tests for full-text search (FTS5 index on the SQLite test database).
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db import db
+from app.models import Activity, Topic, SubTask
+from app.services.search_service import pg_search_statement, pg_tsquery, query_words
+
+
+@pytest.fixture
+def plan(admin_user):
+    """Activity with a topic and two subtasks."""
+    activity = Activity(
+        name="Yazılım tasarımı", description="Mobil uygulama", start_date=date(2025, 1, 1),
+        end_date=date(2025, 12, 31), owner_id=admin_user.id
+    )
+    db.session.add(activity)
+    db.session.flush()
+    topic = Topic(activity_id=activity.id, title="Arayüz", description="Tasarım sistemi")
+    db.session.add(topic)
+    db.session.flush()
+    subtasks = [
+        SubTask(topic_id=topic.id, title=title, description=description,
+                start_date=date(2025, 1, 1), end_date=date(2025, 1, 20))
+        for title, description in (("Renk paleti tasarımı", None), ("Login ekranı", "Tasarım onayı bekliyor"))
+    ]
+    db.session.add_all(subtasks)
+    db.session.commit()
+    return activity, topic, subtasks
+
+
+def _search(client, auth_headers, query: str):
+    response = client.get(f"/api/search?{query}", headers=auth_headers)
+    return response.status_code, response.get_json()
+
+
+class TestSearch:
+    """Tests for GET /api/search."""
+
+    def test_ranked_prefix_matches(self, client, auth_headers, plan):
+        """Should match word prefixes across kinds, title matches first."""
+        activity, topic, subtasks = plan
+
+        status, body = _search(client, auth_headers, "q=tasar")
+
+        assert status == 200
+        hits = [(r["type"], r["id"]) for r in body["results"]]
+        assert set(hits) == {("activity", activity.id), ("topic", topic.id),
+                             ("subtask", subtasks[0].id), ("subtask", subtasks[1].id)}
+        # Title hits outrank description hits
+        assert set(hits[:2]) == {("activity", activity.id), ("subtask", subtasks[0].id)}
+        subtask_hit = next(r for r in body["results"] if r["id"] == subtasks[1].id)
+        assert subtask_hit == {**subtask_hit, "title": "Login ekranı", "activity_id": activity.id,
+                               "topic_id": topic.id}
+
+    def test_all_words_and_type_filter(self, client, auth_headers, plan):
+        """Should require every word and honour ?type=."""
+        _, _, subtasks = plan
+
+        _, body = _search(client, auth_headers, "q=tasar%20onay")
+        assert [r["id"] for r in body["results"]] == [subtasks[1].id]
+
+        _, body = _search(client, auth_headers, "q=tasar&type=topic")
+        assert [r["type"] for r in body["results"]] == ["topic"]
+
+    def test_index_follows_writes(self, client, auth_headers, plan):
+        """Should reindex renamed rows and drop deleted ones."""
+        activity, topic, subtasks = plan
+        subtasks[0].title = "Renk paleti"
+        db.session.delete(topic)
+        db.session.commit()
+
+        _, body = _search(client, auth_headers, "q=tasar")
+        assert [(r["type"], r["id"]) for r in body["results"]] == [("activity", activity.id)]
+        _, body = _search(client, auth_headers, "q=palet")
+        assert body["results"] == []
+
+    def test_pagination(self, client, auth_headers, plan):
+        """Should page through the ranked results."""
+        _, first = _search(client, auth_headers, "q=tasar&limit=3")
+        _, second = _search(client, auth_headers, "q=tasar&limit=3&offset=3")
+
+        assert first["has_more"] is True and second["has_more"] is False
+        assert len(first["results"]) == 3 and len(second["results"]) == 1
+
+    @pytest.mark.parametrize("query", ["q=", "q=%2A%22", "q=x&type=user", "q=x&limit=0", "q=x&offset=abc"])
+    def test_invalid_params(self, client, auth_headers, query):
+        """Should reject empty queries and bad paging or type values."""
+        assert _search(client, auth_headers, query)[0] == 400
+
+    def test_query_syntax_is_not_passed_through(self):
+        """Should reduce queries to plain words before building tsquery text."""
+        assert query_words('Tasarım & !"onay":* a_b') == ["tasarım", "onay", "a", "b"]
+        assert pg_tsquery(["tasarım", "ab"]) == "tasarım:* & ab"
+
+    def test_postgresql_statement_uses_index_operator(self):
+        """Should filter each kind with @@ on its search_vector column."""
+        sql = str(pg_search_statement(["tasar"], ["topic", "subtask"], 20, 0).compile(
+            dialect=postgresql.dialect()
+        ))
+        assert "topics.search_vector @@ to_tsquery('simple'" in sql
+        assert "subtasks.search_vector @@ to_tsquery('simple'" in sql
+        assert "LIKE" not in sql
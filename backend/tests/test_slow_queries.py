@@ -0,0 +1,103 @@
+# /backend/tests/test_slow_queries.py
+"""
+Tests for the slow-query log.
+"""
+import json
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db import SlowQueryLog, db, normalize_sql, parameter_shape, slow_query_log
+from app.models import User, UserRole
+from app.auth.utils import generate_token
+
+
+class TestNormalizeSql:
+    """Tests for statement normalization."""
+
+    def test_placeholders_and_literals(self):
+        """Should replace placeholders and literals, keeping casts."""
+        sql = "SELECT * FROM t WHERE a = %(a_1)s AND b = 'x' AND c > 10 AND d::date = :d"
+        assert normalize_sql(sql) == "SELECT * FROM t WHERE a = ? AND b = ? AND c > ? AND d::date = ?"
+
+    def test_in_list_collapses(self):
+        """Should collapse IN lists of any length to the same shape."""
+        assert normalize_sql("SELECT 1 FROM t WHERE id IN (?, ?, ?)") == \
+            normalize_sql("SELECT 1 FROM t WHERE id IN (?,\n ?)")
+
+    def test_parameter_shape_has_no_values(self):
+        """Should describe parameters by type only."""
+        assert parameter_shape({"email": "a@b.c", "id": 5}) == {"email": "str", "id": "int"}
+        assert parameter_shape([(1,), (2,)], executemany=True) == {"rows": 2, "row": ["int"]}
+
+
+class TestSlowQueryLog:
+    """Tests for capture, EXPLAIN and the admin endpoint."""
+
+    def test_explain_plan_is_captured(self, tmp_path):
+        """Should attach an EXPLAIN plan and append the entry to the JSONL file."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'plan.db'}")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+        log = SlowQueryLog(size=2)
+        log.log_file = str(tmp_path / "slow.jsonl")
+        log.record("SELECT * FROM items WHERE name = ?", ("x",), False, 512.0, engine)
+        log.wait_for_plans()
+
+        entry = log.entries()[0]
+        assert entry["parameters"] == ["str"]
+        assert "SCAN" in entry["plan"]
+        with open(log.log_file, encoding="utf-8") as f:
+            assert json.loads(f.readline())["id"] == entry["id"]
+
+    def test_ring_buffer_is_bounded(self):
+        """Should keep only the most recent entries."""
+        log = SlowQueryLog(size=2)
+        log.explain = False
+        for i in range(3):
+            log.record(f"UPDATE t SET a = {i}", {}, False, float(i), engine=None)
+
+        assert [e["duration_ms"] for e in log.entries()] == [2.0, 1.0]
+
+    def test_failed_statement_leaves_no_state(self, app, monkeypatch):
+        """Should keep nothing on the pooled connection when a statement raises."""
+        engine = create_engine("sqlite://")
+        slow_query_log.configure(engine, app.config)
+        monkeypatch.setattr(slow_query_log, "threshold_ms", 0.0)
+        slow_query_log.clear()
+
+        with engine.connect() as conn:
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info == {}
+
+        assert [e["statement"] for e in slow_query_log.entries()] == ["SELECT ?"]
+
+    def test_admin_endpoint_lists_request_queries(self, app, client, auth_headers):
+        """Should record statements of a request with its route."""
+        slow_query_log.clear()
+        slow_query_log.threshold_ms = 0
+        try:
+            client.get("/api/activities", headers=auth_headers)
+        finally:
+            slow_query_log.threshold_ms = app.config["SLOW_QUERY_THRESHOLD_MS"]
+
+        response = client.get("/api/admin/slow-queries", headers=auth_headers)
+
+        assert response.status_code == 200
+        routes = [q["route"] for q in response.get_json()["queries"] if q["route"]]
+        assert {"endpoint": "activities.get_activities", "method": "GET", "path": "/api/activities"} in routes
+
+    def test_admin_only(self, client):
+        """Should reject non-admin users."""
+        editor = User(email="editor@test.local", password_hash="x", full_name="Editor", role=UserRole.EDITOR)
+        db.session.add(editor)
+        db.session.commit()
+
+        response = client.get(
+            "/api/admin/slow-queries", headers={"Authorization": f"Bearer {generate_token(editor)}"}
+        )
+
+        assert response.status_code == 403
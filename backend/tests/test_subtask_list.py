@@ -0,0 +1,85 @@
+# /backend/tests/test_subtask_list.py
+"""
+Tests for the cross-activity subtask list (GET /api/subtasks).
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from app.db import db
+from app.models import Activity, Topic, SubTask, SubTaskStatus, User, UserRole
+
+
+@pytest.fixture
+def tasks(admin_user):
+    """Six subtasks of the admin in two activities (one overdue, one completed), one of another user."""
+    other = User(email="other@test.local", password_hash="x", full_name="Other", role=UserRole.EDITOR)
+    db.session.add(other)
+    subtasks = []
+    today = date.today()
+    for a in range(2):
+        activity = Activity(name=f"Activity {a}", start_date=today, end_date=today, owner_id=admin_user.id)
+        db.session.add(activity)
+        db.session.flush()
+        topic = Topic(activity_id=activity.id, title=f"Topic {a}")
+        db.session.add(topic)
+        db.session.flush()
+        for i in range(3):
+            subtasks.append(SubTask(
+                topic_id=topic.id, title=f"Task {a}-{i}", assignee_id=admin_user.id,
+                start_date=today - timedelta(days=10), end_date=today + timedelta(days=i * 2 + a - 1),
+            ))
+        db.session.add_all(subtasks[-3:])
+    subtasks[2].status = SubTaskStatus.COMPLETED
+    db.session.flush()
+    db.session.add(SubTask(topic_id=subtasks[0].topic_id, title="Not mine", assignee_id=other.id,
+                           start_date=today, end_date=today))
+    db.session.commit()
+    return subtasks
+
+
+class TestAssignedSubtasks:
+    """Tests for GET /api/subtasks."""
+
+    def test_keyset_pages_in_end_date_order(self, client, auth_headers, tasks, count_queries):
+        """Should page through the current user's subtasks with one query per page."""
+        titles, cursor = [], None
+        with count_queries() as counter:
+            while True:
+                query = "limit=4" + (f"&cursor={cursor}" if cursor else "")
+                body = client.get(f"/api/subtasks?{query}", headers=auth_headers).get_json()
+                titles += [st["title"] for st in body["subtasks"]]
+                cursor = body["next_cursor"]
+                if cursor is None:
+                    break
+
+        expected = sorted(tasks, key=lambda st: (st.end_date, st.id))
+        assert titles == [st.title for st in expected]
+        # One list query per page, no lazy loads of topics or activities
+        assert sum("FROM subtasks" in s for s in counter.statements) == 2, counter
+
+    def test_joined_names(self, client, auth_headers, tasks):
+        """Should include topic and activity names."""
+        body = client.get("/api/subtasks", headers=auth_headers).get_json()
+
+        first = body["subtasks"][0]
+        assert (first["title"], first["topic_title"], first["activity_name"]) == ("Task 0-0", "Topic 0", "Activity 0")
+        assert first["activity_id"] == tasks[0].topic.activity_id
+
+    def test_effective_status_and_window(self, client, auth_headers, tasks):
+        """Should filter by effective status in SQL and by date window."""
+        body = client.get("/api/subtasks?status=overdue", headers=auth_headers).get_json()
+        assert [st["title"] for st in body["subtasks"]] == ["Task 0-0"]
+        assert body["subtasks"][0]["status"] == "OVERDUE"
+
+        body = client.get("/api/subtasks?status=COMPLETED,OVERDUE", headers=auth_headers).get_json()
+        assert {st["title"] for st in body["subtasks"]} == {"Task 0-0", "Task 0-2"}
+
+        window = (date.today() + timedelta(days=3)).isoformat()
+        body = client.get(f"/api/subtasks?from={window}", headers=auth_headers).get_json()
+        assert {st["title"] for st in body["subtasks"]} == {"Task 0-2", "Task 1-2"}
+
+    @pytest.mark.parametrize("query", ["status=DONE", "from=2025-13-01", "limit=0", "cursor=abc"])
+    def test_invalid_params(self, client, auth_headers, query):
+        """Should reject bad filters and cursors."""
+        assert client.get(f"/api/subtasks?{query}", headers=auth_headers).status_code == 400
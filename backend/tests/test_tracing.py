@@ -0,0 +1,108 @@
+# /backend/tests/test_tracing.py
+"""
+Tests for per-request tracing spans.
+"""
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+
+from app import tracing
+from app.db import db
+from app.models import Activity, Topic, SubTask
+from app.tracing import Span, Trace, span, trace_exporter
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def _exported_spans(path) -> list:
+    trace_exporter.flush()
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    return lines and json.loads(lines[-1])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+class TestTracing:
+    """Tests for sampling, span nesting and export."""
+
+    def test_sampled_patch_has_nested_spans(self, app, client, admin_user, auth_headers, tmp_path, monkeypatch):
+        """Should export auth, SQL and commit spans under the request span."""
+        export_file = tmp_path / "traces.jsonl"
+        monkeypatch.setattr(trace_exporter, "export_file", str(export_file))
+        monkeypatch.setitem(app.config, "TRACE_TRUST_REMOTE_SAMPLED", True)
+
+        activity = Activity(name="A", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31), owner_id=admin_user.id)
+        db.session.add(activity)
+        db.session.flush()
+        topic = Topic(activity_id=activity.id, title="T")
+        db.session.add(topic)
+        db.session.flush()
+        subtask = SubTask(topic_id=topic.id, title="S", start_date=date(2025, 2, 1), end_date=date(2025, 2, 5))
+        db.session.add(subtask)
+        db.session.commit()
+
+        headers = {**auth_headers, "traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+        response = client.patch(f"/api/subtasks/{subtask.id}", json={"progress_percent": 40}, headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["traceparent"].startswith(f"00-{TRACE_ID}-")
+
+        spans = _exported_spans(export_file)
+        by_name = {}
+        for s in spans:
+            by_name.setdefault(s["name"], []).append(s)
+        root = by_name["PATCH /api/subtasks/<int:subtask_id>"][0]
+        assert root["parentSpanId"] == "00f067aa0ba902b7"
+        assert all(s["traceId"] == TRACE_ID for s in spans)
+        assert by_name["auth.decode_token"][0]["parentSpanId"] == root["spanId"]
+
+        commit = by_name["db.commit"][0]
+        assert any(s.get("parentSpanId") == commit["spanId"] for s in by_name["SQL UPDATE"])
+        assert "SQL SELECT" in by_name
+
+    def test_unsampled_request_is_not_traced(self, client, auth_headers, tmp_path, monkeypatch):
+        """Should not export anything without sampling."""
+        export_file = tmp_path / "traces.jsonl"
+        monkeypatch.setattr(trace_exporter, "export_file", str(export_file))
+
+        response = client.get("/api/activities", headers=auth_headers)
+
+        trace_exporter.flush()
+        assert "traceparent" not in response.headers
+        assert not export_file.exists()
+
+    def test_remote_sampled_flag_needs_opt_in(self, app, client, auth_headers, tmp_path, monkeypatch):
+        """Should ignore a client's sampled flag unless trusted, but keep its trace id."""
+        export_file = tmp_path / "traces.jsonl"
+        monkeypatch.setattr(trace_exporter, "export_file", str(export_file))
+        headers = {**auth_headers, "traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+
+        response = client.get("/api/activities", headers=headers)
+        trace_exporter.flush()
+        assert "traceparent" not in response.headers
+        assert not export_file.exists()
+
+        monkeypatch.setitem(app.config, "TRACE_SAMPLE_RATE", 1.0)
+        response = client.get("/api/activities", headers=headers)
+        assert response.headers["traceparent"].startswith(f"00-{TRACE_ID}-")
+
+    def test_failed_statement_span(self):
+        """Should end the span of a failing statement with its error, keeping nothing on the connection."""
+        engine = create_engine("sqlite://")
+        for name in ("before_cursor_execute", "after_cursor_execute", "handle_error"):
+            event.listen(engine, name, getattr(tracing, f"_{name}"))
+        trace = Trace()
+
+        with Span(trace, "job", None, {}), engine.connect() as conn:
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info == {}
+
+        sql_spans = [s for s in trace.spans if s.name == "SQL SELECT"]
+        assert ["no such table" in s.attributes.get("error", "") for s in sql_spans] == [True, False]
+
+    def test_span_outside_trace_is_noop(self):
+        """Should return a shared no-op context manager."""
+        assert span("anything") is span("other")
@@ -0,0 +1,62 @@
+# /backend/tests/test_workload.py
+"""
+Tests for workload histogram calculation.
+"""
+from datetime import date, timedelta
+
+from app.services.workload_service import compute_workload, align_range_start
+
+
+class TestComputeWorkload:
+    """Tests for vectorized per-assignee load calculation."""
+
+    def test_daily_overlapping_tasks(self):
+        """Should count concurrent tasks per day for each assignee."""
+        start = date(2025, 1, 1)
+        rows = [
+            (1, date(2025, 1, 1), date(2025, 1, 3)),
+            (1, date(2025, 1, 2), date(2025, 1, 2)),
+            (2, date(2025, 1, 3), date(2025, 1, 4)),
+        ]
+
+        result = compute_workload(rows, start, start + timedelta(days=4), "day")
+
+        assert result["assignee_ids"] == [1, 2]
+        assert result["load"].tolist() == [
+            [1, 2, 1, 0, 0],
+            [0, 0, 1, 1, 0],
+        ]
+
+    def test_tasks_are_clipped_to_range(self):
+        """Should ignore the parts of tasks outside the requested range."""
+        start = date(2025, 1, 10)
+        rows = [(1, date(2024, 12, 1), date(2025, 3, 1))]
+
+        result = compute_workload(rows, start, start + timedelta(days=2), "day")
+
+        assert result["load"].tolist() == [[1, 1, 1]]
+
+    def test_weekly_buckets_start_on_monday(self):
+        """Should align weekly buckets to ISO weeks and count tasks per week."""
+        # 2025-01-01 is a Wednesday
+        rows = [
+            (1, date(2025, 1, 1), date(2025, 1, 2)),
+            (1, date(2025, 1, 5), date(2025, 1, 7)),
+        ]
+
+        result = compute_workload(rows, date(2025, 1, 1), date(2025, 1, 14), "week")
+
+        assert result["buckets"][0] == date(2024, 12, 30)
+        assert result["load"].tolist() == [[2, 1, 0]]
+
+    def test_empty_rows(self):
+        """Should return an empty matrix with the bucket axis intact."""
+        start = date(2025, 1, 1)
+        result = compute_workload([], start, start + timedelta(days=6), "day")
+
+        assert result["assignee_ids"] == []
+        assert result["load"].shape == (0, 7)
+
+    def test_align_range_start_day(self):
+        """Daily ranges should not be realigned."""
+        assert align_range_start(date(2025, 1, 1), "day") == date(2025, 1, 1)
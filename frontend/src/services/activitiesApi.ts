@@ -3,10 +3,19 @@ import apiClient from './apiClient'
 import type {
   Activity,
   GanttData,
+  GanttDelta,
+  PortfolioGanttData,
+  PortfolioGanttParams,
+  GanttExportFormat,
+  GanttExportParams,
+  SubTaskExportFormat,
+  SubTaskExportParams,
   CreateActivityDTO,
   UpdateActivityDTO,
   Topic,
   SubTask,
+  AssignedSubTasksPage,
+  AssignedSubTasksParams,
   CreateTopicDTO,
   UpdateTopicDTO,
   CreateSubTaskDTO,
@@ -46,6 +55,58 @@ export const activitiesApi = {
     return response.data
   },
 
+  async getGanttDelta(activityId: number, since: number): Promise<GanttDelta> {
+    const response = await apiClient.get<GanttDelta>(`/activities/${activityId}/gantt`, {
+      params: { since }
+    })
+    return response.data
+  },
+
+  async getPortfolioGantt(params: PortfolioGanttParams = {}): Promise<PortfolioGanttData> {
+    const response = await apiClient.get<PortfolioGanttData>('/gantt/portfolio', {
+      params: {
+        ...params,
+        activity_ids: params.activity_ids?.join(',')
+      }
+    })
+    return response.data
+  },
+
+  async exportGantt(
+    activityId: number,
+    format: GanttExportFormat,
+    params: GanttExportParams = {}
+  ): Promise<Blob> {
+    const response = await apiClient.get<Blob>(`/activities/${activityId}/gantt.${format}`, {
+      params,
+      responseType: 'blob'
+    })
+    return response.data
+  },
+
+  async exportActivity(
+    activityId: number,
+    format: SubTaskExportFormat,
+    params: Pick<SubTaskExportParams, 'from' | 'to'> = {}
+  ): Promise<Blob> {
+    const response = await apiClient.get<Blob>(`/activities/${activityId}/export.${format}`, {
+      params,
+      responseType: 'blob'
+    })
+    return response.data
+  },
+
+  async exportSubTasks(format: SubTaskExportFormat, params: SubTaskExportParams = {}): Promise<Blob> {
+    const response = await apiClient.get<Blob>(`/export/subtasks.${format}`, {
+      params: {
+        ...params,
+        activity_ids: params.activity_ids?.join(',')
+      },
+      responseType: 'blob'
+    })
+    return response.data
+  },
+
   // Topics
   async getTopics(activityId: number): Promise<{ topics: Topic[] }> {
     const response = await apiClient.get<{ topics: Topic[] }>(
@@ -79,6 +140,17 @@ export const activitiesApi = {
     return response.data
   },
 
+  // Subtasks of one assignee across activities; pass next_cursor as cursor for the next page
+  async getAssignedSubTasks(params: AssignedSubTasksParams = {}): Promise<AssignedSubTasksPage> {
+    const response = await apiClient.get<AssignedSubTasksPage>('/subtasks', {
+      params: {
+        ...params,
+        status: params.status?.join(',')
+      }
+    })
+    return response.data
+  },
+
   async createSubTask(topicId: number, data: CreateSubTaskDTO): Promise<{ subtask: SubTask }> {
     const response = await apiClient.post<{ subtask: SubTask }>(
       `/topics/${topicId}/subtasks`,
@@ -8,6 +8,11 @@ const apiClient = axios.create({
   }
 })
 
+// Read-your-writes: after a write the backend returns until when our reads
+// must come from the primary database; echo it back so any server honours it
+const READ_PRIMARY_HEADER = 'X-Read-Primary-Until'
+let readPrimaryUntil = 0
+
 // Request interceptor - add auth token
 apiClient.interceptors.request.use(
   (config) => {
@@ -15,6 +20,9 @@ apiClient.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`
     }
+    if (readPrimaryUntil > Date.now() / 1000) {
+      config.headers[READ_PRIMARY_HEADER] = String(readPrimaryUntil)
+    }
     return config
   },
   (error) => {
@@ -24,7 +32,13 @@ apiClient.interceptors.request.use(
 
 // Response interceptor - handle errors
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    const until = Number(response.headers[READ_PRIMARY_HEADER.toLowerCase()])
+    if (until > readPrimaryUntil) {
+      readPrimaryUntil = until
+    }
+    return response
+  },
   (error) => {
     if (error.response?.status === 401) {
       // Token expired or invalid
@@ -0,0 +1,37 @@
+// /frontend/src/services/calendarsApi.ts
+import apiClient from './apiClient'
+import type { CalendarDTO, WorkCalendar } from '@/types'
+
+export const calendarsApi = {
+  /**
+   * Get all working-day calendars with their holidays
+   */
+  async getCalendars(): Promise<{ calendars: WorkCalendar[] }> {
+    const response = await apiClient.get<{ calendars: WorkCalendar[] }>('/calendars')
+    return response.data
+  },
+
+  /**
+   * Create a calendar (Admin only)
+   */
+  async createCalendar(data: CalendarDTO): Promise<{ calendar: WorkCalendar }> {
+    const response = await apiClient.post<{ calendar: WorkCalendar }>('/calendars', data)
+    return response.data
+  },
+
+  /**
+   * Update a calendar (Admin only); holidays replaces the whole list
+   */
+  async updateCalendar(calendarId: number, data: CalendarDTO): Promise<{ calendar: WorkCalendar }> {
+    const response = await apiClient.put<{ calendar: WorkCalendar }>(`/calendars/${calendarId}`, data)
+    return response.data
+  },
+
+  /**
+   * Delete a calendar (Admin only); its activities fall back to Monday-Friday
+   */
+  async deleteCalendar(calendarId: number): Promise<{ message: string }> {
+    const response = await apiClient.delete<{ message: string }>(`/calendars/${calendarId}`)
+    return response.data
+  }
+}
@@ -0,0 +1,62 @@
+// /frontend/src/services/realtimeApi.ts
+/**
+ * Realtime API service - live Gantt change events over WebSocket
+ */
+import type { GanttChangeEvent } from '@/types'
+
+const RECONNECT_DELAY_MS = 3000
+
+function activityUpdatesUrl(activityId: number, token: string): string {
+  // The WebSockets may be served separately from the API (realtime service)
+  const base = import.meta.env.VITE_WS_BASE_URL || import.meta.env.VITE_API_BASE_URL || '/api'
+  const url = new URL(`${base}/ws/activities/${activityId}`, window.location.href)
+  url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:'
+  url.searchParams.set('token', token)
+  return url.toString()
+}
+
+export const realtimeApi = {
+  /**
+   * Subscribe to change events of an activity, reconnecting on drop
+   * @param onChange - Called for every change event
+   * @param onReconnect - Called after a reconnect (events may have been missed)
+   * @returns Function that closes the subscription
+   */
+  subscribeToActivity(
+    activityId: number,
+    onChange: (event: GanttChangeEvent) => void,
+    onReconnect?: () => void
+  ): () => void {
+    let socket: WebSocket | null = null
+    let closed = false
+    let connectedBefore = false
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null
+
+    const connect = () => {
+      const token = localStorage.getItem('token')
+      if (!token || closed) return
+
+      socket = new WebSocket(activityUpdatesUrl(activityId, token))
+      socket.onmessage = (message) => {
+        const event = JSON.parse(message.data)
+        if (event.type === 'subscribed') {
+          if (connectedBefore) onReconnect?.()
+          connectedBefore = true
+        } else if (event.type === 'change') {
+          onChange(event as GanttChangeEvent)
+        }
+      }
+      socket.onclose = () => {
+        if (!closed) reconnectTimer = setTimeout(connect, RECONNECT_DELAY_MS)
+      }
+    }
+
+    connect()
+
+    return () => {
+      closed = true
+      if (reconnectTimer) clearTimeout(reconnectTimer)
+      socket?.close()
+    }
+  }
+}
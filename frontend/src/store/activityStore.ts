@@ -69,6 +69,44 @@ export const useActivityStore = defineStore('activity', () => {
     }
   }
 
+  /**
+   * Incremental refresh: fetches only rows changed since the last cursor
+   * and merges them into ganttData. Falls back to a full load otherwise.
+   */
+  async function syncGanttData(activityId: number): Promise<GanttData | null> {
+    const current = ganttData.value
+    if (!current || current.activity.id !== activityId || current.cursor === undefined) {
+      return fetchGanttData(activityId)
+    }
+
+    error.value = null
+
+    try {
+      const delta = await activitiesApi.getGanttDelta(activityId, current.cursor)
+      const deletedTopics = new Set(delta.deleted.topics)
+      const deletedSubTasks = new Set(delta.deleted.subtasks)
+      const topics = new Map(current.topics.map(t => [t.id, t]))
+      const subtasks = new Map(current.subtasks.map(st => [st.id, st]))
+
+      delta.topics.forEach(t => topics.set(t.id, t))
+      delta.subtasks.forEach(st => subtasks.set(st.id, st))
+      deletedTopics.forEach(id => topics.delete(id))
+      deletedSubTasks.forEach(id => subtasks.delete(id))
+
+      current.activity = delta.activity
+      current.topics = [...topics.values()]
+      current.subtasks = [...subtasks.values()]
+        .filter(st => !deletedTopics.has(st.topic_id))
+        .sort((a, b) => a.start_date.localeCompare(b.start_date))
+      current.cursor = delta.cursor
+      current.today = delta.today
+      return current
+    } catch (err: any) {
+      error.value = err.response?.data?.error || 'Gantt verisi yüklenemedi'
+      return null
+    }
+  }
+
   async function createActivity(data: CreateActivityDTO): Promise<Activity | null> {
     loading.value = true
     error.value = null
@@ -287,6 +325,7 @@ export const useActivityStore = defineStore('activity', () => {
     fetchActivities,
     fetchActivity,
     fetchGanttData,
+    syncGanttData,
     createActivity,
     updateActivity,
     deleteActivity,
@@ -27,11 +27,25 @@ export interface Activity {
   start_date: string
   end_date: string
   owner_id: number
+  calendar_id: number | null
   owner?: User
+  stats?: ActivityStats
+  // Inclusive working days on the activity's calendar (Gantt responses)
+  working_days?: number
   created_at: string
   updated_at: string
 }
 
+// Server-side rollup aggregates returned by GET /api/activities
+export interface ActivityStats {
+  subtask_count: number
+  status_counts: Record<SubTaskStatus, number>
+  progress_percent: number
+  actual_start_date: string | null
+  actual_end_date: string | null
+  overdue_count: number
+}
+
 export interface Topic {
   id: number
   activity_id: number
@@ -53,18 +67,139 @@ export interface SubTask {
   assignee_id: number | null
   assignee?: User
   progress_percent: number
+  // Inclusive working days on the activity's calendar
+  working_days?: number
   created_at: string
   updated_at: string
 }
 
+// Server-generated timeline header model
+export interface GanttTimelineTick {
+  date: string
+  label: string
+  sub_label: string | null
+  week_number: number
+  offset: number
+  width: number
+}
+
+export interface GanttTimelineModel {
+  scale: GanttScale
+  locale: string
+  column_width: number
+  total_width: number
+  ticks: GanttTimelineTick[]
+  month_boundaries: { date: string; offset: number }[]
+}
+
+// Level-of-detail aggregates (lod=auto|binned), one row per topic
+export interface GanttBins {
+  buckets: string[]
+  topic_ids: number[]
+  active: number[][]
+  mean_progress: (number | null)[][]
+  overdue: number[][]
+}
+
 export interface GanttData {
   activity: Activity
   topics: Topic[]
   subtasks: SubTask[]
   scale: GanttScale
+  timeline?: GanttTimelineModel
+  lod?: 'full' | 'binned'
+  bins?: GanttBins
+  cursor?: number
+  today: string
+}
+
+// Delta sync response (GET /activities/:id/gantt?since=cursor)
+export interface GanttDelta {
+  delta: true
+  activity: Activity
+  topics: Topic[]
+  subtasks: SubTask[]
+  deleted: { topics: number[]; subtasks: number[] }
+  cursor: number
+  today: string
+}
+
+// Live change event (WS /api/ws/activities/:id)
+export interface GanttChangeEvent {
+  type: 'change'
+  activity_id: number
+  entity: 'topic' | 'subtask'
+  op: 'create' | 'update' | 'delete'
+  id: number
+  seq: number | null
+  data?: Topic | SubTask
+}
+
+// Portfolio Gantt (GET /api/gantt/portfolio)
+export interface PortfolioGanttItem {
+  activity: Activity
+  scale: GanttScale
+  stats: ActivityStats
+  topics?: Topic[]
+  subtasks?: SubTask[]
+}
+
+export interface PortfolioGanttData {
+  activities: PortfolioGanttItem[]
+  // More than 200 activities matched; narrow with owner_id or activity_ids
+  has_more: boolean
   today: string
 }
 
+export interface PortfolioGanttParams {
+  activity_ids?: number[]
+  owner_id?: number
+  from?: string
+  to?: string
+  summary_only?: boolean
+}
+
+// Printable chart (GET /api/activities/:id/gantt.svg | .pdf)
+export type GanttExportFormat = 'svg' | 'pdf'
+
+export interface GanttExportParams {
+  from?: string
+  to?: string
+  scale?: 'day' | 'week' | 'month'
+  locale?: 'tr' | 'en'
+}
+
+// Streaming exports (GET /api/activities/:id/export.<format>, /api/export/subtasks.<format>)
+export type SubTaskExportFormat = 'csv' | 'xlsx' | 'xml'
+
+export interface SubTaskExportParams {
+  activity_ids?: number[]
+  owner_id?: number
+  from?: string
+  to?: string
+}
+
+// Cross-activity subtask list (GET /api/subtasks)
+export interface AssignedSubTask extends SubTask {
+  topic_title: string
+  activity_id: number
+  activity_name: string
+}
+
+export interface AssignedSubTasksPage {
+  subtasks: AssignedSubTask[]
+  next_cursor: string | null
+}
+
+export interface AssignedSubTasksParams {
+  assignee_id?: number
+  status?: SubTaskStatus[]
+  from?: string
+  to?: string
+  limit?: number
+  cursor?: string
+}
+
 // API Response types
 export interface LoginResponse {
   token: string
@@ -81,6 +216,7 @@ export interface CreateActivityDTO {
   description?: string
   start_date: string
   end_date: string
+  calendar_id?: number | null
 }
 
 export interface UpdateActivityDTO {
@@ -88,6 +224,29 @@ export interface UpdateActivityDTO {
   description?: string | null
   start_date?: string
   end_date?: string
+  calendar_id?: number | null
+}
+
+// Working-day calendars
+export interface CalendarHoliday {
+  date: string
+  name: string | null
+}
+
+export interface WorkCalendar {
+  id: number
+  name: string
+  // Seven 0/1 flags, Monday first
+  weekmask: string
+  holidays: CalendarHoliday[]
+  created_at: string
+  updated_at: string
+}
+
+export interface CalendarDTO {
+  name?: string
+  weekmask?: string
+  holidays?: CalendarHoliday[]
 }
 
 export interface CreateTopicDTO {